@@ -0,0 +1,288 @@
+"""
+Async Task Management Business Logic
+
+This module contains the AsyncManager class, the asyncio counterpart of
+logic.Manager for the FastAPI app. It runs on AsyncSession and the async
+engine from database.py (asyncpg for PostgreSQL, aiosqlite for SQLite), so
+a request waiting on the database does not hold a thread pool slot.
+
+AsyncManager does not build its own queries: each method runs the matching
+logic.Manager flow, on a TaskStore, through AsyncSession.run_sync. The
+statements, change versions, validation and responses are therefore the
+ones the CLI (runner.py) uses; only execution differs. Export streams
+rows through AsyncSession.stream instead, as a sync cursor cannot be
+iterated across awaits.
+
+With a write queue (group_commit.AsyncGroupCommitQueue), task creation and
+status changes from concurrent requests are committed in shared batches.
+"""
+
+from model import OperationResponse
+from logic import Manager, SQLTaskStore, check_task_input, export_statement, ndjson_chunk, status_response
+from database import init_db_async
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+
+class AsyncManager:
+    """
+    Async task management service - mirrors logic.Manager.
+    
+    Every method has the same arguments and return values as its Manager
+    counterpart, but takes an AsyncSession and must be awaited (export_tasks
+    is an async generator). Listeners receive the same TaskEvents.
+    """
+
+    def __init__(self, write_queue=None, storage=None):
+        """
+        Initialize the AsyncManager. Tables are created by init().
+        
+        Args:
+            write_queue (Optional[AsyncGroupCommitQueue]): Queue for add_task
+                and status changes; None commits each call on its own session
+            storage (Optional[SQLTaskStore]): Store the Manager flows run on,
+                defaults to an SQLTaskStore following the session's dialect
+        """
+        self.manager = Manager(storage or SQLTaskStore())
+        self.listeners = self.manager.listeners
+        self.write_queue = write_queue
+
+    async def init(self):
+        """
+        Initialize the database for this manager.
+        
+        Creates tables and indexes if needed, once per process, and starts
+        the write queue. Called by the FastAPI lifespan at startup.
+        """
+        await init_db_async()
+        if self.write_queue is not None:
+            self.write_queue.start()
+
+    async def close(self):
+        """Flush and stop the write queue. Called by the FastAPI lifespan at shutdown."""
+        if self.write_queue is not None:
+            await self.write_queue.close()
+
+    def add_listener(self, listener):
+        """
+        Register a callable to be notified of every committed write.
+        
+        Listeners run synchronously on the event loop and must be cheap.
+        
+        Args:
+            listener (callable): Called with one TaskEvent per changed task
+        """
+        self.manager.add_listener(listener)
+
+    async def _run(self, session: AsyncSession, method, *args, **kwargs):
+        """Run a Manager method on the session's sync view and return its result."""
+        return await session.run_sync(lambda sync_session: method(*args, session=sync_session, **kwargs))
+
+    # ===== SEARCH METHODS =====
+    
+    async def search_by_id(self, task_id, session: AsyncSession):
+        """
+        Search for a task by its ID in database.
+        
+        Returns:
+            TaskDB: Task object if found, None otherwise
+        """
+        return await self._run(session, self.manager.search_by_id, task_id)
+
+    async def search_by_name(self, name, session: AsyncSession):
+        """
+        Search for tasks by name in database.
+        
+        Returns:
+            list: List of TaskDB objects matching the name
+        """
+        return await self._run(session, self.manager.search_by_name, name)
+
+    async def get_tasks_by_name(self, name, session: AsyncSession, limit=None, after=None, fields=None):
+        """
+        Retrieve tasks matching a name from database, one page at a time.
+        
+        Returns:
+            TaskListResponse: Matching tasks ordered by ID, with next_cursor if more remain
+        """
+        return await self._run(session, self.manager.get_tasks_by_name, name, limit=limit, after=after, fields=fields)
+
+    async def search(self, query, session: AsyncSession, limit=20, after=None, fields=None):
+        """
+        Full-text search over task name and content, best matches first.
+        
+        Returns:
+            TaskListResponse: Matching tasks ordered by rank, with next_cursor if more remain
+        """
+        return await self._run(session, self.manager.search, query, limit=limit, after=after, fields=fields)
+
+    # ===== CRUD METHODS =====
+    
+    async def add_task(self, name, content, session: AsyncSession, validated=False):
+        """
+        Create and add a new task to database.
+        
+        Returns:
+            OperationResponse: Created task, or success=False if validation fails
+        """
+        if self.write_queue is None:
+            return await self._run(session, self.manager.add_task, name, content, validated=validated)
+        
+        if not validated:
+            error = check_task_input(name, content)
+            if error:
+                return OperationResponse(success=False, message=error)
+        return self.manager._task_added(await self.write_queue.insert(name, content))
+
+    async def add_tasks(self, items, session: AsyncSession):
+        """
+        Create and add many tasks to database in a single transaction.
+        
+        Returns:
+            BulkOperationResponse: One OperationResponse per item, in input order
+        """
+        return await self._run(session, self.manager.add_tasks, items)
+
+    async def get_all_tasks(self, session: AsyncSession, limit=None, after=None, fields=None):
+        """
+        Retrieve all tasks from database, one page at a time.
+        
+        Returns:
+            TaskListResponse: Tasks ordered by ID, with next_cursor if more remain
+        """
+        return await self._run(session, self.manager.get_all_tasks, limit=limit, after=after, fields=fields)
+
+    async def update_task(self, task_id, new_name=None, new_content=None, session: AsyncSession = None, validated=False):
+        """
+        Update an existing task's name and/or content in database.
+        
+        Returns:
+            OperationResponse: Updated task, or success=False if not found or validation fails
+        """
+        return await self._run(session, self.manager.update_task, task_id, new_name, new_content, validated=validated)
+
+    async def _change_status(self, task_id, from_status, to_status, session: AsyncSession):
+        """
+        Move a task from one status to another, through the write queue if there is one.
+        
+        Returns:
+            OperationResponse: mark_completed / mark_todo response
+        """
+        if self.write_queue is None:
+            changed = await self._run(session, self.manager._change_status, task_id, from_status, to_status)
+        else:
+            row, found = await self.write_queue.set_status(task_id, from_status, to_status)
+            changed = self.manager._status_changed(row, found, from_status)
+        return status_response(*changed, to_status)
+
+    async def mark_completed(self, task_id, session: AsyncSession):
+        """
+        Mark a task as completed in database.
+        
+        Returns:
+            OperationResponse: Updated task, or success=False if not found or already completed
+        """
+        return await self._change_status(task_id, "Todo", "Completed", session)
+
+    async def mark_todo(self, task_id, session: AsyncSession):
+        """
+        Mark a task as to-do in database.
+        
+        Returns:
+            OperationResponse: Updated task, or success=False if not found or already to-do
+        """
+        return await self._change_status(task_id, "Completed", "Todo", session)
+
+    async def delete_task(self, task_id, session: AsyncSession):
+        """
+        Delete a task by ID from database.
+        
+        Returns:
+            OperationResponse: success=False if the task was not found
+        """
+        return await self._run(session, self.manager.delete_task, task_id)
+
+    async def get_stats(self, session: AsyncSession):
+        """
+        Count tasks by status with one aggregate query.
+        
+        Returns:
+            TaskStatsResponse: Total, to-do and completed counts
+        """
+        return await self._run(session, self.manager.get_stats)
+
+    async def count_tasks(self, session: AsyncSession, status=None, name=None):
+        """
+        Count the tasks a list method would return across all pages.
+        
+        Returns:
+            int: Number of matching tasks
+        """
+        return await self._run(session, self.manager.count_tasks, status=status, name=name)
+
+    async def change_version(self, session: AsyncSession):
+        """
+        Get the current change version: that of the last committed write.
+        
+        Returns:
+            int: Last committed change version
+        """
+        return await self._run(session, self.manager.change_version)
+
+    async def mark_many(self, selection, status, session: AsyncSession):
+        """
+        Move many tasks to a status with one UPDATE statement.
+        
+        Returns:
+            BulkChangeResponse: Changed task IDs; requested IDs that were not
+                found or already had the status are listed as skipped
+        """
+        return await self._run(session, self.manager.mark_many, selection, status)
+
+    async def delete_many(self, selection, session: AsyncSession):
+        """
+        Delete many tasks with one DELETE statement.
+        
+        Returns:
+            BulkChangeResponse: Deleted task IDs; requested IDs that were not
+                found are listed as skipped
+        """
+        return await self._run(session, self.manager.delete_many, selection)
+
+    async def get_completed_tasks(self, session: AsyncSession, limit=None, after=None, fields=None):
+        """
+        Retrieve all completed tasks from database, one page at a time.
+        
+        Returns:
+            TaskListResponse: Tasks with status "Completed" ordered by ID, with next_cursor if more remain
+        """
+        return await self._run(session, self.manager.get_completed_tasks, limit=limit, after=after, fields=fields)
+
+    async def get_todo_tasks(self, session: AsyncSession, limit=None, after=None, fields=None):
+        """
+        Retrieve all to-do tasks from database, one page at a time.
+        
+        Returns:
+            TaskListResponse: Tasks with status "Todo" ordered by ID, with next_cursor if more remain
+        """
+        return await self._run(session, self.manager.get_todo_tasks, limit=limit, after=after, fields=fields)
+
+    async def export_tasks(self, session: AsyncSession, status=None, chunk_size=1000):
+        """
+        Stream tasks from database as newline-delimited JSON.
+        
+        Yields:
+            bytes: One chunk of NDJSON lines, one task per line
+        """
+        result = await session.stream(export_statement(status, chunk_size))
+        async for rows in result.partitions():
+            yield ndjson_chunk(rows)
+
+    async def sync(self, session: AsyncSession, since=None, limit=1000):
+        """
+        Get the tasks changed and deleted since a change version (see Manager.sync).
+        
+        Returns:
+            SyncResponse: Changes after since, the version to continue from,
+                and whether more changes follow
+        """
+        return await self._run(session, self.manager.sync, since=since, limit=limit)
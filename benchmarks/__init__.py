@@ -0,0 +1,14 @@
+"""
+Performance benchmarks for the Task Manager.
+
+Run each benchmark from the repository root as a module, e.g.:
+    python -m benchmarks.bench_indexes
+    
+- bench_suite: every Manager method and API route, with baseline comparison
+- bench_indexes: list and lookup queries before and after indexing
+- bench_serialization: per-task cost of list responses
+- bench_validation: per-request cost of checking task input
+- bench_startup: time to the first CLI menu and the first API response
+- bench_group_commit: concurrent task creation with and without group commit
+- bench_version_contention: concurrent write transactions with and without the change version counter
+"""
@@ -0,0 +1,162 @@
+"""
+Group Commit Benchmark
+
+Measures task creation throughput under concurrent load, with and without
+the group commit write queue (group_commit.py):
+- async: concurrent coroutines calling AsyncManager.add_task, each on its
+  own AsyncSession, as API requests do
+- threads: concurrent threads calling Manager.add_task, on an SQLTaskStore
+  (one commit per call) and on a GroupCommitStore
+
+Reports creates/s and, for the coalesced runs, the average number of
+writes per committed transaction.
+
+The database is the configured one (TASKMANAGER_DATABASE_URL), or a SQLite
+file with --path. Use a scratch database: the benchmark creates tasks
+named "bench-group-commit" and deletes them afterwards.
+
+Usage:
+    python -m benchmarks.bench_group_commit [--concurrency 50] [--creates 2000]
+        [--max-batch 100] [--max-delay-ms 2] [--path bench_group_commit.db]
+"""
+
+import argparse
+import asyncio
+import os
+import threading
+import time
+
+NAME = "bench-group-commit"
+CONTENT = "Created by the group commit benchmark"
+
+
+async def run_async(manager, concurrency, creates):
+    """
+    Create tasks from concurrent coroutines.
+
+    Returns:
+        float: Creates per second
+    """
+    from database import get_async_session_context
+
+    per_worker = creates // concurrency
+
+    async def worker():
+        for _ in range(per_worker):
+            async with get_async_session_context() as session:
+                response = await manager.add_task(NAME, CONTENT, session, validated=True)
+            if not response.success:
+                raise RuntimeError(response.message)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return per_worker * concurrency / (time.perf_counter() - start)
+
+
+def run_threads(manager, concurrency, creates):
+    """
+    Create tasks from concurrent threads.
+
+    Returns:
+        float: Creates per second
+    """
+    from database import get_session_context
+
+    per_worker = creates // concurrency
+    errors = []
+
+    def worker():
+        try:
+            for _ in range(per_worker):
+                with get_session_context() as session:
+                    manager.add_task(NAME, CONTENT, session, validated=True)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return per_worker * concurrency / elapsed
+
+
+def cleanup():
+    """Delete the tasks created by the benchmark."""
+    from database import get_session_context
+    from logic import Manager
+    from model import TaskFilter
+
+    with get_session_context() as session:
+        Manager().delete_many(TaskFilter(name=NAME), session)
+
+
+def report(name, creates_per_sec, write_queue=None):
+    batch = f"{write_queue.writes / write_queue.batches:>14.1f}" if write_queue and write_queue.batches else f"{'-':>14}"
+    print(f"{name:<28}{creates_per_sec:>12.0f}{batch}")
+
+
+async def async_cases(args):
+    from async_logic import AsyncManager
+    from database import get_async_engine
+    from group_commit import AsyncGroupCommitQueue
+
+    manager = AsyncManager()
+    await manager.init()
+    report("async: commit per call", await run_async(manager, args.concurrency, args.creates))
+
+    write_queue = AsyncGroupCommitQueue(max_batch=args.max_batch, max_delay_ms=args.max_delay_ms,
+                                        max_pending=args.concurrency * 2)
+    manager = AsyncManager(write_queue)
+    await manager.init()
+    report("async: group commit", await run_async(manager, args.concurrency, args.creates), write_queue)
+    await manager.close()
+    await get_async_engine().dispose()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare task creation with and without group commit")
+    parser.add_argument("--concurrency", type=int, default=50, help="Concurrent callers")
+    parser.add_argument("--creates", type=int, default=2000, help="Tasks created per run")
+    parser.add_argument("--max-batch", type=int, default=100, help="Write queue max_batch")
+    parser.add_argument("--max-delay-ms", type=float, default=2.0, help="Write queue max_delay_ms")
+    parser.add_argument("--path", help="SQLite database file to use (recreated) instead of the configured database")
+    args = parser.parse_args()
+    if args.creates < args.concurrency:
+        parser.error("--creates must be at least --concurrency")
+
+    if args.path:
+        if os.path.exists(args.path):
+            os.remove(args.path)
+        os.environ["TASKMANAGER_DATABASE_URL"] = f"sqlite:///{os.path.abspath(args.path)}"
+        # Enough connections for every caller, so the pool is not what is measured
+        os.environ["TASKMANAGER_DATABASE_POOL_SIZE"] = str(args.concurrency)
+
+    from database import init_db
+    from group_commit import GroupCommitQueue, GroupCommitStore
+    from logic import Manager
+
+    init_db()
+    print(f"{args.creates} creates from {args.concurrency} concurrent callers\n")
+    print(f"{'mode':<28}{'creates/s':>12}{'writes/commit':>14}")
+    try:
+        asyncio.run(async_cases(args))
+        report("threads: commit per call", run_threads(Manager(), args.concurrency, args.creates))
+        write_queue = GroupCommitQueue(max_batch=args.max_batch, max_delay_ms=args.max_delay_ms,
+                                       max_pending=args.concurrency * 2)
+        manager = Manager(GroupCommitStore(write_queue))
+        report("threads: group commit", run_threads(manager, args.concurrency, args.creates), write_queue)
+        write_queue.close()
+    finally:
+        cleanup()
+
+    if args.path:
+        os.remove(args.path)
+
+
+if __name__ == "__main__":
+    main()
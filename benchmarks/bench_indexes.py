@@ -0,0 +1,135 @@
+"""
+Index Benchmark
+
+Seeds a SQLite database with TaskDB rows but without the declared indexes
+(like a deployment created before they existed), times the hot queries,
+then runs create_db_and_tables() to add the missing indexes and times the
+same queries again.
+
+Usage:
+    python -m benchmarks.bench_indexes [--rows 1000000] [--path bench_indexes.db]
+"""
+
+import argparse
+import os
+import random
+import time
+
+from sqlalchemy import func, insert, text
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from database import TaskDB, create_db_and_tables
+from logic import STATUS_FILTERS, stats_statement
+
+
+def seed(engine, rows, chunk_size=50_000):
+    """
+    Create the task table without secondary indexes and fill it.
+
+    About 5% of the tasks are "Todo" so status filters are selective.
+
+    Args:
+        engine (Engine): Target engine
+        rows (int): Number of tasks to insert
+        chunk_size (int): Rows per executemany batch
+    """
+    SQLModel.metadata.create_all(engine)
+    for index in TaskDB.__table__.indexes:
+        index.drop(engine)
+
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        for start in range(0, rows, chunk_size):
+            batch = [
+                {
+                    "name": f"task-{i}",
+                    "content": f"Description for task {i}",
+                    "status": "Todo" if rng.random() < 0.05 else "Completed",
+                }
+                for i in range(start, min(start + chunk_size, rows))
+            ]
+            conn.execute(insert(TaskDB.__table__), batch)
+
+
+def queries(rows):
+    """
+    Build the queries issued by the Manager list and search methods.
+
+    Args:
+        rows (int): Number of seeded rows, used to pick lookup targets
+
+    Returns:
+        list: (label, statement) pairs
+    """
+    return [
+        ("search_by_name", select(TaskDB).where(TaskDB.name == f"task-{rows // 2}")),
+        ("todo page (limit 100)", select(TaskDB).where(STATUS_FILTERS["todo"]).order_by(TaskDB.id).limit(101)),
+        ("todo page (deep cursor)",
+         select(TaskDB).where(STATUS_FILTERS["todo"], TaskDB.id > rows * 9 // 10).order_by(TaskDB.id).limit(101)),
+        ("count todo", select(func.count()).select_from(TaskDB).where(STATUS_FILTERS["todo"])),
+        ("stats (group by status)", stats_statement()),
+    ]
+
+
+def time_queries(engine, rows, repeat):
+    """
+    Run each query several times and keep the best wall-clock time.
+
+    Args:
+        engine (Engine): Engine to query
+        rows (int): Number of seeded rows
+        repeat (int): Runs per query
+
+    Returns:
+        dict: Query label -> best time in milliseconds
+    """
+    timings = {}
+    with Session(engine) as session:
+        for label, statement in queries(rows):
+            best = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                session.exec(statement).all()
+                best = min(best, time.perf_counter() - start)
+                session.expunge_all()
+            timings[label] = best * 1000
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark TaskDB queries before and after indexing")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Number of tasks to seed")
+    parser.add_argument("--path", default="bench_indexes.db", help="SQLite database file (recreated)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query")
+    args = parser.parse_args()
+
+    if os.path.exists(args.path):
+        os.remove(args.path)
+    engine = create_engine(f"sqlite:///{args.path}")
+
+    start = time.perf_counter()
+    seed(engine, args.rows)
+    print(f"Seeded {args.rows} rows in {time.perf_counter() - start:.1f}s")
+
+    before = time_queries(engine, args.rows, args.repeat)
+
+    start = time.perf_counter()
+    create_db_and_tables(engine)
+    print(f"create_db_and_tables() added indexes in {time.perf_counter() - start:.1f}s")
+    with engine.connect() as conn:
+        count = conn.execute(text("SELECT COUNT(*) FROM taskdb")).scalar()
+    print(f"Rows after bootstrap: {count}\n")
+
+    after = time_queries(engine, args.rows, args.repeat)
+
+    print(f"{'query':<26}{'scan (ms)':>12}{'index (ms)':>12}{'speedup':>10}")
+    for label in before:
+        speedup = before[label] / after[label] if after[label] else float("inf")
+        print(f"{label:<26}{before[label]:>12.3f}{after[label]:>12.3f}{speedup:>9.1f}x")
+
+    engine.dispose()
+    os.remove(args.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+"""
+Serialization Benchmark
+
+Measures the per-task cost of answering a list request, from query
+results to JSON bytes, before and after the fast response path:
+- before: TaskDB entities are loaded, each is converted to a TaskSchema
+  through its ORM attributes, and the TaskListResponse is returned as a
+  model for FastAPI to check against response_model and encode
+- after: plain columns are loaded (logic.page_statement), TaskSchemas are
+  built once from the row tuples (logic.page_result) and the response is
+  serialized straight to JSON bytes (main.json_response)
+
+Each stage is timed separately on an in-memory SQLite database; the
+response stage runs a real FastAPI route called in-process over ASGI.
+
+Usage:
+    python -m benchmarks.bench_serialization [--rows 10000] [--repeat 10]
+"""
+
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from benchmarks.common import asgi_request
+from database import TaskDB
+from logic import page_result, page_statement, task_to_schema
+from main import json_response
+from model import TaskListResponse
+
+
+def seed(engine, rows):
+    """
+    Create the task table and fill it.
+
+    Args:
+        engine (Engine): Target engine
+        rows (int): Number of tasks to insert
+    """
+    SQLModel.metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(insert(TaskDB.__table__), [
+            {"name": f"task-{i}", "content": f"Description for task {i}", "status": "Todo" if i % 2 else "Completed"}
+            for i in range(rows)
+        ])
+
+
+def build_app():
+    """
+    Build an app exposing the old and new ways of returning a response.
+
+    The response to send is stored on app.state.response by the caller.
+
+    Returns:
+        FastAPI: App with GET /before and GET /after
+    """
+    app = FastAPI()
+
+    @app.get("/before", response_model=TaskListResponse)
+    async def before():
+        return app.state.response
+
+    @app.get("/after", response_model=TaskListResponse)
+    async def after():
+        return json_response(app.state.response)
+
+    return app
+
+
+def best_of(repeat, func):
+    """
+    Run func several times and keep the best wall-clock time.
+
+    Returns:
+        tuple: (best time in seconds, result of the last run)
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def measure(session, app, loop, rows, repeat):
+    """
+    Time the query, build and response stages of both paths.
+
+    Returns:
+        dict: Path -> {stage: best time in seconds}
+    """
+    timings = {}
+
+    def load_entities():
+        tasks = session.exec(select(TaskDB).order_by(TaskDB.id).limit(rows)).all()
+        session.expunge_all()
+        return tasks
+
+    query, tasks = best_of(repeat, load_entities)
+    build, response = best_of(repeat, lambda: TaskListResponse(
+        success=True, message="Tasks retrieved", data=[task_to_schema(t) for t in tasks]))
+    app.state.response = response
+    respond, _ = best_of(repeat, lambda: loop.run_until_complete(asgi_request(app, "GET", "/before")))
+    timings["before"] = {"query": query, "build": build, "respond": respond}
+
+    query, tasks = best_of(repeat, lambda: session.exec(page_statement(limit=rows)).all())
+    build, response = best_of(repeat, lambda: TaskListResponse(
+        success=True, message="Tasks retrieved", data=page_result(tasks, rows)[0]))
+    app.state.response = response
+    respond, _ = best_of(repeat, lambda: loop.run_until_complete(asgi_request(app, "GET", "/after")))
+    timings["after"] = {"query": query, "build": build, "respond": respond}
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark list response serialization")
+    parser.add_argument("--rows", type=int, default=10_000, help="Tasks per response")
+    parser.add_argument("--repeat", type=int, default=10, help="Runs per stage")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    seed(engine, args.rows)
+    loop = asyncio.new_event_loop()
+    with Session(engine) as session:
+        timings = measure(session, build_app(), loop, args.rows, args.repeat)
+    loop.close()
+
+    print(f"Per-task cost for a {args.rows}-row response (microseconds)\n")
+    print(f"{'path':<10}{'query':>10}{'build':>10}{'respond':>10}{'total':>10}")
+    for path, stages in timings.items():
+        per_task = {stage: seconds * 1e6 / args.rows for stage, seconds in stages.items()}
+        print(f"{path:<10}{per_task['query']:>10.2f}{per_task['build']:>10.2f}"
+              f"{per_task['respond']:>10.2f}{sum(per_task.values()):>10.2f}")
+    before, after = (sum(timings[path].values()) for path in ("before", "after"))
+    print(f"\nspeedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
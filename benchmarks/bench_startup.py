@@ -0,0 +1,170 @@
+"""
+Startup Benchmark
+
+Measures how long a fresh process takes to become useful:
+- CLI: from launching runner.py to the first menu prompt, and to the
+  menu prompt after the first operation (view to-do tasks), which is when
+  the database layer is loaded, the engine created and the schema checked
+- API: from launching a process to the answer of its first request
+  (GET /tasks/), split into importing main, running the app's lifespan
+  startup and handling the request in-process over ASGI
+
+Every measurement starts a new Python process on a SQLite database file.
+One untimed run first creates the schema and warms the bytecode and OS
+caches; the reported numbers are the median and minimum of the timed runs.
+
+Usage:
+    python -m benchmarks.bench_startup [--runs 10] [--path bench_startup.db]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from benchmarks.common import asgi_lifespan, asgi_request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MENU_PROMPT = b"Enter your choice: "
+
+
+def read_until(stream, marker, timeout=60):
+    """
+    Read a child's output until a marker appears.
+
+    Args:
+        stream: Unbuffered binary pipe
+        marker (bytes): Text to wait for
+        timeout (float): Seconds before giving up
+
+    Returns:
+        bytes: Output read, ending with the marker
+
+    Raises:
+        RuntimeError: If the stream closes or the timeout passes first
+    """
+    output = b""
+    deadline = time.monotonic() + timeout
+    while not output.endswith(marker):
+        if time.monotonic() > deadline:
+            raise RuntimeError(f"Timed out waiting for {marker!r}, got: {output[-200:]!r}")
+        chunk = os.read(stream.fileno(), 4096)
+        if not chunk:
+            raise RuntimeError(f"Process exited before {marker!r}, got: {output[-200:]!r}")
+        output += chunk
+    return output
+
+
+def time_interpreter(env):
+    """Time starting and stopping a bare interpreter, for reference."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", "pass"], env=env, check=True)
+    return time.perf_counter() - start
+
+
+def time_cli(env):
+    """
+    Start runner.py, view the to-do tasks once and exit.
+
+    Returns:
+        tuple: (seconds to the first menu, seconds to the menu after the first operation)
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-u", "runner.py"], cwd=ROOT, env=env,
+                               stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+    try:
+        read_until(process.stdout, MENU_PROMPT)
+        first_menu = time.perf_counter() - start
+        process.stdin.write(b"6\n")
+        process.stdin.flush()
+        read_until(process.stdout, MENU_PROMPT)
+        first_operation = time.perf_counter() - start
+        process.stdin.write(b"0\n")
+        process.stdin.flush()
+        process.wait(timeout=60)
+    finally:
+        if process.poll() is None:
+            process.kill()
+    return first_menu, first_operation
+
+
+def time_api(env):
+    """
+    Start a process that imports main.app and sends it one request.
+
+    Returns:
+        dict: Seconds from launch to the end of import, startup and first request
+    """
+    start = time.time()
+    result = subprocess.run([sys.executable, "-m", "benchmarks.bench_startup", "--child"], cwd=ROOT, env=env,
+                            check=True, capture_output=True)
+    marks = json.loads(result.stdout.decode().strip().splitlines()[-1])
+    return {name: mark - start for name, mark in marks.items()}
+
+
+async def first_request():
+    """
+    Child side of time_api: import the app, start it and answer one request.
+
+    Prints the wall-clock time (time.time()) after each step as JSON.
+    """
+    marks = {}
+    from main import app
+    marks["import"] = time.time()
+    async with asgi_lifespan(app):
+        marks["startup"] = time.time()
+        status, _, body = await asgi_request(app, "GET", "/tasks/", {"limit": 1})
+        marks["first_request"] = time.time()
+    if status != 200:
+        raise RuntimeError(f"GET /tasks/ returned {status}: {body[:200]!r}")
+    print(json.dumps(marks))
+
+
+def summarize(name, samples):
+    print(f"{name:<36}{statistics.median(samples) * 1000:>12.1f}{min(samples) * 1000:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure CLI and API startup time")
+    parser.add_argument("--runs", type=int, default=10, help="Timed runs per measurement")
+    parser.add_argument("--path", default="bench_startup.db", help="SQLite database file (recreated)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        asyncio.run(first_request())
+        return
+
+    path = os.path.abspath(args.path)
+    if os.path.exists(path):
+        os.remove(path)
+    env = dict(os.environ, TASKMANAGER_DATABASE_URL=f"sqlite:///{path}", PYTHONPATH=ROOT)
+
+    # Untimed: creates the schema and compiles bytecode
+    time_cli(env)
+    time_api(env)
+
+    samples = {"interpreter": [], "cli: first menu": [], "cli: first operation": [],
+               "api: import main": [], "api: lifespan startup": [], "api: first request": []}
+    for _ in range(args.runs):
+        samples["interpreter"].append(time_interpreter(env))
+        first_menu, first_operation = time_cli(env)
+        samples["cli: first menu"].append(first_menu)
+        samples["cli: first operation"].append(first_operation)
+        api = time_api(env)
+        samples["api: import main"].append(api["import"])
+        samples["api: lifespan startup"].append(api["startup"])
+        samples["api: first request"].append(api["first_request"])
+
+    print(f"{'time from process launch to':<36}{'median ms':>12}{'min ms':>12}")
+    for name, values in samples.items():
+        summarize(name, values)
+
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,498 @@
+"""
+Benchmark Suite
+
+Seeds a SQLite database with TaskDB rows, then times every Manager method
+and every route of main.app (called in-process over ASGI, see
+benchmarks.common). Each operation is timed individually and reported as
+ops/s and p50/p95/p99 latency.
+
+Results are saved as JSON. Given a baseline (a results file from an earlier
+run), the suite exits with status 1 if any operation's p50 latency grew by
+more than the threshold.
+
+Usage:
+    python -m benchmarks.bench_suite [--rows 20000] [--iterations 200]
+        [--output bench_results.json] [--baseline baseline.json] [--threshold 0.25]
+        [--only manager|api] [--cache] [--store sql|memory]
+
+With --store memory the Manager half runs on storage.MemoryTaskStore,
+seeded with the same rows, instead of the SQLite database (the API half
+always uses the database).
+
+Save a baseline with --output on a known-good revision, then pass it as
+--baseline on later runs (on the same machine, with the same arguments).
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import platform
+import sqlite3
+import sys
+import time
+from contextlib import nullcontext
+from datetime import datetime, timezone
+
+from benchmarks.common import asgi_lifespan, asgi_request, latency_stats
+
+# Words mixed into task descriptions so full-text search has matches
+WORDS = ["report", "invoice", "meeting", "groceries", "deploy", "review", "backup", "training"]
+
+WARMUP = 5
+BATCH_SIZE = 100
+BULK_CHANGE_SIZE = 50
+PAGE_SIZE = 100
+
+
+def seed_rows(start, end):
+    """
+    Build the seed rows with indexes start to end - 1.
+
+    Odd rows are "Todo", even rows "Completed". Names repeat every 1000
+    rows, so name lookups return rows // 1000 tasks.
+
+    Returns:
+        list: {"name", "content", "status"} dicts
+    """
+    return [
+        {
+            "name": f"task-{i % 1000}",
+            "content": f"Description for task {i}: {WORDS[i % len(WORDS)]}",
+            "status": "Todo" if i % 2 else "Completed",
+        }
+        for i in range(start, end)
+    ]
+
+
+def seed(engine, rows, chunk_size=50_000):
+    """
+    Create the schema and fill the task table with seed_rows.
+
+    Args:
+        engine (Engine): Target engine
+        rows (int): Number of tasks to insert
+        chunk_size (int): Rows per executemany batch
+    """
+    from sqlalchemy import insert
+    from database import TaskDB, create_db_and_tables
+
+    create_db_and_tables(engine)
+    with engine.begin() as conn:
+        for start in range(0, rows, chunk_size):
+            conn.execute(insert(TaskDB.__table__), seed_rows(start, min(start + chunk_size, rows)))
+
+
+def time_sync(operation, iterations):
+    """
+    Run a synchronous operation repeatedly, timing each call.
+
+    Args:
+        operation (callable): Called with no arguments
+        iterations (int): Timed calls, after WARMUP untimed ones
+
+    Returns:
+        list: Seconds per timed call
+    """
+    for _ in range(WARMUP):
+        operation()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        operation()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def time_async(operation, iterations):
+    """
+    Await an async operation repeatedly, timing each call.
+
+    Args:
+        operation (callable): Returns an awaitable when called
+        iterations (int): Timed calls, after WARMUP untimed ones
+
+    Returns:
+        list: Seconds per timed call
+    """
+    for _ in range(WARMUP):
+        await operation()
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        await operation()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def manager_cases(manager, engine, rows):
+    """
+    Build one operation per Manager method.
+
+    Cases run in order: reads first, then writes. Writes are paired so the
+    data set stays comparable (mark_completed then mark_todo on the same
+    tasks; deletes only remove tasks created by the add cases).
+
+    Args:
+        manager (Manager): Manager under test
+        engine (Optional[Engine]): Engine the manager's database uses,
+            None for a manager on the in-memory store (no sessions)
+        rows (int): Number of seeded rows
+
+    Returns:
+        list: (name, operation) pairs
+    """
+    from sqlmodel import Session
+    from logic import encode_cursor
+    from model import TaskCreate, TaskFilter
+
+    def open_session():
+        return Session(engine) if engine is not None else nullcontext()
+
+    def with_session(method, *args, **kwargs):
+        def operation():
+            with open_session() as session:
+                return method(*args, session=session, **kwargs)
+        return operation
+
+    ids = itertools.cycle(range(1, rows + 1, 7))
+    todo_ids = [i + 1 for i in range(1, rows, 2)]
+    completing, reopening = iter(todo_ids), iter(todo_ids)
+    created = []
+    batch_number = itertools.count()
+
+    def add_task():
+        with open_session() as session:
+            created.append(manager.add_task("bench", "Created by the benchmark", session).data.id)
+
+    def add_tasks():
+        n = next(batch_number)
+        items = [TaskCreate(name=f"bench-{n}", content="Created by the benchmark") for _ in range(BATCH_SIZE)]
+        with open_session() as session:
+            created.extend(result.data.id for result in manager.add_tasks(items, session).results)
+
+    def update_task():
+        task_id = next(ids)
+        with open_session() as session:
+            manager.update_task(task_id, f"renamed-{task_id}", None, session)
+
+    def change_status(method, pool):
+        def operation():
+            with open_session() as session:
+                method(next(pool), session)
+        return operation
+
+    bulk_chunks = itertools.cycle([todo_ids[i:i + BULK_CHANGE_SIZE] for i in range(0, len(todo_ids), BULK_CHANGE_SIZE)])
+    bulk_targets = itertools.cycle(["completed", "todo"])
+    bulk_ids = []
+
+    def mark_many():
+        # Alternate directions on the same chunk so each call changes every task
+        status = next(bulk_targets)
+        if status == "completed":
+            bulk_ids[:] = next(bulk_chunks)
+        with open_session() as session:
+            manager.mark_many(bulk_ids, status, session)
+
+    def delete_task():
+        with open_session() as session:
+            manager.delete_task(created.pop(), session)
+
+    def delete_many():
+        chunk = [created.pop() for _ in range(BULK_CHANGE_SIZE)]
+        with open_session() as session:
+            manager.delete_many(chunk, session)
+
+    def export_tasks():
+        with open_session() as session:
+            for _ in manager.export_tasks(session, "todo"):
+                pass
+
+    def search_by_id():
+        with open_session() as session:
+            manager.search_by_id(next(ids), session)
+
+    return [
+        ("search_by_id", search_by_id),
+        ("search_by_name", with_session(manager.search_by_name, "task-7")),
+        ("get_all_tasks", with_session(manager.get_all_tasks, limit=PAGE_SIZE)),
+        ("get_all_tasks (name, status)", with_session(manager.get_all_tasks, limit=PAGE_SIZE, fields=["name", "status"])),
+        ("get_all_tasks (deep cursor)",
+         with_session(manager.get_all_tasks, limit=PAGE_SIZE, after=encode_cursor(rows * 9 // 10))),
+        ("get_todo_tasks", with_session(manager.get_todo_tasks, limit=PAGE_SIZE)),
+        ("get_completed_tasks", with_session(manager.get_completed_tasks, limit=PAGE_SIZE)),
+        ("get_tasks_by_name", with_session(manager.get_tasks_by_name, "task-7", limit=PAGE_SIZE)),
+        ("search", with_session(manager.search, "report", limit=20)),
+        ("get_stats", with_session(manager.get_stats)),
+        ("count_tasks", with_session(manager.count_tasks, status="todo")),
+        ("export_tasks (todo)", export_tasks),
+        ("add_task", add_task),
+        (f"add_tasks ({BATCH_SIZE})", add_tasks),
+        ("update_task", update_task),
+        ("mark_completed", change_status(manager.mark_completed, completing)),
+        ("mark_todo", change_status(manager.mark_todo, reopening)),
+        (f"mark_many ({BULK_CHANGE_SIZE})", mark_many),
+        ("delete_task", delete_task),
+        (f"delete_many ({BULK_CHANGE_SIZE})", delete_many),
+        ("delete_many (filter, no match)", with_session(manager.delete_many, TaskFilter(name="no such task"))),
+    ]
+
+
+def api_cases(app, rows):
+    """
+    Build one operation per route of the FastAPI app.
+
+    Args:
+        app (FastAPI): Application under test
+        rows (int): Number of seeded rows
+
+    Returns:
+        list: (name, (method, route path), operation) triples
+    """
+    ids = itertools.cycle(range(3, rows + 1, 7))
+    todo_ids = [i + 1 for i in range(1, rows, 2)][::-1]
+    completing, reopening = iter(todo_ids), iter(todo_ids)
+    created = []
+    batch_number = itertools.count()
+    etag = {}
+
+    async def request(method, path, expect=200, **kwargs):
+        status, headers, body = await asgi_request(app, method, path, **kwargs)
+        if status != expect:
+            raise RuntimeError(f"{method} {path} returned {status}: {body[:200]!r}")
+        return headers, body
+
+    def get(path, **kwargs):
+        return lambda: request("GET", path, **kwargs)
+
+    async def create_task():
+        _, body = await request("POST", "/tasks/", params={"name": "bench", "content": "Created by the benchmark"})
+        created.append(json.loads(body)["data"]["id"])
+
+    async def create_tasks():
+        n = next(batch_number)
+        items = [{"name": f"bench-{n}", "content": "Created by the benchmark"} for _ in range(BATCH_SIZE)]
+        _, body = await request("POST", "/tasks/bulk", json_body=items)
+        created.extend(result["data"]["id"] for result in json.loads(body)["results"])
+
+    bulk_chunks = itertools.cycle([todo_ids[i:i + BULK_CHANGE_SIZE] for i in range(0, len(todo_ids), BULK_CHANGE_SIZE)])
+    bulk_targets = itertools.cycle(["completed", "todo"])
+    bulk_ids = []
+
+    async def mark_tasks():
+        status = next(bulk_targets)
+        if status == "completed":
+            bulk_ids[:] = next(bulk_chunks)
+        await request("PATCH", "/tasks/bulk/status", json_body={"ids": bulk_ids, "status": status})
+
+    async def conditional_get():
+        if "value" not in etag:
+            headers, _ = await request("GET", "/tasks/", params={"limit": PAGE_SIZE})
+            etag["value"] = headers["etag"]
+        await request("GET", "/tasks/", expect=304, params={"limit": PAGE_SIZE}, headers={"If-None-Match": etag["value"]})
+
+    return [
+        ("GET /tasks/", ("GET", "/tasks/"), get("/tasks/", params={"limit": PAGE_SIZE})),
+        ("GET /tasks/ (fields)", ("GET", "/tasks/"),
+         get("/tasks/", params={"limit": PAGE_SIZE, "fields": "name,status"})),
+        ("GET /tasks/ (total)", ("GET", "/tasks/"), get("/tasks/", params={"limit": PAGE_SIZE, "total": "true"})),
+        ("GET /tasks/ (304)", ("GET", "/tasks/"), conditional_get),
+        ("GET /tasks/export", ("GET", "/tasks/export"), get("/tasks/export", params={"status": "todo"})),
+        ("GET /tasks/changes (connect)", ("GET", "/tasks/changes"), get("/tasks/changes", disconnect_after=1)),
+        ("GET /tasks/sync", ("GET", "/tasks/sync"), get("/tasks/sync", params={"since": 0, "limit": PAGE_SIZE})),
+        ("GET /tasks/search", ("GET", "/tasks/search"), get("/tasks/search", params={"q": "report"})),
+        ("GET /tasks/stats", ("GET", "/tasks/stats"), get("/tasks/stats")),
+        ("GET /tasks/{task_id}", ("GET", "/tasks/{task_id}"), lambda: request("GET", f"/tasks/{next(ids)}")),
+        ("GET /tasks/completed/", ("GET", "/tasks/completed/"), get("/tasks/completed/", params={"limit": PAGE_SIZE})),
+        ("GET /tasks/todo/", ("GET", "/tasks/todo/"), get("/tasks/todo/", params={"limit": PAGE_SIZE})),
+        ("GET /tasks/by-name/{name}", ("GET", "/tasks/by-name/{name}"),
+         get("/tasks/by-name/task-7", params={"limit": PAGE_SIZE})),
+        ("GET /internal/pool", ("GET", "/internal/pool"), get("/internal/pool")),
+        ("GET /internal/cache", ("GET", "/internal/cache"), get("/internal/cache")),
+        ("GET /metrics", ("GET", "/metrics"), get("/metrics")),
+        ("POST /tasks/", ("POST", "/tasks/"), create_task),
+        (f"POST /tasks/bulk ({BATCH_SIZE})", ("POST", "/tasks/bulk"), create_tasks),
+        ("PUT /tasks/{task_id}", ("PUT", "/tasks/{task_id}"),
+         lambda: request("PUT", f"/tasks/{next(ids)}", params={"name": "renamed"})),
+        ("PATCH /tasks/{task_id}/complete", ("PATCH", "/tasks/{task_id}/complete"),
+         lambda: request("PATCH", f"/tasks/{next(completing)}/complete")),
+        ("PATCH /tasks/{task_id}/todo", ("PATCH", "/tasks/{task_id}/todo"),
+         lambda: request("PATCH", f"/tasks/{next(reopening)}/todo")),
+        (f"PATCH /tasks/bulk/status ({BULK_CHANGE_SIZE})", ("PATCH", "/tasks/bulk/status"), mark_tasks),
+        ("DELETE /tasks/{task_id}", ("DELETE", "/tasks/{task_id}"),
+         lambda: request("DELETE", f"/tasks/{created.pop()}")),
+        (f"DELETE /tasks/bulk ({BULK_CHANGE_SIZE})", ("DELETE", "/tasks/bulk"),
+         lambda: request("DELETE", "/tasks/bulk", json_body={"ids": [created.pop() for _ in range(BULK_CHANGE_SIZE)]})),
+    ]
+
+
+def uncovered_routes(app, cases):
+    """
+    List the app's routes that no API case exercises.
+
+    Args:
+        app (FastAPI): Application under test
+        cases (list): Cases from api_cases
+
+    Returns:
+        list: "METHOD /path" strings
+    """
+    from fastapi.routing import APIRoute
+
+    covered = {route for _, route, _ in cases}
+    missing = []
+    for route in app.routes:
+        if isinstance(route, APIRoute):
+            missing += [f"{method} {route.path}" for method in sorted(route.methods) if (method, route.path) not in covered]
+    return missing
+
+
+def run_manager(engine, rows, iterations, cache, store):
+    """
+    Time every Manager method.
+
+    Args:
+        store (str): "sql" for the seeded database, "memory" for a
+            MemoryTaskStore seeded with the same rows
+
+    Returns:
+        dict: Case name -> latency_stats
+    """
+    from logic import Manager
+    from cache import CachedManager
+
+    from storage import MemoryTaskStore
+
+    storage = None
+    if store == "memory":
+        storage = MemoryTaskStore()
+        storage.insert_many(None, seed_rows(0, rows))
+        engine = None
+    manager = CachedManager(storage=storage) if cache else Manager(storage)
+    results = {}
+    for name, operation in manager_cases(manager, engine, rows):
+        results[f"manager: {name}"] = latency_stats(time_sync(operation, iterations))
+        print_result(f"manager: {name}", results[f"manager: {name}"])
+    return results
+
+
+async def run_api(rows, iterations):
+    """
+    Time every route of main.app.
+
+    Returns:
+        dict: Case name -> latency_stats
+    """
+    from main import app
+
+    results = {}
+    cases = api_cases(app, rows)
+    for route in uncovered_routes(app, cases):
+        print(f"warning: no benchmark case for {route}", file=sys.stderr)
+    async with asgi_lifespan(app):
+        for name, _, operation in cases:
+            results[f"api: {name}"] = latency_stats(await time_async(operation, iterations))
+            print_result(f"api: {name}", results[f"api: {name}"])
+    return results
+
+
+def print_result(name, stats):
+    print(f"{name:<48}{stats['ops_per_sec']:>10.0f}{stats['p50_ms']:>10.3f}"
+          f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}")
+
+
+def compare(results, baseline, threshold):
+    """
+    Find operations whose p50 latency regressed against a baseline.
+
+    Operations missing from either side are ignored.
+
+    Args:
+        results (dict): Case name -> latency_stats for this run
+        baseline (dict): Same, from the baseline file
+        threshold (float): Allowed relative slowdown (0.25 = 25%)
+
+    Returns:
+        list: (name, baseline p50 ms, current p50 ms) for each regression
+    """
+    regressions = []
+    for name, stats in results.items():
+        if name in baseline and stats["p50_ms"] > baseline[name]["p50_ms"] * (1 + threshold):
+            regressions.append((name, baseline[name]["p50_ms"], stats["p50_ms"]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Manager methods and API routes on SQLite")
+    parser.add_argument("--rows", type=int, default=20_000, help="Number of tasks to seed")
+    parser.add_argument("--iterations", type=int, default=200, help="Timed calls per operation")
+    parser.add_argument("--path", default="bench_suite.db", help="SQLite database file (recreated)")
+    parser.add_argument("--output", default="bench_results.json", help="Where to write the results")
+    parser.add_argument("--baseline", help="Results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed p50 slowdown vs baseline")
+    parser.add_argument("--only", choices=["manager", "api"], help="Run only one half of the suite")
+    parser.add_argument("--cache", action="store_true", help="Enable the read cache (cache.py)")
+    parser.add_argument("--store", choices=["sql", "memory"], default="sql",
+                        help="Storage engine for the Manager half")
+    args = parser.parse_args()
+    if args.iterations < 2:
+        parser.error("--iterations must be at least 2")
+    if args.rows < 2 * (args.iterations + WARMUP):
+        # Status change cases need one distinct to-do task per call
+        parser.error(f"--rows must be at least {2 * (args.iterations + WARMUP)} for {args.iterations} iterations")
+
+    # Settings are read when the project modules are imported, so point
+    # them at the benchmark database first
+    if os.path.exists(args.path):
+        os.remove(args.path)
+    os.environ["TASKMANAGER_DATABASE_URL"] = f"sqlite:///{args.path}"
+    os.environ["TASKMANAGER_CACHE_ENABLED"] = "true" if args.cache else "false"
+    from database import get_engine
+    engine = get_engine()
+
+    start = time.perf_counter()
+    seed(engine, args.rows)
+    print(f"Seeded {args.rows} rows in {time.perf_counter() - start:.1f}s\n")
+
+    print(f"{'operation':<48}{'ops/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    results = {}
+    if args.only != "api":
+        results.update(run_manager(engine, args.rows, args.iterations, args.cache, args.store))
+    if args.only != "manager":
+        results.update(asyncio.run(run_api(args.rows, args.iterations)))
+
+    report = {
+        "meta": {
+            "rows": args.rows,
+            "iterations": args.iterations,
+            "cache": args.cache,
+            "store": args.store,
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    engine.dispose()
+    os.remove(args.path)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} operations regressed by more than {args.threshold:.0%} (p50):")
+            for name, before, after in regressions:
+                print(f"  {name}: {before:.3f} ms -> {after:.3f} ms ({after / before - 1:+.0%})")
+            sys.exit(1)
+        print(f"\nNo p50 regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Validation Benchmark
+
+Measures the per-request cost of checking task input, before and after
+validating once at the boundary:
+- CLI create, before: the prompts run name_check/content_check, then
+  Manager.add_task runs them again (four ValidationResponse objects)
+- CLI create, after: the prompts run name_error/content_error (no
+  allocation) and the Manager is called with validated=True
+- API create, before: FastAPI parses name and content as plain strings,
+  then the Manager runs name_check/content_check
+- API create, after: FastAPI parses them into TaskCreate, whose field
+  constraints carry the length limits, and the Manager skips its checks
+
+The API cases run real FastAPI routes called in-process over ASGI; they
+do not touch the database, so only parsing and validation are timed.
+
+Usage:
+    python -m benchmarks.bench_validation [--number 20000] [--repeat 5]
+"""
+
+import argparse
+import asyncio
+import timeit
+from typing import Annotated
+
+from fastapi import FastAPI, Query, Response
+
+from benchmarks.common import asgi_request
+from model import TaskCreate
+from validators import content_check, content_error, name_check, name_error
+
+NAME = "Buy groceries"
+CONTENT = "Need to buy milk, bread, and eggs"
+
+
+def cli_before():
+    # Prompt checks
+    name_check(NAME)
+    content_check(CONTENT)
+    # Manager.add_task checks
+    name_check(NAME)
+    content_check(CONTENT)
+
+
+def cli_after():
+    name_error(NAME)
+    content_error(CONTENT)
+
+
+def build_app():
+    """
+    Build an app exposing the old and new create route signatures.
+
+    Returns:
+        FastAPI: App with POST /before and POST /after
+    """
+    app = FastAPI()
+
+    @app.post("/before")
+    async def before(name: str, content: str):
+        name_validation = name_check(name)
+        content_validation = content_check(content)
+        if not (name_validation.success and content_validation.success):
+            return Response(status_code=400)
+        return Response()
+
+    @app.post("/after")
+    async def after(task: Annotated[TaskCreate, Query()]):
+        return Response()
+
+    return app
+
+
+def best_per_call(func, number, repeat):
+    """
+    Time func with timeit and keep the best run.
+
+    Returns:
+        float: Microseconds per call
+    """
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark task input validation")
+    parser.add_argument("--number", type=int, default=20_000, help="Calls per timing run")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per case (best is kept)")
+    args = parser.parse_args()
+
+    app = build_app()
+    loop = asyncio.new_event_loop()
+    params = {"name": NAME, "content": CONTENT}
+    for path in ("/before", "/after"):
+        status, _, _ = loop.run_until_complete(asgi_request(app, "POST", path, params))
+        if status != 200:
+            raise RuntimeError(f"POST {path} returned {status}")
+
+    cases = {
+        "cli create": (cli_before, cli_after),
+        "api create": (
+            lambda: loop.run_until_complete(asgi_request(app, "POST", "/before", params)),
+            lambda: loop.run_until_complete(asgi_request(app, "POST", "/after", params)),
+        ),
+    }
+    # ASGI round trips are much slower than the bare checks, so run fewer of them
+    numbers = {"cli create": args.number, "api create": max(args.number // 20, 1)}
+
+    print(f"{'case':<14}{'before us':>12}{'after us':>12}{'saved us':>12}")
+    for name, (before, after) in cases.items():
+        before_us = best_per_call(before, numbers[name], args.repeat)
+        after_us = best_per_call(after, numbers[name], args.repeat)
+        print(f"{name:<14}{before_us:>12.2f}{after_us:>12.2f}{before_us - after_us:>12.2f}")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Change Version Contention Benchmark
+
+Every write transaction takes its change version from the single
+TaskVersion row and keeps that row locked until it commits. The stores
+take it last (logic.stamp_version), so the lock only covers the stamp and
+the commit. This measures what versioning costs under concurrent writers:
+threads each commit one-task transactions, either
+- unversioned: the INSERT alone, or
+- versioned: the INSERT, then stamp_version, as the stores do
+
+at each --concurrency level. --hold-ms adds time between the INSERT and
+the version, standing in for the rest of a longer write transaction
+(the version row is not locked yet).
+
+Reports transactions/s and p50/p95 commit latency per mode. The database
+is the configured one (TASKMANAGER_DATABASE_URL), or a SQLite file with
+--path. Use a scratch database: the benchmark creates tasks named
+"bench-version" and deletes them afterwards.
+
+Usage:
+    python -m benchmarks.bench_version_contention [--concurrency 1,4,16]
+        [--transactions 800] [--hold-ms 0] [--path bench_version.db]
+"""
+
+import argparse
+import os
+import threading
+import time
+
+NAME = "bench-version"
+CONTENT = "Created by the change version benchmark"
+
+
+def run_writers(engine, concurrency, transactions, versioned, hold):
+    """
+    Commit one-task transactions from concurrent threads.
+
+    Returns:
+        tuple: (transactions per second, list of per-transaction seconds)
+    """
+    from logic import insert_rows_statement, stamp_version
+
+    per_worker = transactions // concurrency
+    latencies = []
+    errors = []
+    row = {"name": NAME, "content": CONTENT, "status": "Todo"}
+
+    def worker():
+        try:
+            for _ in range(per_worker):
+                start = time.perf_counter()
+                with engine.begin() as conn:
+                    conn.execute(insert_rows_statement(), [row])
+                    if hold:
+                        time.sleep(hold)
+                    if versioned:
+                        stamp_version(conn)
+                latencies.append(time.perf_counter() - start)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return per_worker * concurrency / elapsed, latencies
+
+
+def cleanup(engine):
+    """Delete the tasks created by the benchmark."""
+    from sqlalchemy import delete
+    from database import TaskDB
+
+    with engine.begin() as conn:
+        conn.execute(delete(TaskDB).where(TaskDB.name == NAME))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure change version contention under concurrent writers")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated writer thread counts")
+    parser.add_argument("--transactions", type=int, default=800, help="Transactions per run")
+    parser.add_argument("--hold-ms", type=float, default=0.0, help="Extra time each transaction stays open")
+    parser.add_argument("--path", help="SQLite database file to use (recreated) instead of the configured database")
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    if args.path:
+        if os.path.exists(args.path):
+            os.remove(args.path)
+        os.environ["TASKMANAGER_DATABASE_URL"] = f"sqlite:///{os.path.abspath(args.path)}"
+        # Enough connections for every writer, so the pool is not what is measured
+        os.environ["TASKMANAGER_DATABASE_POOL_SIZE"] = str(max(levels))
+
+    from benchmarks.common import latency_stats
+    from database import get_engine, init_db
+
+    init_db()
+    engine = get_engine()
+    print(f"{args.transactions} transactions per run, {args.hold_ms:g} ms held open, "
+          f"{engine.dialect.name}\n")
+    print(f"{'writers':>8}  {'mode':<12}{'tx/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+    try:
+        for concurrency in levels:
+            for versioned in (False, True):
+                rate, latencies = run_writers(engine, concurrency, args.transactions, versioned, args.hold_ms / 1000)
+                stats = latency_stats(latencies)
+                mode = "versioned" if versioned else "unversioned"
+                print(f"{concurrency:>8}  {mode:<12}{rate:>10.0f}{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}")
+    finally:
+        cleanup(engine)
+        engine.dispose()
+    if args.path:
+        os.remove(args.path)
+
+
+if __name__ == "__main__":
+    main()
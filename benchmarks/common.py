@@ -0,0 +1,118 @@
+"""
+Shared Benchmark Helpers
+
+- asgi_request: call an ASGI app in-process, without a network or HTTP client
+- asgi_lifespan: run an app's startup and shutdown handlers
+- latency_stats: ops/s and latency percentiles from per-operation timings
+"""
+
+import asyncio
+import json
+import statistics
+from contextlib import asynccontextmanager
+from urllib.parse import urlencode
+
+
+async def asgi_request(app, method, path, params=None, json_body=None, headers=None, disconnect_after=None):
+    """
+    Send one HTTP request to an ASGI app and collect the response.
+
+    Args:
+        app: ASGI application
+        method (str): HTTP method
+        path (str): Request path
+        params (Optional[dict]): Query string parameters
+        json_body: Optional value sent as a JSON request body
+        headers (Optional[dict]): Extra request headers
+        disconnect_after (Optional[int]): Disconnect once this many body chunks
+            arrived (for endless streams such as Server-Sent Events)
+
+    Returns:
+        tuple: (status code, response headers dict, body bytes)
+    """
+    body = b"" if json_body is None else json.dumps(json_body).encode()
+    raw_headers = [(b"host", b"bench")]
+    if json_body is not None:
+        raw_headers += [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    for name, value in (headers or {}).items():
+        raw_headers.append((name.lower().encode(), value.encode()))
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": urlencode(params or {}).encode(), "root_path": "", "headers": raw_headers,
+        "client": ("bench", 0), "server": ("bench", 80),
+    }
+    request_sent = False
+    status = None
+    response_headers = {}
+    chunks = []
+    disconnected = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if request_sent:
+            # Only reached by handlers waiting for a disconnect
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+        request_sent = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update((k.decode().lower(), v.decode()) for k, v in message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+            if disconnect_after is not None and len(chunks) >= disconnect_after:
+                disconnected.set()
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
+
+
+@asynccontextmanager
+async def asgi_lifespan(app):
+    """
+    Run an ASGI app's startup handlers on entry and shutdown handlers on exit.
+
+    Args:
+        app: ASGI application
+
+    Raises:
+        RuntimeError: If startup fails
+    """
+    incoming = asyncio.Queue()
+    outgoing = asyncio.Queue()
+    task = asyncio.create_task(app({"type": "lifespan", "asgi": {"version": "3.0"}}, incoming.get, outgoing.put))
+    await incoming.put({"type": "lifespan.startup"})
+    message = await outgoing.get()
+    if message["type"] != "lifespan.startup.complete":
+        raise RuntimeError(f"Application startup failed: {message.get('message', '')}")
+    try:
+        yield
+    finally:
+        await incoming.put({"type": "lifespan.shutdown"})
+        await outgoing.get()
+        await task
+
+
+def latency_stats(latencies):
+    """
+    Summarize per-operation latencies.
+
+    Args:
+        latencies (list): Seconds per operation (at least two)
+
+    Returns:
+        dict: n, ops_per_sec, p50_ms, p95_ms, p99_ms, max_ms
+    """
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    return {
+        "n": len(latencies),
+        "ops_per_sec": len(latencies) / sum(latencies),
+        "p50_ms": cuts[49] * 1000,
+        "p95_ms": cuts[94] * 1000,
+        "p99_ms": cuts[98] * 1000,
+        "max_ms": max(latencies) * 1000,
+    }
@@ -0,0 +1,420 @@
+"""
+Read-Through Task Cache
+
+This module provides an optional in-process caching layer around the
+managers:
+- LRUCache: bounded LRU cache with per-entry TTL and hit/miss/eviction counters
+- TaskCache: single-task and list-result caches, invalidated by TaskEvents
+- CachedManager / CachedAsyncManager: Manager / AsyncManager subclasses
+  that serve lookups and list pages from a TaskCache
+  
+Invalidation is driven by the managers' write events, so it only covers
+writes made through this process. Writes made elsewhere (other API
+workers, the CLI) are caught by the change version: every entry is tagged
+with the version read before it was fetched, and is only served to a
+reader that sees that same version. The cached managers read the version
+once per transaction, reusing the one the API's conditional GET check
+just read, so a cached body always matches the ETag sent with it.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from logic import Manager, task_to_schema
+from async_logic import AsyncManager
+
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Bounded least-recently-used cache with a time-to-live per entry.
+    
+    Not thread-safe on its own; TaskCache serializes access.
+    
+    Attributes:
+        hits (int): Lookups answered from the cache
+        misses (int): Lookups not found or expired
+        evictions (int): Entries dropped to stay within max_entries
+        expirations (int): Entries dropped because their TTL ran out
+    
+    Entries can carry a version tag: a lookup that passes a different
+    version drops the entry and counts as a miss.
+    """
+
+    def __init__(self, max_entries, ttl, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.clock = clock
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=_MISSING, version=None):
+        """
+        Look up a key, refreshing its LRU position.
+        
+        Args:
+            key: Cache key
+            default: Returned on a miss
+            version: Version tag the entry must have been stored with
+            
+        Returns:
+            Cached value, or default if missing, expired or of another version
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        value, expires_at, entry_version = entry
+        if expires_at <= self.clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        if entry_version != version:
+            del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key, value, version=None):
+        """Store a value with a version tag, evicting the least recently used entry if full."""
+        self._entries[key] = (value, self.clock() + self.ttl, version)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def pop(self, key):
+        """Remove a key if present."""
+        self._entries.pop(key, None)
+
+    def remove_where(self, predicate):
+        """Remove every key for which predicate(key) is true."""
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+
+    def stats(self):
+        """
+        Get cache counters.
+        
+        Returns:
+            dict: size, max_entries, hits, misses, evictions, expirations
+        """
+        return {"size": len(self._entries), "max_entries": self.max_entries, "hits": self.hits,
+                "misses": self.misses, "evictions": self.evictions, "expirations": self.expirations}
+
+
+class TaskCache:
+    """
+    Task and list-result caches with precise write invalidation.
+    
+    List entries are keyed by (scope, ...) where scope is "all", "todo",
+    "completed" or ("name", name). A write only drops the entries whose
+    scope can contain the changed task, before or after the change.
+    
+    A read that races with a write must not store a result computed before
+    the write: a generation number is bumped on every invalidation, and
+    results are only stored if it did not change while they were fetched.
+    
+    Entries are stored with the change version read before fetching them,
+    and lookups pass the version their reader sees, so writes this process
+    was not told about never serve an entry under a newer version.
+    
+    Register an instance as a manager listener (CachedManager does this).
+    """
+
+    def __init__(self, max_tasks=10000, max_lists=1000, ttl=30.0):
+        self.tasks = LRUCache(max_tasks, ttl)
+        self.lists = LRUCache(max_lists, ttl)
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    # ===== READS =====
+    
+    def generation(self):
+        """Get the current write generation; pass it back to put_task / put_list."""
+        return self._generation
+
+    def get_task(self, task_id, version):
+        """Get a TaskSchema cached at the given change version, or None on a miss."""
+        with self._lock:
+            return self.tasks.get(task_id, None, version)
+
+    def put_task(self, task_id, task_schema, generation, version):
+        """Cache a task fetched at the given generation and version, unless a write happened since."""
+        with self._lock:
+            if self._generation == generation:
+                self.tasks.set(task_id, task_schema, version)
+
+    def get_list(self, key, version):
+        """Get a list result cached at the given change version, or None on a miss."""
+        with self._lock:
+            return self.lists.get(key, None, version)
+
+    def put_list(self, key, value, generation, version):
+        """Cache a list result fetched at the given generation and version, unless a write happened since."""
+        with self._lock:
+            if self._generation == generation:
+                self.lists.set(key, value, version)
+
+    # ===== INVALIDATION =====
+    
+    def __call__(self, event):
+        """
+        Invalidate entries affected by a TaskEvent.
+        
+        Args:
+            event (TaskEvent): Committed write reported by a manager
+        """
+        scopes = {"all"}
+        for task_schema in (event.data, event.previous):
+            if task_schema is not None:
+                scopes.add(task_schema.status.lower())
+                scopes.add(("name", task_schema.name))
+        with self._lock:
+            self._generation += 1
+            self.tasks.pop(event.task_id)
+            self.lists.remove_where(lambda key: key[0] in scopes)
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._generation += 1
+            self.tasks.remove_where(lambda key: True)
+            self.lists.remove_where(lambda key: True)
+
+    def stats(self):
+        """
+        Get counters for both caches.
+        
+        Returns:
+            dict: {"tasks": {...}, "lists": {...}} as returned by LRUCache.stats
+        """
+        with self._lock:
+            return {"tasks": self.tasks.stats(), "lists": self.lists.stats()}
+
+
+def _count_scope(status=None, name=None):
+    """Get the list scope whose invalidation also covers a count."""
+    if name is not None:
+        return ("name", name)
+    return status or "all"
+
+
+def _fields_key(fields):
+    """Get a hashable cache key part for a field projection."""
+    return None if fields is None else tuple(fields)
+
+
+# Session.info key of the change version read in the session's transaction
+_VERSION_INFO = "task_cache_version"
+
+
+def _remember_version(session, version):
+    """Record the change version read in a sync session's current transaction."""
+    if session is not None:
+        session.info[_VERSION_INFO] = (session.get_transaction(), version)
+
+
+def _remembered_version(session):
+    """Get the change version read in a sync session's current transaction, or None."""
+    if session is None:
+        return None
+    transaction, version = session.info.get(_VERSION_INFO, (None, None))
+    if transaction is None or transaction is not session.get_transaction():
+        return None
+    return version
+
+
+class CachedManager(Manager):
+    """
+    Manager that serves lookups and list pages from a TaskCache.
+    
+    search_by_id and search_by_name return TaskSchema objects instead of
+    TaskDB rows. Statistics and counts are cached like list pages. Writes
+    go to the database as usual and invalidate the cache through the
+    listener mechanism. Cached entries are only served at the change
+    version they were fetched at (see TaskCache).
+    """
+
+    def __init__(self, cache=None, storage=None):
+        super().__init__(storage)
+        self.cache = cache or TaskCache()
+        self.add_listener(self.cache)
+
+    def change_version(self, session):
+        version = super().change_version(session)
+        _remember_version(session, version)
+        return version
+
+    def _version(self, session):
+        """Get the change version seen by the session's transaction, reading it once."""
+        version = _remembered_version(session)
+        return self.change_version(session) if version is None else version
+
+    def search_by_id(self, task_id, session):
+        version = self._version(session)
+        cached = self.cache.get_task(task_id, version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation()
+        task = super().search_by_id(task_id, session)
+        if task is None:
+            return None
+        task_schema = task_to_schema(task)
+        self.cache.put_task(task_id, task_schema, generation, version)
+        return task_schema
+
+    def search_by_name(self, name, session):
+        key = (("name", name), "rows")
+        version = self._version(session)
+        cached = self.cache.get_list(key, version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation()
+        tasks = [task_to_schema(t) for t in super().search_by_name(name, session)]
+        self.cache.put_list(key, tasks, generation, version)
+        return tasks
+
+    def _cached_value(self, key, session, fetch):
+        version = self._version(session)
+        cached = self.cache.get_list(key, version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation()
+        value = fetch()
+        self.cache.put_list(key, value, generation, version)
+        return value
+
+    def _cached_list(self, key, session, fetch):
+        version = self._version(session)
+        cached = self.cache.get_list(key, version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation()
+        response = fetch()
+        if response.success:
+            self.cache.put_list(key, response, generation, version)
+        return response
+
+    def get_all_tasks(self, session, limit=None, after=None, fields=None):
+        return self._cached_list(("all", limit, after, _fields_key(fields)), session,
+                                 lambda: super(CachedManager, self).get_all_tasks(session, limit, after, fields))
+
+    def get_todo_tasks(self, session, limit=None, after=None, fields=None):
+        return self._cached_list(("todo", limit, after, _fields_key(fields)), session,
+                                 lambda: super(CachedManager, self).get_todo_tasks(session, limit, after, fields))
+
+    def get_completed_tasks(self, session, limit=None, after=None, fields=None):
+        return self._cached_list(("completed", limit, after, _fields_key(fields)), session,
+                                 lambda: super(CachedManager, self).get_completed_tasks(session, limit, after, fields))
+
+    def get_tasks_by_name(self, name, session, limit=None, after=None, fields=None):
+        return self._cached_list((("name", name), limit, after, _fields_key(fields)), session,
+                                 lambda: super(CachedManager, self).get_tasks_by_name(name, session, limit, after, fields))
+
+    def get_stats(self, session):
+        return self._cached_value(("all", "stats"), session, lambda: super(CachedManager, self).get_stats(session))
+
+    def count_tasks(self, session, status=None, name=None):
+        return self._cached_value((_count_scope(status, name), "count", status), session,
+                                  lambda: super(CachedManager, self).count_tasks(session, status, name))
+
+
+class CachedAsyncManager(AsyncManager):
+    """AsyncManager that serves lookups and list pages from a TaskCache (see CachedManager)."""
+
+    def __init__(self, cache=None, write_queue=None):
+        super().__init__(write_queue)
+        self.cache = cache or TaskCache()
+        self.add_listener(self.cache)
+
+    async def change_version(self, session):
+        version = await super().change_version(session)
+        _remember_version(session.sync_session, version)
+        return version
+
+    async def _version(self, session):
+        """Get the change version seen by the session's transaction, reading it once."""
+        version = _remembered_version(session.sync_session)
+        return await self.change_version(session) if version is None else version
+
+    async def search_by_id(self, task_id, session):
+        version = await self._version(session)
+        cached = self.cache.get_task(task_id, version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation()
+        task = await super().search_by_id(task_id, session)
+        if task is None:
+            return None
+        task_schema = task_to_schema(task)
+        self.cache.put_task(task_id, task_schema, generation, version)
+        return task_schema
+
+    async def search_by_name(self, name, session):
+        key = (("name", name), "rows")
+        version = await self._version(session)
+        cached = self.cache.get_list(key, version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation()
+        tasks = [task_to_schema(t) for t in await super().search_by_name(name, session)]
+        self.cache.put_list(key, tasks, generation, version)
+        return tasks
+
+    async def _cached_value(self, key, session, fetch):
+        version = await self._version(session)
+        cached = self.cache.get_list(key, version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation()
+        value = await fetch()
+        self.cache.put_list(key, value, generation, version)
+        return value
+
+    async def _cached_list(self, key, session, fetch):
+        version = await self._version(session)
+        cached = self.cache.get_list(key, version)
+        if cached is not None:
+            return cached
+        generation = self.cache.generation()
+        response = await fetch()
+        if response.success:
+            self.cache.put_list(key, response, generation, version)
+        return response
+
+    async def get_all_tasks(self, session, limit=None, after=None, fields=None):
+        return await self._cached_list(("all", limit, after, _fields_key(fields)), session,
+                                       lambda: super(CachedAsyncManager, self).get_all_tasks(session, limit, after, fields))
+
+    async def get_todo_tasks(self, session, limit=None, after=None, fields=None):
+        return await self._cached_list(("todo", limit, after, _fields_key(fields)), session,
+                                       lambda: super(CachedAsyncManager, self).get_todo_tasks(session, limit, after, fields))
+
+    async def get_completed_tasks(self, session, limit=None, after=None, fields=None):
+        return await self._cached_list(("completed", limit, after, _fields_key(fields)), session,
+                                       lambda: super(CachedAsyncManager, self).get_completed_tasks(session, limit, after, fields))
+
+    async def get_tasks_by_name(self, name, session, limit=None, after=None, fields=None):
+        return await self._cached_list((("name", name), limit, after, _fields_key(fields)), session,
+                                       lambda: super(CachedAsyncManager, self).get_tasks_by_name(name, session, limit, after, fields))
+
+    async def get_stats(self, session):
+        return await self._cached_value(("all", "stats"), session,
+                                        lambda: super(CachedAsyncManager, self).get_stats(session))
+
+    async def count_tasks(self, session, status=None, name=None):
+        return await self._cached_value((_count_scope(status, name), "count", status), session,
+                                        lambda: super(CachedAsyncManager, self).count_tasks(session, status, name))
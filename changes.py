@@ -0,0 +1,333 @@
+"""
+Task Change Feed
+
+Pushes committed task changes to clients over Server-Sent Events (GET
+/tasks/changes in main.py), so UIs do not have to poll the list routes:
+- ChangeBroadcaster: registered as a manager listener; every TaskEvent is
+  serialized once and fanned out to all subscribers
+- Subscription: one client's bounded buffer. A client that falls behind by
+  more than buffer_size events gets its backlog replaced by one "reset"
+  event (refetch the list, then keep applying events) instead of holding
+  memory or slowing down writers
+- Recent events are kept (history) so a client reconnecting with
+  Last-Event-ID receives what it missed, or "reset" if that is too old
+
+Event IDs are "<origin>-<sequence>", where the origin identifies the
+process and its start, so IDs from another process or from before a
+restart are recognised and answered with "reset".
+
+Multi-process setups (several API workers) share events through a relay:
+- PostgresChangeRelay: LISTEN/NOTIFY on the task database (asyncpg)
+- MemoryChangeRelay: in-process stand-in with the same behaviour, for
+  running several broadcasters in one process (local testing)
+Each broadcaster publishes its own events locally and ignores its own
+events coming back from the relay. Only API processes publish: writes made
+by the CLI or the importer do not appear in the feed.
+
+Configuration: config.ChangesSettings.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+
+from sqlalchemy.engine import make_url
+
+
+logger = logging.getLogger("taskmanager.changes")
+
+# Sent to a subscriber instead of events it can no longer receive
+RESET = "reset"
+
+# NOTIFY channel used by PostgresChangeRelay
+NOTIFY_CHANNEL = "taskmanager_changes"
+
+
+def format_event(event_id, kind, data):
+    """
+    Format one Server-Sent Event.
+    
+    Args:
+        event_id (str): Event ID (sent back by the client as Last-Event-ID)
+        kind (str): Event type, the TaskEvent kind or "reset"
+        data (str): JSON payload on one line
+    
+    Returns:
+        bytes: Encoded event
+    """
+    return f"id: {event_id}\nevent: {kind}\ndata: {data}\n\n".encode()
+
+
+class Subscription:
+    """
+    One subscriber's buffer of (sequence, kind, data) events.
+    
+    Attributes:
+        queue (asyncio.Queue): Events waiting to be sent
+        resets (int): Times the buffer overflowed and was replaced by a reset
+    """
+
+    def __init__(self, buffer_size):
+        self.queue = asyncio.Queue(buffer_size)
+        self.resets = 0
+
+    def push(self, item):
+        """Buffer an event; on overflow drop the backlog and buffer a reset instead."""
+        try:
+            self.queue.put_nowait(item)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait((item[0], RESET, "{}"))
+            self.resets += 1
+
+
+class ChangeBroadcaster:
+    """
+    Fans TaskEvents out to SSE subscribers.
+    
+    Call it with a TaskEvent (it is a manager listener). Runs on the event
+    loop; start() and close() manage the relay, if any.
+    """
+
+    def __init__(self, buffer_size=100, history=1000, relay=None):
+        """
+        Args:
+            buffer_size (int): Events buffered per subscriber before it is reset
+            history (int): Recent events kept for Last-Event-ID resumption
+            relay (Optional[ChangeRelay]): Relay to other processes
+        """
+        self.buffer_size = buffer_size
+        self.relay = relay
+        self.origin = f"{os.getpid():x}{time.time_ns():x}"
+        self.sequence = 0
+        self.resets = 0
+        self._history = deque(maxlen=history)
+        self._subscribers = set()
+
+    def __call__(self, event):
+        data = event.model_dump_json()
+        self.publish(event.kind, data)
+        if self.relay is not None:
+            self.relay.send(self.origin, event.kind, data)
+
+    def publish(self, kind, data):
+        """
+        Send an event to every subscriber.
+        
+        Args:
+            kind (str): Event type
+            data (str): JSON payload
+        """
+        self.sequence += 1
+        item = (self.sequence, kind, data)
+        self._history.append(item)
+        for subscription in self._subscribers:
+            subscription.push(item)
+
+    def _receive(self, origin, kind, data):
+        """Publish an event from the relay unless this process sent it."""
+        if origin != self.origin:
+            self.publish(kind, data)
+
+    def event_id(self, sequence):
+        """Build the SSE event ID for a sequence number."""
+        return f"{self.origin}-{sequence}"
+
+    @property
+    def subscribers(self):
+        """Number of connected subscribers."""
+        return len(self._subscribers)
+
+    async def start(self):
+        """Start receiving events from the relay."""
+        if self.relay is not None:
+            await self.relay.start(self._receive)
+
+    async def close(self):
+        """Stop the relay."""
+        if self.relay is not None:
+            await self.relay.close()
+
+    def subscribe(self, last_event_id=None):
+        """
+        Add a subscriber.
+        
+        Args:
+            last_event_id (Optional[str]): Last event the client received;
+                the newer events still in the history are buffered first
+        
+        Returns:
+            Subscription: New subscriber (pass to unsubscribe when done)
+        """
+        subscription = Subscription(self.buffer_size)
+        if last_event_id is not None:
+            origin, _, sequence = last_event_id.rpartition("-")
+            oldest = self._history[0][0] if self._history else self.sequence + 1
+            if origin != self.origin or not sequence.isdigit() or int(sequence) + 1 < oldest:
+                subscription.push((self.sequence, RESET, "{}"))
+            else:
+                for item in self._history:
+                    if item[0] > int(sequence):
+                        subscription.push(item)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """Remove a subscriber."""
+        self._subscribers.discard(subscription)
+        self.resets += subscription.resets
+
+    async def stream(self, last_event_id=None, keepalive=15.0):
+        """
+        Subscribe and yield Server-Sent Events until the client disconnects.
+        
+        Args:
+            last_event_id (Optional[str]): Last-Event-ID header of the request
+            keepalive (float): Seconds of silence before a keepalive comment
+        
+        Yields:
+            bytes: Encoded events and keepalive comments
+        """
+        subscription = self.subscribe(last_event_id)
+        try:
+            # Sends the response headers right away
+            yield b": connected\n\n"
+            while True:
+                try:
+                    sequence, kind, data = await asyncio.wait_for(subscription.queue.get(), keepalive)
+                except asyncio.TimeoutError:
+                    yield b": keepalive\n\n"
+                    continue
+                yield format_event(self.event_id(sequence), kind, data)
+        finally:
+            self.unsubscribe(subscription)
+
+
+class ChangeRelay(ABC):
+    """
+    Relay interface: carries (origin, kind, data) events between processes.
+    
+    send() is called synchronously from the event loop and must not block.
+    """
+
+    @abstractmethod
+    async def start(self, receive):
+        """Start delivering events from all processes to receive(origin, kind, data)."""
+
+    @abstractmethod
+    def send(self, origin, kind, data):
+        """Send an event to every process."""
+
+    @abstractmethod
+    async def close(self):
+        """Stop sending and receiving."""
+
+
+class MemoryChangeRelay(ChangeRelay):
+    """
+    In-process relay: every relay on the same bus receives every event.
+    
+    Delivery is asynchronous (scheduled on the event loop), like NOTIFY.
+    """
+
+    # Relays created without a bus share this one
+    default_bus = []
+
+    def __init__(self, bus=None):
+        """
+        Args:
+            bus (Optional[list]): Relays that talk to each other, defaults to default_bus
+        """
+        self.bus = self.default_bus if bus is None else bus
+        self._receive = None
+
+    async def start(self, receive):
+        self._receive = receive
+        self.bus.append(self)
+
+    def send(self, origin, kind, data):
+        loop = asyncio.get_running_loop()
+        for relay in self.bus:
+            loop.call_soon(relay._receive, origin, kind, data)
+
+    async def close(self):
+        if self in self.bus:
+            self.bus.remove(self)
+
+
+class PostgresChangeRelay(ChangeRelay):
+    """
+    Relay over PostgreSQL LISTEN/NOTIFY on its own asyncpg connection.
+    
+    Payloads are "<origin> <kind> <data>" (well under the 8000-byte NOTIFY
+    limit). Notifications are sent in order by one sender task; events sent
+    while the database is unreachable are dropped from the relay (local
+    subscribers still get them).
+    """
+
+    def __init__(self, url, channel=NOTIFY_CHANNEL):
+        """
+        Args:
+            url (str): SQLAlchemy PostgreSQL URL of the task database
+            channel (str): NOTIFY channel name
+        """
+        self.dsn = make_url(url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self._connection = None
+        self._outgoing = None
+        self._sender = None
+
+    async def start(self, receive):
+        import asyncpg
+
+        self._connection = await asyncpg.connect(self.dsn)
+
+        def notified(connection, pid, channel, payload):
+            origin, kind, data = payload.split(" ", 2)
+            receive(origin, kind, data)
+
+        await self._connection.add_listener(self.channel, notified)
+        self._outgoing = asyncio.Queue()
+        self._sender = asyncio.create_task(self._send_loop())
+
+    def send(self, origin, kind, data):
+        if self._outgoing is not None:
+            self._outgoing.put_nowait(f"{origin} {kind} {data}")
+
+    async def _send_loop(self):
+        while True:
+            payload = await self._outgoing.get()
+            try:
+                await self._connection.execute("SELECT pg_notify($1, $2)", self.channel, payload)
+            except Exception as e:
+                logger.warning("NOTIFY failed, event not relayed: %s", e)
+
+    async def close(self):
+        if self._sender is not None:
+            self._sender.cancel()
+            self._sender = None
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+
+def create_relay(kind, url):
+    """
+    Create the relay named in the settings.
+    
+    Args:
+        kind (str): "none", "memory" or "postgres"
+        url (str): Database URL (used by the postgres relay)
+    
+    Returns:
+        Optional[ChangeRelay]: Relay, None for "none"
+    """
+    if kind == "postgres":
+        return PostgresChangeRelay(url)
+    if kind == "memory":
+        return MemoryChangeRelay()
+    return None
@@ -0,0 +1,366 @@
+"""
+Group Commit Write Queue
+
+Opt-in write-behind mode for task creation and status changes. Instead of
+committing one transaction per call, writes from concurrent callers are
+queued and applied by one worker in shared transactions:
+- a batch is flushed when it holds max_batch writes, or max_delay_ms after
+  its first write arrived, whichever comes first
+- the inserts of a batch are one multi-row INSERT ... RETURNING, the status
+  changes run after it in submission order, then the batch commits once
+- every caller waits on its own future and gets its own result (the
+  created row with its assigned ID, or the changed row)
+
+The queue holds at most max_pending writes. When it is full, callers wait
+for space (backpressure) and fail with RuntimeError after submit_timeout
+seconds. If a batch fails, it is rolled back and every caller in it gets
+the exception.
+
+Two variants share the batch logic:
+- GroupCommitQueue: worker thread on a sync Session, used by the sync
+  Manager through GroupCommitStore
+- AsyncGroupCommitQueue: worker task on an AsyncSession, passed to
+  AsyncManager(write_queue=...) by the API when
+  TASKMANAGER_WRITE_QUEUE_ENABLED=true
+
+Configuration: config.WriteQueueSettings.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from sqlmodel import Session
+
+from database import get_async_session_context, get_engine
+from logic import (SQLTaskStore, STATUS_VALUES, insert_rows_statement, stamp_version, status_update_statement,
+                   task_row_statement)
+
+
+class PendingWrite:
+    """
+    One queued write.
+    
+    Attributes:
+        kind (str): "insert" (args: name, content) or "status"
+            (args: task_id, from_status, to_status)
+        args (tuple): Write arguments
+        future: Resolved with the write's result once its batch commits
+        result: Result set while the batch runs
+    """
+    __slots__ = ("kind", "args", "future", "result")
+
+    def __init__(self, kind, args, future):
+        self.kind = kind
+        self.args = args
+        self.future = future
+        self.result = None
+
+
+def _insert_rows(batch):
+    """Split a batch into its inserts and their insert rows."""
+    inserts = [write for write in batch if write.kind == "insert"]
+    rows = [{"name": name, "content": content, "status": STATUS_VALUES["todo"]}
+            for name, content in (write.args for write in inserts)]
+    return inserts, rows
+
+
+def apply_batch(session, batch):
+    """
+    Apply a batch of writes in one transaction and commit it.
+    
+    The whole batch shares one change version, taken after its writes
+    (logic.stamp_version); a batch that changed nothing is rolled back.
+    
+    Args:
+        session (Session): Session for the batch
+        batch (list): PendingWrites, in submission order
+    
+    Sets each write's result: the created row for inserts, (row or None,
+    whether the task exists) for status changes, as SQLTaskStore returns them.
+    """
+    inserts, rows = _insert_rows(batch)
+    written = bool(rows)
+    if rows:
+        for write, row in zip(inserts, session.execute(insert_rows_statement(), rows).all()):
+            write.result = row
+    for write in batch:
+        if write.kind == "status":
+            row = session.execute(status_update_statement(*write.args)).first()
+            if row is None:
+                write.result = None, session.execute(task_row_statement(write.args[0])).first() is not None
+            else:
+                write.result = row, True
+                written = True
+    if not written:
+        session.rollback()
+        return
+    stamp_version(session)
+    session.commit()
+
+
+async def apply_batch_async(session, batch):
+    """Async counterpart of apply_batch: runs it on the AsyncSession's sync view."""
+    await session.run_sync(apply_batch, batch)
+
+
+class GroupCommitQueue:
+    """
+    Thread-based write queue; safe to call from many threads.
+    
+    The worker thread starts on the first write. Statistics: batches and
+    writes count what has been committed.
+    """
+
+    def __init__(self, bind=None, max_batch=100, max_delay_ms=2.0, max_pending=1000, submit_timeout=5.0):
+        """
+        Args:
+            bind (Optional[Engine]): Engine the worker writes to, defaults to the shared engine
+            max_batch (int): Most writes per transaction
+            max_delay_ms (float): Longest a write waits for others to join its batch
+            max_pending (int): Most writes queued at once
+            submit_timeout (float): Seconds a caller waits for queue space
+        """
+        self.bind = bind
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.submit_timeout = submit_timeout
+        self.batches = 0
+        self.writes = 0
+        self._queue = queue.Queue(max_pending)
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def start(self):
+        """Start the worker thread if it is not running."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+                self._thread.start()
+
+    def close(self):
+        """Flush the queued writes and stop the worker thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def submit(self, kind, *args):
+        """
+        Queue one write.
+        
+        Returns:
+            Future: Resolved with the write's result after its batch commits
+        
+        Raises:
+            RuntimeError: If the queue stays full for submit_timeout seconds
+        """
+        self.start()
+        write = PendingWrite(kind, args, Future())
+        try:
+            self._queue.put(write, timeout=self.submit_timeout)
+        except queue.Full:
+            raise RuntimeError("Write queue is full") from None
+        return write.future
+
+    def insert(self, name, content):
+        """Insert one to-do task and wait for its row."""
+        return self.submit("insert", name, content).result()
+
+    def set_status(self, task_id, from_status, to_status):
+        """Change a task's status and wait for (row or None, whether the task exists)."""
+        return self.submit("status", task_id, from_status, to_status).result()
+
+    def _collect(self):
+        """
+        Wait for the next batch.
+        
+        Returns:
+            tuple: (list of PendingWrites, whether close() was called)
+        """
+        first = self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            try:
+                write = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if write is None:
+                return batch, True
+            batch.append(write)
+        return batch, False
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect()
+            if batch:
+                self._flush(batch)
+        # Writes queued after the stop request
+        while True:
+            try:
+                write = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if write is not None:
+                self._flush([write])
+
+    def _flush(self, batch):
+        try:
+            with Session(self.bind or get_engine()) as session:
+                apply_batch(session, batch)
+        except Exception as e:
+            for write in batch:
+                write.future.set_exception(e)
+            return
+        self.batches += 1
+        self.writes += len(batch)
+        for write in batch:
+            write.future.set_result(write.result)
+
+
+class AsyncGroupCommitQueue:
+    """
+    asyncio write queue, used by AsyncManager.
+    
+    start() must be called on the running event loop (AsyncManager.init
+    does), and close() before the loop stops (AsyncManager.close).
+    """
+
+    def __init__(self, bind=None, max_batch=100, max_delay_ms=2.0, max_pending=1000, submit_timeout=5.0):
+        """
+        Args:
+            bind (Optional[AsyncEngine]): Engine the worker writes to, defaults to the shared async engine
+            max_batch (int): Most writes per transaction
+            max_delay_ms (float): Longest a write waits for others to join its batch
+            max_pending (int): Most writes queued at once
+            submit_timeout (float): Seconds a caller waits for queue space
+        """
+        self.bind = bind
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000
+        self.max_pending = max_pending
+        self.submit_timeout = submit_timeout
+        self.batches = 0
+        self.writes = 0
+        self._queue = None
+        self._worker = None
+
+    def start(self):
+        """Start the worker task on the running loop if it is not running."""
+        if self._worker is None:
+            self._queue = asyncio.Queue(self.max_pending)
+            self._worker = asyncio.create_task(self._run())
+
+    async def close(self):
+        """Flush the queued writes and stop the worker task."""
+        worker, self._worker = self._worker, None
+        if worker is not None:
+            await self._queue.put(None)
+            await worker
+
+    async def submit(self, kind, *args):
+        """
+        Queue one write.
+        
+        Returns:
+            asyncio.Future: Resolved with the write's result after its batch commits
+        
+        Raises:
+            RuntimeError: If the queue stays full for submit_timeout seconds
+        """
+        self.start()
+        write = PendingWrite(kind, args, asyncio.get_running_loop().create_future())
+        try:
+            await asyncio.wait_for(self._queue.put(write), self.submit_timeout)
+        except asyncio.TimeoutError:
+            raise RuntimeError("Write queue is full") from None
+        return write.future
+
+    async def insert(self, name, content):
+        """Insert one to-do task and wait for its row."""
+        return await (await self.submit("insert", name, content))
+
+    async def set_status(self, task_id, from_status, to_status):
+        """Change a task's status and wait for (row or None, whether the task exists)."""
+        return await (await self.submit("status", task_id, from_status, to_status))
+
+    async def _collect(self):
+        first = await self._queue.get()
+        if first is None:
+            return [], True
+        batch = [first]
+        deadline = time.monotonic() + self.max_delay
+        while len(batch) < self.max_batch:
+            try:
+                if self._queue.empty():
+                    write = await asyncio.wait_for(self._queue.get(), max(deadline - time.monotonic(), 0))
+                else:
+                    write = self._queue.get_nowait()
+            except asyncio.TimeoutError:
+                break
+            if write is None:
+                return batch, True
+            batch.append(write)
+        return batch, False
+
+    async def _run(self):
+        stopping = False
+        while not stopping:
+            batch, stopping = await self._collect()
+            if batch:
+                await self._flush(batch)
+        while not self._queue.empty():
+            write = self._queue.get_nowait()
+            if write is not None:
+                await self._flush([write])
+
+    async def _flush(self, batch):
+        try:
+            if self.bind is None:
+                session = get_async_session_context()
+            else:
+                from sqlmodel.ext.asyncio.session import AsyncSession
+                session = AsyncSession(self.bind, expire_on_commit=False)
+            async with session:
+                await apply_batch_async(session, batch)
+        except Exception as e:
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(e)
+            return
+        self.batches += 1
+        self.writes += len(batch)
+        for write in batch:
+            # A caller that was cancelled no longer waits for its result
+            if not write.future.done():
+                write.future.set_result(write.result)
+
+
+class GroupCommitStore(SQLTaskStore):
+    """
+    SQLTaskStore whose inserts and status changes go through a GroupCommitQueue.
+    
+    Use with the sync Manager: Manager(GroupCommitStore()). The caller's
+    session is not used for these writes (the queue's worker has its own);
+    every other method runs on it as usual.
+    """
+
+    def __init__(self, write_queue=None):
+        """
+        Args:
+            write_queue (Optional[GroupCommitQueue]): Queue to use, defaults to a new one
+        """
+        self.write_queue = write_queue or GroupCommitQueue()
+
+    def insert(self, session, name, content):
+        return self.write_queue.insert(name, content)
+
+    def set_status(self, session, task_id, from_status, to_status):
+        return self.write_queue.set_status(task_id, from_status, to_status)
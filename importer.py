@@ -0,0 +1,303 @@
+"""
+Bulk Task Importer
+
+Loads tasks from a CSV or JSONL file (one JSON object per line, e.g. the
+output of GET /tasks/export) into the database:
+
+    python importer.py tasks.jsonl [--format csv|jsonl] [--chunk-size 5000]
+        [--errors rejected.jsonl]
+
+Records need "name" and "content" fields; "status" ("Todo" or
+"Completed", default "Todo") is optional and any other field, such as an
+exported "id", is ignored. Every record is checked with the same rules as
+Manager.add_task (validators.py). Rejected records are written to an error
+file as JSON lines with their line number and the reason.
+
+The file is read and written in chunks, so memory use does not depend on
+the file size:
+- PostgreSQL: each chunk is loaded with COPY taskdb FROM STDIN
+- Other databases: each chunk is one executemany INSERT
+
+Each chunk is committed on its own, stamped with its own change version
+just before the commit (so clients of GET /tasks/sync pick imported tasks
+up); a progress line with the throughput
+so far is printed to stderr as the import runs.
+
+Imported rows bypass the Manager, so no TaskEvents are sent and a running
+API process's read cache and ETags do not see them until they expire
+(the same as writes from the CLI).
+
+Configuration (chunk size, progress interval): config.ImportSettings.
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from itertools import islice
+
+from sqlalchemy import insert
+
+from config import ImportSettings, load_settings
+from database import TaskDB, get_engine, init_db
+from logic import PENDING_VERSION, STATUS_VALUES, check_task_input, stamp_version
+from model import ImportResponse
+
+
+FORMATS = ("csv", "jsonl")
+
+# Accepted status spellings -> stored value
+STATUSES = {value.lower(): value for value in STATUS_VALUES.values()}
+
+COPY_STATEMENT = "COPY taskdb (name, content, status, row_version) FROM STDIN WITH (FORMAT csv)"
+
+
+def detect_format(path):
+    """
+    Pick the input format from a file name.
+    
+    Args:
+        path (str): Input file path
+    
+    Returns:
+        str: "csv" or "jsonl"
+    
+    Raises:
+        ValueError: If the extension is not recognised
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    raise ValueError(f"Cannot tell the format of {path}; pass --format csv or --format jsonl")
+
+
+def read_jsonl(file):
+    """
+    Read records from a JSONL file.
+    
+    Args:
+        file: Text file object
+    
+    Yields:
+        tuple: (line number, parsed object, or the raw line if it is not valid JSON)
+    """
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except ValueError:
+            yield line_number, line.rstrip("\n")
+
+
+def read_csv(file):
+    """
+    Read records from a CSV file with a header row.
+    
+    Args:
+        file: Text file object opened with newline=""
+    
+    Yields:
+        tuple: (line number the record ends on, dict of column values)
+    """
+    reader = csv.DictReader(file)
+    for record in reader:
+        yield reader.line_num, record
+
+
+def check_record(record):
+    """
+    Validate one input record and build its insert row.
+    
+    Args:
+        record: Parsed record (anything other than a dict is rejected)
+    
+    Returns:
+        tuple: (error message or None, row dict or None)
+    """
+    if not isinstance(record, dict):
+        return "Error: Record is not a JSON object.", None
+    name = record.get("name")
+    content = record.get("content")
+    if not isinstance(name, str) or not isinstance(content, str):
+        return "Error: Record needs text name and content fields.", None
+    error = check_task_input(name, content)
+    if error:
+        return error, None
+    status = record.get("status") or STATUS_VALUES["todo"]
+    if not isinstance(status, str) or status.lower() not in STATUSES:
+        return f"Error: Unknown status {status!r}.", None
+    return None, {"name": name, "content": content, "status": STATUSES[status.lower()]}
+
+
+def copy_rows(conn, rows):
+    """
+    Load rows with PostgreSQL COPY FROM STDIN (psycopg2 or psycopg 3).
+    
+    The rows are pending their change version (see logic.stamp_version).
+    
+    Args:
+        conn (Connection): Connection with an open transaction
+        rows (list): Insert rows from check_record
+    """
+    # The raw DBAPI cursor joins the transaction begun on conn
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow((row["name"], row["content"], row["status"], PENDING_VERSION))
+    buffer.seek(0)
+    cursor = conn.connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):
+            cursor.copy_expert(COPY_STATEMENT, buffer)
+        else:
+            with cursor.copy(COPY_STATEMENT) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
+
+
+def insert_rows(conn, rows):
+    """
+    Insert rows with one executemany INSERT, pending their change version.
+    
+    Args:
+        conn (Connection): Connection with an open transaction
+        rows (list): Insert rows from check_record
+    """
+    conn.execute(insert(TaskDB.__table__).values(row_version=PENDING_VERSION), rows)
+
+
+def chunk_writer(dialect):
+    """
+    Choose how chunks are written for a database.
+    
+    Args:
+        dialect (str): SQLAlchemy dialect name
+    
+    Returns:
+        callable: copy_rows for PostgreSQL, insert_rows otherwise
+    """
+    return copy_rows if dialect == "postgresql" else insert_rows
+
+
+class ErrorFile:
+    """
+    Rejected-record writer that only creates its file on the first rejection.
+    
+    Attributes:
+        path (str): File the rejections go to
+        count (int): Rejections written
+    """
+    def __init__(self, path):
+        self.path = path
+        self.count = 0
+        self._file = None
+
+    def write(self, line_number, error, record):
+        """Write one rejected record as a JSON line."""
+        if self._file is None:
+            self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write(json.dumps({"line": line_number, "error": error, "record": record}) + "\n")
+        self.count += 1
+
+    def close(self):
+        """Close the file if one was created."""
+        if self._file is not None:
+            self._file.close()
+
+
+def import_tasks(records, bind=None, chunk_size=5000, errors=None, progress=None, progress_every=2.0):
+    """
+    Validate and insert records in chunks.
+    
+    Args:
+        records (iterable): (line number, record) pairs from read_jsonl / read_csv
+        bind (Optional[Engine]): Engine to write to, defaults to the shared engine
+        chunk_size (int): Records per chunk (one COPY or executemany and one commit each)
+        errors (Optional[ErrorFile]): Where rejected records go (discarded if None)
+        progress (Optional[callable]): Called with a status line while importing
+        progress_every (float): Seconds between progress calls
+    
+    Returns:
+        ImportResponse: Counts and timing for the whole import
+    """
+    if bind is None:
+        init_db()
+        bind = get_engine()
+    write = chunk_writer(bind.dialect.name)
+    imported = rejected = 0
+    start = last_report = time.perf_counter()
+    records = iter(records)
+    with bind.connect() as conn:
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+            rows = []
+            for line_number, record in chunk:
+                error, row = check_record(record)
+                if error:
+                    rejected += 1
+                    if errors is not None:
+                        errors.write(line_number, error, record)
+                    continue
+                rows.append(row)
+            if rows:
+                with conn.begin():
+                    write(conn, rows)
+                    stamp_version(conn)
+                imported += len(rows)
+            now = time.perf_counter()
+            if progress is not None and now - last_report >= progress_every:
+                progress(f"{imported} imported, {rejected} rejected, "
+                         f"{imported / (now - start):.0f} tasks/s (line {chunk[-1][0]})")
+                last_report = now
+    seconds = time.perf_counter() - start
+    return ImportResponse(
+        success=True,
+        message=f"{imported} tasks imported, {rejected} rejected in {seconds:.1f}s "
+                f"({imported / seconds if seconds else 0:.0f} tasks/s)",
+        imported=imported,
+        rejected=rejected,
+        seconds=seconds,
+        error_file=errors.path if errors is not None and errors.count else None,
+    )
+
+
+def main():
+    settings = load_settings("import", ImportSettings)
+    parser = argparse.ArgumentParser(description="Import tasks from a CSV or JSONL file")
+    parser.add_argument("path", help="File to import")
+    parser.add_argument("--format", choices=FORMATS, help="Input format (default: from the file extension)")
+    parser.add_argument("--chunk-size", type=int, default=settings.chunk_size, help="Records per batch")
+    parser.add_argument("--errors", help="File for rejected records (default: <path>.rejected.jsonl)")
+    args = parser.parse_args()
+    if args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+    try:
+        file_format = args.format or detect_format(args.path)
+    except ValueError as e:
+        parser.error(str(e))
+
+    errors = ErrorFile(args.errors or f"{args.path}.rejected.jsonl")
+    try:
+        with open(args.path, encoding="utf-8", newline="" if file_format == "csv" else None) as file:
+            records = read_csv(file) if file_format == "csv" else read_jsonl(file)
+            response = import_tasks(records, chunk_size=args.chunk_size, errors=errors,
+                                    progress=lambda line: print(line, file=sys.stderr),
+                                    progress_every=settings.progress_every)
+    finally:
+        errors.close()
+    print(response.message)
+    if response.error_file:
+        print(f"Rejected records written to {response.error_file}")
+
+
+if __name__ == "__main__":
+    main()
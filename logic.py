@@ -7,14 +7,1008 @@ for tasks. It provides clean business logic separated from UI concerns.
 The Manager uses Pydantic response models for all return values:
 - OperationResponse: Single task operations
 - TaskListResponse: List operations
+- BulkOperationResponse: Bulk operations
+
+Every successful write is reported to the Manager's listeners as a
+TaskEvent, after the transaction commits.
+
+List methods support keyset pagination: results are ordered by task ID and
+an opaque cursor (the last ID of a page) is returned as next_cursor.
+
+List and search methods take fields=[...] to load only some task columns
+(e.g. ["name", "status"] for a listing that does not show descriptions);
+they then return PartialTaskSchema items with just those fields and the ID.
 
 This design makes it easy to integrate with FastAPI or other frameworks.
 """
 
-from model import task, OperationResponse, TaskListResponse, TaskSchema
-from validators import name_check, content_check, validate_id
-from database import TaskDB, get_session, create_db_and_tables
-from sqlmodel import select, Session
+import json
+from model import (OperationResponse, TaskListResponse, TaskSchema, BulkOperationResponse, BulkChangeResponse,
+                   SyncResponse, TaskStatsResponse, TaskEvent, TaskFilter, partial_task_model)
+from validators import name_error, content_error, validate_id
+from database import TaskDB, TaskTombstone, TaskVersion, init_db, settings, FTS_CONFIG
+from storage import TaskStore, MemoryTaskStore, STATUS_VALUES, encode_cursor, decode_cursor
+from sqlalchemy import and_, column, delete, func, literal_column, table, update
+from sqlalchemy.engine import make_url
+from sqlmodel import select, insert, Session
+
+
+# Status filters shared by list and export queries
+STATUS_FILTERS = {
+    "todo": TaskDB.status == "Todo",
+    "completed": TaskDB.status == "Completed",
+}
+
+# SQLite FTS5 table maintained by database.create_fulltext_index
+_FTS_TABLE = table("taskdb_fts", column("rowid"))
+
+
+def _fts_match_query(query):
+    """
+    Quote every word of a user query for SQLite FTS5 MATCH.
+    
+    Quoting stops FTS5 operators and stray punctuation in user input from
+    being parsed as query syntax; the words are ANDed, like plainto_tsquery.
+    
+    Args:
+        query (str): Raw search text
+        
+    Returns:
+        str: FTS5 query string
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in query.split())
+
+
+# ===== STATEMENT HELPERS =====
+# Shared by Manager and async_logic.AsyncManager so both issue the same SQL.
+
+def task_to_schema(t):
+    """
+    Convert a TaskDB row to a TaskSchema.
+    
+    Args:
+        t (TaskDB): Database row
+        
+    Returns:
+        TaskSchema: Task data
+    """
+    return TaskSchema(id=t.id, name=t.name, content=t.content, status=t.status)
+
+
+# Columns fetched by list, search and export queries. Selecting plain
+# columns instead of TaskDB entities skips ORM identity-map bookkeeping
+# and instrumented attribute access, which dominate the cost per row.
+TASK_COLUMNS = (TaskDB.id, TaskDB.name, TaskDB.content, TaskDB.status)
+
+# Field name -> column, for field projection (fields=...)
+TASK_FIELDS = {task_column.key: task_column for task_column in TASK_COLUMNS}
+
+
+def parse_fields(fields):
+    """
+    Normalize a field projection.
+    
+    Args:
+        fields (Optional[Iterable[str]]): Task fields to load ("id", "name",
+            "content", "status"), None for all
+        
+    Returns:
+        Optional[tuple]: Field names in column order, always including "id"
+            (page cursors are built from it); None if every field is selected
+        
+    Raises:
+        ValueError: If no field or an unknown field name is given
+    """
+    if fields is None:
+        return None
+    names = {name.strip() for name in fields if name.strip()}
+    if not names:
+        raise ValueError("No fields given")
+    unknown = names - TASK_FIELDS.keys()
+    if unknown:
+        raise ValueError(f"Unknown field: {', '.join(sorted(unknown))}")
+    names.add("id")
+    if len(names) == len(TASK_FIELDS):
+        return None
+    return tuple(name for name in TASK_FIELDS if name in names)
+
+
+def task_columns(fields=None):
+    """Get the columns to select for fields normalized by parse_fields."""
+    return TASK_COLUMNS if fields is None else tuple(TASK_FIELDS[name] for name in fields)
+
+
+def rows_to_schemas(rows, fields=None):
+    """
+    Convert rows selected with TASK_COLUMNS to TaskSchemas.
+    
+    Args:
+        rows (list): (id, name, content, status) rows, or rows of just the
+            given fields in order (selected with task_columns(fields))
+        fields (Optional[tuple]): Field projection from parse_fields
+        
+    Returns:
+        list: TaskSchema objects, validated once here and not again by the API;
+            PartialTaskSchema objects with only the given fields if fields is set
+    """
+    if fields is not None:
+        model = partial_task_model(fields)
+        return [model(**dict(zip(fields, row))) for row in rows]
+    return [TaskSchema(id=task_id, name=name, content=content, status=status)
+            for task_id, name, content, status in rows]
+
+
+def page_statement(condition=None, limit=None, after=None, fields=None):
+    """
+    Build the query for one page of tasks ordered by ID.
+    
+    Args:
+        condition: Optional SQL filter expression
+        limit (Optional[int]): Page size, None for all remaining tasks
+        after (Optional[str]): Cursor returned by a previous page
+        fields (Optional[tuple]): Field projection from parse_fields
+        
+    Returns:
+        Select: Query fetching limit + 1 TASK_COLUMNS rows (the extra row
+            signals another page), or only the projected columns
+        
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    statement = select(*task_columns(fields))
+    if condition is not None:
+        statement = statement.where(condition)
+    if after is not None:
+        after_id = decode_cursor(after)
+        if after_id is None:
+            raise ValueError("Invalid cursor")
+        statement = statement.where(TaskDB.id > after_id)
+    statement = statement.order_by(TaskDB.id)
+    if limit is not None:
+        # Fetch one extra row to know whether another page exists
+        statement = statement.limit(limit + 1)
+    return statement
+
+
+def page_result(tasks, limit=None, fields=None):
+    """
+    Trim a page fetched by page_statement and compute its next cursor.
+    
+    Args:
+        tasks (list): Rows returned by the page query
+        limit (Optional[int]): Page size used for the query
+        fields (Optional[tuple]): Field projection used for the query
+        
+    Returns:
+        tuple: (list of TaskSchema or PartialTaskSchema, next cursor or None)
+    """
+    next_cursor = None
+    if limit is not None and len(tasks) > limit:
+        tasks = tasks[:limit]
+        # The ID is the first column, projected or not
+        next_cursor = encode_cursor(tasks[-1][0])
+    return rows_to_schemas(tasks, fields), next_cursor
+
+
+def search_statement(query, dialect, limit, after=None, fields=None):
+    """
+    Build a ranked full-text search query for the given database dialect.
+    
+    Args:
+        query (str): Words to search for (all must match)
+        dialect (str): SQLAlchemy dialect name ("postgresql" or "sqlite")
+        limit (int): Page size
+        after (Optional[str]): Cursor returned by a previous page
+        fields (Optional[tuple]): Field projection from parse_fields
+        
+    Returns:
+        tuple: (query fetching limit + 1 rows, offset of the page)
+        
+    Raises:
+        ValueError: If the query is empty, the cursor is invalid or the
+            dialect has no full-text support
+    """
+    if not query or not query.strip():
+        raise ValueError("Search query must not be empty")
+    offset = 0
+    if after is not None:
+        offset = decode_cursor(after)
+        if offset is None:
+            raise ValueError("Invalid cursor")
+    
+    if dialect == "postgresql":
+        document = func.to_tsvector(literal_column(f"'{FTS_CONFIG}'::regconfig"),
+                                    TaskDB.name + literal_column("' '") + TaskDB.content)
+        tsquery = func.plainto_tsquery(literal_column(f"'{FTS_CONFIG}'::regconfig"), query)
+        statement = (select(*task_columns(fields))
+                     .where(document.op("@@")(tsquery))
+                     .order_by(func.ts_rank(document, tsquery).desc(), TaskDB.id))
+    elif dialect == "sqlite":
+        fts = literal_column("taskdb_fts")
+        statement = (select(*task_columns(fields))
+                     .join(_FTS_TABLE, _FTS_TABLE.c.rowid == TaskDB.id)
+                     .where(fts.op("MATCH")(_fts_match_query(query)))
+                     .order_by(func.bm25(fts), TaskDB.id))
+    else:
+        raise ValueError("Full-text search is not supported on this database")
+    return statement.offset(offset).limit(limit + 1), offset
+
+
+def search_response(tasks, limit, offset, fields=None):
+    """
+    Build the response for a page fetched by search_statement.
+    
+    Args:
+        tasks (list): Rows returned by the search query
+        limit (int): Page size used for the query
+        offset (int): Offset of the page
+        fields (Optional[tuple]): Field projection used for the query
+        
+    Returns:
+        TaskListResponse: Matching tasks, with next_cursor if more remain
+    """
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = encode_cursor(offset + limit)
+    tasks_data = rows_to_schemas(tasks, fields)
+    if not tasks_data:
+        return TaskListResponse(success=True, message="No matching tasks found", data=[])
+    return TaskListResponse(success=True, message="Matching tasks retrieved", data=tasks_data, next_cursor=next_cursor)
+
+
+
+def stats_statement():
+    """
+    Build the task count per status query.
+    
+    The GROUP BY is answered from the status index, without reading task rows.
+    
+    Returns:
+        Select: (status, count) rows
+    """
+    return select(TaskDB.status, func.count()).group_by(TaskDB.status)
+
+
+def stats_response(rows):
+    """
+    Build the statistics response from stats_statement rows.
+    
+    Args:
+        rows (list): (status, count) rows
+        
+    Returns:
+        TaskStatsResponse: Total, to-do and completed counts
+    """
+    counts = dict(rows)
+    return TaskStatsResponse(
+        success=True,
+        message="Task statistics retrieved",
+        total=sum(counts.values()),
+        todo=counts.get(STATUS_VALUES["todo"], 0),
+        completed=counts.get(STATUS_VALUES["completed"], 0),
+    )
+
+
+def count_statement(status=None, name=None):
+    """
+    Build a count of the tasks a list method returns.
+    
+    Args:
+        status (Optional[str]): "todo" or "completed" to filter
+        name (Optional[str]): Exact task name to filter
+        
+    Returns:
+        Select: Query returning one count
+    """
+    statement = select(func.count()).select_from(TaskDB)
+    if status is not None:
+        statement = statement.where(STATUS_FILTERS[status])
+    if name is not None:
+        statement = statement.where(TaskDB.name == name)
+    return statement
+
+def check_task_input(name, content):
+    """
+    Validate a new task's name and content.
+    
+    Args:
+        name (str): Task name
+        content (str): Task description
+        
+    Returns:
+        Optional[str]: Error message, None if both are valid
+    """
+    return name_error(name) or content_error(content)
+
+
+
+def check_task_edit(new_name=None, new_content=None):
+    """
+    Validate a task edit and collect the columns to change.
+    
+    Args:
+        new_name (Optional[str]): New task name
+        new_content (Optional[str]): New task content
+        
+    Returns:
+        tuple: (error message or None, dict of column values to set)
+    """
+    values = {}
+    if new_name:
+        error = name_error(new_name)
+        if error:
+            return error, values
+        values["name"] = new_name
+    if new_content:
+        error = content_error(new_content)
+        if error:
+            return error, values
+        values["content"] = new_content
+    return None, values
+
+
+def edit_values(new_name=None, new_content=None):
+    """
+    Collect the columns to change for an already validated task edit.
+    
+    Args:
+        new_name (Optional[str]): New task name
+        new_content (Optional[str]): New task content
+        
+    Returns:
+        dict: Column values to set
+    """
+    values = {}
+    if new_name:
+        values["name"] = new_name
+    if new_content:
+        values["content"] = new_content
+    return values
+
+
+def row_to_schema(row):
+    """
+    Convert one row selected or returned with TASK_COLUMNS to a TaskSchema.
+    
+    Args:
+        row: (id, name, content, status, ...) row
+        
+    Returns:
+        TaskSchema: Task data
+    """
+    return TaskSchema(id=row[0], name=row[1], content=row[2], status=row[3])
+
+
+# Messages for a status change: (task already had the status, changed), per target status
+STATUS_MESSAGES = {
+    "Completed": ("Task is already completed", "Task marked as completed"),
+    "Todo": ("Task is already marked as to-do", "Task marked as to-do"),
+}
+
+
+def status_response(task_schema, found, to_status):
+    """
+    Build the mark_completed / mark_todo response.
+    
+    Args:
+        task_schema (Optional[TaskSchema]): Changed task, None if nothing changed
+        found (bool): Whether the task exists
+        to_status (str): Status the task was moved to
+        
+    Returns:
+        OperationResponse: Changed task, or success=False if not found or
+            already in to_status
+    """
+    if not found:
+        return OperationResponse(success=False, message="Task not found")
+    already, changed = STATUS_MESSAGES[to_status]
+    if task_schema is None:
+        return OperationResponse(success=False, message=already)
+    return OperationResponse(success=True, message=changed, data=task_schema)
+
+
+def task_row_statement(task_id):
+    """
+    Build a primary-key lookup of one task's columns.
+    
+    Used as the cheap follow-up query that tells "not found" apart from
+    "not in the expected state" when a conditional write matches no row.
+    
+    Args:
+        task_id (int): Task ID
+        
+    Returns:
+        Select: Query returning TASK_COLUMNS, no row if the task does not exist
+    """
+    return select(*TASK_COLUMNS).where(TaskDB.id == task_id)
+
+
+# row_version of rows a transaction has written but not yet stamped (see stamp_version)
+PENDING_VERSION = -1
+
+
+def version_statement():
+    """
+    Build the statement that takes the next change version.
+    
+    It locks the TaskVersion row until commit, so transactions get versions
+    in commit order. Write transactions therefore take it last, in
+    stamp_version just before committing: the lock covers the stamp and the
+    commit, not the writes, so writers only queue on it for that final step.
+    
+    Returns:
+        Update: UPDATE ... RETURNING the new version
+    """
+    return (update(TaskVersion)
+            .where(TaskVersion.id == 1)
+            .values(value=TaskVersion.value + 1)
+            .returning(TaskVersion.value))
+
+
+def current_version_statement():
+    """
+    Build the read of the current change version.
+    
+    A primary-key lookup of the TaskVersion row: it takes no lock and only
+    sees versions of committed transactions.
+    
+    Returns:
+        Select: Query returning the last committed version
+    """
+    return select(TaskVersion.value).where(TaskVersion.id == 1)
+
+
+def version_values():
+    """
+    Column values that mark an updated row as pending its change version.
+    
+    Returns:
+        dict: row_version and updated_at values for UPDATE statements
+    """
+    return {"row_version": PENDING_VERSION, "updated_at": func.now()}
+
+
+def stamp_statement(version):
+    """
+    Build the update that gives a transaction's pending rows its version.
+    
+    Rows pending in other transactions are not visible to it (and on SQLite
+    there are none: writers are serialized), so it only stamps its own.
+    
+    Args:
+        version (int): Version from version_statement
+        
+    Returns:
+        Update: UPDATE of the rows with PENDING_VERSION (ix_taskdb_row_version)
+    """
+    return update(TaskDB).where(TaskDB.row_version == PENDING_VERSION).values(row_version=version)
+
+
+def stamp_version(conn, written=True, deleted=()):
+    """
+    Take the transaction's change version and stamp its writes, before commit.
+    
+    Args:
+        conn: Session or Connection of the write transaction
+        written (bool): Whether it inserted or updated task rows (pending rows to stamp)
+        deleted (list): Rows returned by its DELETE ... RETURNING TASK_COLUMNS,
+            which get tombstones
+        
+    Returns:
+        int: The transaction's change version
+    """
+    version = conn.execute(version_statement()).scalar_one()
+    if written:
+        conn.execute(stamp_statement(version))
+    if deleted:
+        conn.execute(insert(TaskTombstone), tombstone_rows(deleted, version))
+    return version
+
+
+def tombstone_rows(rows, version):
+    """
+    Build TaskTombstone insert rows for deleted tasks.
+    
+    Args:
+        rows (list): Rows returned by a DELETE ... RETURNING TASK_COLUMNS
+        version (int): Version of the deleting transaction
+        
+    Returns:
+        list: {"task_id", "row_version"} dicts
+    """
+    return [{"task_id": row[0], "row_version": version} for row in rows]
+
+
+def status_update_statement(task_id, from_status, to_status):
+    """
+    Build a conditional status change.
+    
+    The status check and the write are one statement, so two concurrent
+    callers cannot both change the same task.
+    
+    Args:
+        task_id (int): Task ID
+        from_status (str): Status the task must currently have
+        to_status (str): New status
+        
+    Returns:
+        Update: UPDATE ... RETURNING TASK_COLUMNS; no row if the task does not
+            exist or does not have from_status
+    """
+    return (update(TaskDB)
+            .where(TaskDB.id == task_id, TaskDB.status == from_status)
+            .values(status=to_status, **version_values())
+            .returning(*TASK_COLUMNS))
+
+
+def edit_returns_previous(dialect):
+    """
+    Check whether edit_statement also returns the pre-update values.
+    
+    PostgreSQL can read the old row in a CTE of the same statement. SQLite's
+    RETURNING only sees the new row and cannot reference other tables, so
+    the caller must read the previous values first with task_row_statement.
+    
+    Args:
+        dialect (str): SQLAlchemy dialect name
+        
+    Returns:
+        bool: True if edit_statement rows include previous_name and previous_content
+    """
+    return dialect == "postgresql"
+
+
+def edit_statement(task_id, values, dialect):
+    """
+    Build a single UPDATE ... RETURNING for a task edit.
+    
+    Args:
+        task_id (int): Task ID
+        values (dict): Column values to set, from check_task_edit
+        dialect (str): SQLAlchemy dialect name
+        
+    Returns:
+        Update: Statement returning TASK_COLUMNS (followed by previous_name and
+            previous_content if edit_returns_previous(dialect)); no row if the
+            task does not exist
+    """
+    values = {**values, **version_values()}
+    if edit_returns_previous(dialect):
+        # Lock and read the current row in the same statement as the update
+        previous = (select(TaskDB.id, TaskDB.name, TaskDB.content)
+                    .where(TaskDB.id == task_id)
+                    .with_for_update()
+                    .cte("previous"))
+        return (update(TaskDB)
+                .where(TaskDB.id == previous.c.id)
+                .values(values)
+                .returning(*TASK_COLUMNS, previous.c.name.label("previous_name"),
+                           previous.c.content.label("previous_content"))
+                .execution_options(synchronize_session="fetch"))
+    return update(TaskDB).where(TaskDB.id == task_id).values(values).returning(*TASK_COLUMNS)
+
+
+def delete_statement(task_id):
+    """
+    Build a DELETE ... RETURNING for one task.
+    
+    Args:
+        task_id (int): Task ID
+        
+    Returns:
+        Delete: Statement returning the deleted task's TASK_COLUMNS; no row if
+            the task does not exist
+    """
+    return delete(TaskDB).where(TaskDB.id == task_id).returning(*TASK_COLUMNS)
+
+
+def selection_condition(selection):
+    """
+    Build the WHERE condition selecting the tasks of a bulk operation.
+    
+    Args:
+        selection: List of task IDs, or a TaskFilter
+        
+    Returns:
+        SQL condition
+        
+    Raises:
+        ValueError: If the ID list is empty or the filter sets no criteria
+    """
+    if isinstance(selection, TaskFilter):
+        conditions = []
+        if selection.status is not None:
+            conditions.append(STATUS_FILTERS[selection.status])
+        if selection.name is not None:
+            conditions.append(TaskDB.name == selection.name)
+        if not conditions:
+            raise ValueError("Filter must set status or name")
+        return and_(*conditions)
+    if not selection:
+        raise ValueError("No task IDs given")
+    return TaskDB.id.in_(selection)
+
+
+def bulk_status_statement(selection, from_status, to_status):
+    """
+    Build a set-based status change for many tasks.
+    
+    Args:
+        selection: List of task IDs, or a TaskFilter
+        from_status (str): Status the tasks must currently have
+        to_status (str): New status
+        
+    Returns:
+        Update: UPDATE ... RETURNING TASK_COLUMNS, one row per changed task
+        
+    Raises:
+        ValueError: If the selection is empty
+    """
+    return (update(TaskDB)
+            .where(selection_condition(selection), TaskDB.status == from_status)
+            .values(status=to_status, **version_values())
+            .returning(*TASK_COLUMNS))
+
+
+def bulk_delete_statement(selection):
+    """
+    Build a set-based delete of many tasks.
+    
+    Args:
+        selection: List of task IDs, or a TaskFilter
+        
+    Returns:
+        Delete: DELETE ... RETURNING TASK_COLUMNS, one row per deleted task
+        
+    Raises:
+        ValueError: If the selection is empty
+    """
+    return delete(TaskDB).where(selection_condition(selection)).returning(*TASK_COLUMNS)
+
+
+def bulk_change_response(selection, rows, verb):
+    """
+    Build the response for a bulk status change or delete.
+    
+    Args:
+        selection: List of task IDs, or a TaskFilter
+        rows (list): Rows returned by the statement
+        verb (str): Past participle for the message (e.g. "deleted")
+        
+    Returns:
+        BulkChangeResponse: Changed IDs, and requested IDs that were skipped
+    """
+    ids = [row[0] for row in rows]
+    skipped = []
+    if not isinstance(selection, TaskFilter):
+        changed = set(ids)
+        skipped = [task_id for task_id in dict.fromkeys(selection) if task_id not in changed]
+    return BulkChangeResponse(success=True, message=f"{len(ids)} tasks {verb}", count=len(ids), ids=ids, skipped=skipped)
+
+def prepare_bulk_rows(items):
+    """
+    Validate a batch of new tasks and build insert rows for the valid ones.
+    
+    Args:
+        items (list): Objects with name and content attributes
+        
+    Returns:
+        tuple: (per-item results with failures filled in, insert rows,
+            input positions of the rows)
+    """
+    results = [None] * len(items)
+    rows = []
+    positions = []
+    for i, item in enumerate(items):
+        error = check_task_input(item.name, item.content)
+        if error:
+            results[i] = OperationResponse(success=False, message=error)
+            continue
+        rows.append({"name": item.name, "content": item.content, "status": "Todo"})
+        positions.append(i)
+    return results, rows, positions
+
+
+def insert_rows_statement():
+    """
+    Build a multi-row insert for rows from prepare_bulk_rows.
+    
+    The rows are pending their change version (see stamp_version).
+    
+    Returns:
+        Insert: INSERT ... RETURNING TASK_COLUMNS, executed with a list of
+            {"name", "content", "status"} dicts; rows come back in input order
+    """
+    return (insert(TaskDB).values(row_version=PENDING_VERSION)
+            .returning(*TASK_COLUMNS, sort_by_parameter_order=True))
+
+
+def bulk_response(results, positions, created):
+    """
+    Fill in per-item results for inserted tasks and build the batch response.
+    
+    Args:
+        results (list): Results from prepare_bulk_rows
+        positions (list): Input positions of the inserted rows
+        created (list): TaskDB rows returned by INSERT ... RETURNING, in row order
+        
+    Returns:
+        BulkOperationResponse: One OperationResponse per item, in input order
+    """
+    for i, t in zip(positions, created):
+        results[i] = OperationResponse(success=True, message="Task added successfully", data=task_to_schema(t))
+    return BulkOperationResponse(
+        success=True,
+        message=f"{len(created)} of {len(results)} tasks added",
+        created=len(created),
+        results=results,
+    )
+
+
+def export_statement(status=None, chunk_size=1000):
+    """
+    Build the streaming query used by export_tasks.
+    
+    Args:
+        status (Optional[str]): "todo" or "completed" to filter, None for all tasks
+        chunk_size (int): Rows fetched per round trip
+        
+    Returns:
+        Select: Column query with yield_per set (server-side cursor)
+        
+    Raises:
+        ValueError: If status is not a known filter
+    """
+    statement = select(*TASK_COLUMNS)
+    if status is not None:
+        if status not in STATUS_FILTERS:
+            raise ValueError(f"Unknown status filter: {status}")
+        statement = statement.where(STATUS_FILTERS[status])
+    return statement.order_by(TaskDB.id).execution_options(yield_per=chunk_size)
+
+
+def ndjson_chunk(rows):
+    """
+    Encode exported rows as newline-delimited JSON.
+    
+    Args:
+        rows (list): Rows with id, name, content and status
+        
+    Returns:
+        bytes: One JSON object per line
+    """
+    lines = [json.dumps({"id": r.id, "name": r.name, "content": r.content, "status": r.status}) for r in rows]
+    return ("\n".join(lines) + "\n").encode()
+
+
+def changes_statements(since, limit=None, upto=None):
+    """
+    Build the delta sync queries.
+    
+    Args:
+        since (int): Only changes with a higher version
+        limit (Optional[int]): Most rows per query
+        upto (Optional[int]): Only changes up to this version
+        
+    Returns:
+        tuple: (Select of TASK_COLUMNS and row_version for tasks written after
+            since, Select of task_id and row_version for tasks deleted after
+            since), both ordered by version
+    """
+    tasks = (select(*TASK_COLUMNS, TaskDB.row_version)
+             .where(TaskDB.row_version > since)
+             .order_by(TaskDB.row_version, TaskDB.id))
+    tombstones = (select(TaskTombstone.task_id, TaskTombstone.row_version)
+                  .where(TaskTombstone.row_version > since)
+                  .order_by(TaskTombstone.row_version, TaskTombstone.id))
+    if upto is not None:
+        tasks = tasks.where(TaskDB.row_version <= upto)
+        tombstones = tombstones.where(TaskTombstone.row_version <= upto)
+    if limit is not None:
+        tasks = tasks.limit(limit)
+        tombstones = tombstones.limit(limit)
+    return tasks, tombstones
+
+
+def sync_window(tasks, tombstones, since, limit):
+    """
+    Pick the versions one sync page covers.
+    
+    A page never ends inside a version, so a client that continues from the
+    page's version misses nothing.
+    
+    Args:
+        tasks (list): Changed task rows, fetched with limit + 1
+        tombstones (list): Tombstone rows, fetched with limit + 1
+        since (int): Version the page starts after
+        limit (int): Target number of changes per page
+        
+    Returns:
+        tuple: (last version of the page, whether more changes follow,
+            whether that version must be refetched in full because it alone
+            holds more than limit changes)
+    """
+    versions = sorted([row.row_version for row in tasks] + [row.row_version for row in tombstones])
+    if len(versions) <= limit:
+        return (versions[-1] if versions else max(since, 0)), False, False
+    boundary = versions[limit]
+    if boundary == versions[0]:
+        return boundary, True, True
+    return boundary - 1, True, False
+
+
+def sync_response(tasks, tombstones, version, has_more):
+    """
+    Build a delta sync response.
+    
+    A deleted ID that was reused by a task created later (SQLite can reuse
+    the highest ID) is reported as changed, not deleted.
+    
+    Args:
+        tasks (list): Changed task rows
+        tombstones (list): Tombstone rows
+        version (int): Last version the response covers
+        has_more (bool): Whether more changes follow
+        
+    Returns:
+        SyncResponse: Changed tasks and deleted IDs up to version
+    """
+    changed = [row_to_schema(row) for row in tasks if row.row_version <= version]
+    changed_ids = {t.id for t in changed}
+    deleted = list(dict.fromkeys(row.task_id for row in tombstones
+                                 if row.row_version <= version and row.task_id not in changed_ids))
+    return SyncResponse(success=True, message=f"{len(changed)} tasks changed, {len(deleted)} deleted",
+                        version=version, changed=changed, deleted=deleted, has_more=has_more)
+
+
+class SQLTaskStore(TaskStore):
+    """
+    TaskStore on a SQLModel session, issuing the statements built above.
+    
+    Works on any supported database: dialect-specific statements (search,
+    edits) follow the session's dialect. Writes are stamped with their change
+    version last (stamp_version) and committed here.
+    """
+    dialect = None
+
+    def _dialect(self, session):
+        return self.dialect or session.get_bind().dialect.name
+
+    def _commit(self, session, written=True, deleted=()):
+        stamp_version(session, written, deleted)
+        session.commit()
+
+    def get(self, session, task_id):
+        return session.get(TaskDB, task_id)
+
+    def find_by_name(self, session, name):
+        return session.exec(select(TaskDB).where(TaskDB.name == name)).all()
+
+    def list_page(self, session, status=None, name=None, limit=None, after=None, fields=None):
+        conditions = []
+        if status is not None:
+            conditions.append(STATUS_FILTERS[status])
+        if name is not None:
+            conditions.append(TaskDB.name == name)
+        condition = and_(*conditions) if len(conditions) > 1 else (conditions[0] if conditions else None)
+        return session.execute(page_statement(condition, limit, after, fields)).all()
+
+    def search(self, session, query, limit, after=None, fields=None):
+        statement, offset = search_statement(query, self._dialect(session), limit, after, fields)
+        return session.execute(statement).all(), offset
+
+    def insert(self, session, name, content):
+        row = session.execute(insert(TaskDB)
+                              .values(name=name, content=content, status=STATUS_VALUES["todo"],
+                                      row_version=PENDING_VERSION)
+                              .returning(*TASK_COLUMNS)).one()
+        self._commit(session)
+        return row
+
+    def insert_many(self, session, rows):
+        created = session.execute(insert_rows_statement(), rows).all()
+        self._commit(session)
+        return created
+
+    def update(self, session, task_id, values):
+        dialect = self._dialect(session)
+        previous = None
+        if not values or not edit_returns_previous(dialect):
+            previous = session.exec(task_row_statement(task_id)).first()
+            if previous is None:
+                return None
+            if not values:
+                return previous, previous
+        row = session.execute(edit_statement(task_id, values, dialect)).first()
+        if row is None:
+            session.rollback()
+            return None
+        self._commit(session)
+        if previous is None:
+            previous = (row[0], row.previous_name, row.previous_content, row[3])
+        return row, previous
+
+    def set_status(self, session, task_id, from_status, to_status):
+        row = session.execute(status_update_statement(task_id, from_status, to_status)).first()
+        if row is None:
+            session.rollback()
+            return None, session.exec(task_row_statement(task_id)).first() is not None
+        self._commit(session)
+        return row, True
+
+    def delete(self, session, task_id):
+        row = session.execute(delete_statement(task_id)).first()
+        if row is None:
+            session.rollback()
+            return None
+        self._commit(session, written=False, deleted=[row])
+        return row
+
+    def set_status_many(self, session, selection, from_status, to_status):
+        rows = session.execute(bulk_status_statement(selection, from_status, to_status)).all()
+        if not rows:
+            # Nothing changed: no version to take
+            session.rollback()
+            return rows
+        self._commit(session)
+        return rows
+
+    def delete_many(self, session, selection):
+        rows = session.execute(bulk_delete_statement(selection)).all()
+        if not rows:
+            session.rollback()
+            return rows
+        self._commit(session, written=False, deleted=rows)
+        return rows
+
+    def changes(self, session, since, limit=None, upto=None):
+        tasks, tombstones = changes_statements(since, limit, upto)
+        return session.execute(tasks).all(), session.execute(tombstones).all()
+
+    def stats(self, session):
+        return session.exec(stats_statement()).all()
+
+    def version(self, session):
+        return session.exec(current_version_statement()).one()
+
+    def count(self, session, status=None, name=None):
+        return session.exec(count_statement(status, name)).one()
+
+    def export(self, session, status=None, chunk_size=1000):
+        return session.execute(export_statement(status, chunk_size)).partitions()
+
+
+class PostgresTaskStore(SQLTaskStore):
+    """SQLTaskStore for PostgreSQL (GIN full-text search, edits returning the previous values)."""
+    dialect = "postgresql"
+
+
+class SQLiteTaskStore(SQLTaskStore):
+    """SQLTaskStore for SQLite (FTS5 search, edits read the previous values first)."""
+    dialect = "sqlite"
+
+
+# TaskStore class for each database URL backend
+STORES = {
+    "postgresql": PostgresTaskStore,
+    "sqlite": SQLiteTaskStore,
+    "memory": MemoryTaskStore,
+}
+
+
+def create_store(url=None):
+    """
+    Create the TaskStore for a database URL.
+    
+    Args:
+        url (Optional[str]): Database URL, defaults to the configured one;
+            memory:// selects the in-memory store
+        
+    Returns:
+        TaskStore: Store for the URL's backend (SQLTaskStore if it has no dedicated store)
+    """
+    return STORES.get(make_url(url or settings.url).get_backend_name(), SQLTaskStore)()
 
 
 class Manager:
@@ -22,7 +1016,8 @@ class Manager:
     Task management service - handles all business logic.
     
     Responsibilities:
-    - Store and manage tasks in memory (self.storage)
+    - Store and manage tasks through a TaskStore (self.storage): SQL
+      databases by default, or the in-memory engine from storage.py
     - Provide CRUD operations (Create, Read, Update, Delete)
     - Validate input data
     - Return structured Pydantic responses
@@ -30,14 +1025,49 @@ class Manager:
     Pure business logic - no input/output or UI concerns.
     """
 
-    def __init__(self):
+    def __init__(self, storage=None):
         """
         Initialize the Manager.
         
-        Sets up database connection and creates tables if needed.
+        Does not touch the database: the schema is created once per process
+        by init(), or by the first database.get_session_context() call.
+        
+        Args:
+            storage (Optional[TaskStore]): Where tasks are kept; defaults to an
+                SQLTaskStore on the sessions passed to each method. With a
+                MemoryTaskStore, session arguments may be None.
+        """
+        self.listeners = []
+        self.storage = storage or SQLTaskStore()
+
+    def init(self):
+        """
+        Initialize the database for this manager.
+        
+        Creates tables and indexes if needed, once per process. Nothing to
+        do for the in-memory store.
+        """
+        if isinstance(self.storage, SQLTaskStore):
+            init_db()
+
+    def add_listener(self, listener):
         """
-        # Initialize database on first run
-        create_db_and_tables()
+        Register a callable to be notified of every committed write.
+        
+        Listeners run synchronously in the writing thread and must be cheap.
+        
+        Args:
+            listener (callable): Called with one TaskEvent per changed task
+        """
+        self.listeners.append(listener)
+
+    def _notify(self, kind, task_id, data=None, previous=None):
+        """Send a TaskEvent to every listener."""
+        if not self.listeners:
+            return
+        event = TaskEvent(kind=kind, task_id=task_id, data=data, previous=previous)
+        for listener in self.listeners:
+            listener(event)
 
     # ===== SEARCH METHODS =====
     
@@ -50,10 +1080,9 @@ class Manager:
             session (Session): Database session
             
         Returns:
-            TaskDB: Task object if found, None otherwise
+            Task object (TaskDB, or model.task for the in-memory store) if found, None otherwise
         """
-        task = session.get(TaskDB, task_id)
-        return task
+        return self.storage.get(session, task_id)
 
     def search_by_name(self, name, session: Session):
         """
@@ -64,100 +1093,222 @@ class Manager:
             session (Session): Database session
             
         Returns:
-            list: List of TaskDB objects matching the name
+            list: List of task objects matching the name
+        """
+        return self.storage.find_by_name(session, name)
+
+    def _list_tasks(self, session: Session, status=None, name=None, limit=None, after=None, fields=None):
+        """
+        Fetch one page of tasks ordered by ID.
+        
+        Args:
+            session (Session): Database session
+            status (Optional[str]): "todo" or "completed" to filter
+            name (Optional[str]): Exact task name to filter
+            limit (Optional[int]): Page size, None for all remaining tasks
+            after (Optional[str]): Cursor returned by a previous page
+            fields (Optional[list]): Task fields to load (see parse_fields), None for all
+            
+        Returns:
+            tuple: (list of TaskSchema or PartialTaskSchema, next cursor or None)
+            
+        Raises:
+            ValueError: If the cursor or a field name is invalid
+        """
+        fields = parse_fields(fields)
+        tasks = self.storage.list_page(session, status, name, limit, after, fields)
+        return page_result(tasks, limit, fields)
+
+    def get_tasks_by_name(self, name, session: Session, limit=None, after=None, fields=None):
+        """
+        Retrieve tasks matching a name from database, one page at a time.
+        
+        Args:
+            name (str): Task name to search for (exact match)
+            session (Session): Database session
+            limit (Optional[int]): Page size, None for all tasks
+            after (Optional[str]): Cursor returned by a previous page
+            fields (Optional[list]): Task fields to load (see parse_fields), None for all
+            
+        Returns:
+            TaskListResponse: Matching tasks ordered by ID, with next_cursor if more remain
+        """
+        try:
+            tasks_data, next_cursor = self._list_tasks(session, name=name, limit=limit, after=after, fields=fields)
+        except ValueError as e:
+            return TaskListResponse(success=False, message=str(e))
+        return TaskListResponse(success=True, message="Tasks retrieved", data=tasks_data, next_cursor=next_cursor)
+
+    def search(self, query, session: Session, limit=20, after=None, fields=None):
+        """
+        Full-text search over task name and content, best matches first.
+        
+        Uses the GIN tsvector index on PostgreSQL and the FTS5 table on SQLite
+        (see database.create_fulltext_index); the in-memory store scans all
+        tasks. Results are ranked, so the
+        cursor encodes an offset into the ranking rather than a task ID.
+        
+        Args:
+            query (str): Words to search for (all must match)
+            session (Session): Database session
+            limit (int): Page size
+            after (Optional[str]): Cursor returned by a previous page
+            fields (Optional[list]): Task fields to load (see parse_fields), None for all
+            
+        Returns:
+            TaskListResponse: Matching tasks ordered by rank, with next_cursor if more remain;
+                success=False if the query is empty, the cursor or a field name is
+                invalid or the database has no full-text support
         """
-        tasks = session.exec(select(TaskDB).where(TaskDB.name == name)).all()
-        return tasks
+        try:
+            fields = parse_fields(fields)
+            tasks, offset = self.storage.search(session, query, limit, after, fields)
+        except ValueError as e:
+            return TaskListResponse(success=False, message=str(e))
+        return search_response(tasks, limit, offset, fields)
 
     # ===== CRUD METHODS =====
     
-    def add_task(self, name, content, session: Session):
+    def add_task(self, name, content, session: Session, validated=False):
         """
         Create and add a new task to database.
         
-        Validates name and content before creation.
+        Validates name and content before creation, unless the caller
+        already did (e.g. through TaskCreate at the API boundary).
         Auto-increments task ID via database.
         
         Args:
             name (str): Task name (1-50 characters)
             content (str): Task description (1-500 characters)
             session (Session): Database session
+            validated (bool): Skip the checks, name and content are known to be valid
             
         Returns:
             OperationResponse: 
                 - success=True with created TaskSchema if successful
                 - success=False with error message if validation fails
         """
-        name_validation = name_check(name)
-        if not name_validation.success:
-            return OperationResponse(success=False, message=name_validation.message)
+        if not validated:
+            error = check_task_input(name, content)
+            if error:
+                return OperationResponse(success=False, message=error)
+        
+        return self._task_added(self.storage.insert(session, name, content))
+
+    def _task_added(self, row):
+        """Notify listeners of a created task row and build the add_task response."""
+        task_schema = row_to_schema(row)
+        self._notify("created", task_schema.id, task_schema)
+        return OperationResponse(success=True, message="Task added successfully", data=task_schema)
+
+    def add_tasks(self, items, session: Session):
+        """
+        Create and add many tasks to database in a single transaction.
         
-        content_validation = content_check(content)
-        if not content_validation.success:
-            return OperationResponse(success=False, message=content_validation.message)
+        Every item is validated with the same rules as add_task. Valid items
+        are inserted with one multi-row INSERT ... RETURNING statement (one
+        store call) and committed once; invalid items are skipped and
+        reported in the results.
         
-        # Database operation
-        new_task = TaskDB(name=name, content=content, status="Todo")
-        session.add(new_task)
-        session.commit()
-        session.refresh(new_task)
+        Args:
+            items (list): Objects with name and content attributes (e.g. BulkTaskItem)
+            session (Session): Database session
+            
+        Returns:
+            BulkOperationResponse: One OperationResponse per item, in input order
+        """
+        results, rows, positions = prepare_bulk_rows(items)
+        if not rows:
+            return bulk_response(results, positions, [])
         
-        task_schema = TaskSchema(id=new_task.id, name=new_task.name, content=new_task.content, status=new_task.status)
-        return OperationResponse(success=True, message="Task added successfully", data=task_schema)
+        created = self.storage.insert_many(session, rows)
+        response = bulk_response(results, positions, created)
+        for i in positions:
+            self._notify("created", results[i].data.id, results[i].data)
+        return response
 
-    def get_all_tasks(self, session: Session):
+    def get_all_tasks(self, session: Session, limit=None, after=None, fields=None):
         """
-        Retrieve all tasks from database.
+        Retrieve all tasks from database, one page at a time.
         
         Args:
             session (Session): Database session
+            limit (Optional[int]): Page size, None for all tasks
+            after (Optional[str]): Cursor returned by a previous page
+            fields (Optional[list]): Task fields to load (see parse_fields), None for all
             
         Returns:
-            TaskListResponse: Always succeeds, returns all tasks (empty list if none)
+            TaskListResponse: Tasks ordered by ID (empty list if none), with
+                next_cursor set if more remain; success=False if the cursor or
+                a field name is invalid
         """
-        tasks = session.exec(select(TaskDB)).all()
-        tasks_data = [TaskSchema(id=t.id, name=t.name, content=t.content, status=t.status) for t in tasks]
-        return TaskListResponse(success=True, message="Tasks retrieved", data=tasks_data)
+        try:
+            tasks_data, next_cursor = self._list_tasks(session, limit=limit, after=after, fields=fields)
+        except ValueError as e:
+            return TaskListResponse(success=False, message=str(e))
+        return TaskListResponse(success=True, message="Tasks retrieved", data=tasks_data, next_cursor=next_cursor)
 
-    def update_task(self, task_id, new_name=None, new_content=None, session: Session = None):
+    def update_task(self, task_id, new_name=None, new_content=None, session: Session = None, validated=False):
         """
         Update an existing task's name and/or content in database.
         
         Validates new values before updating.
         At least one of new_name or new_content must be provided.
         
+        The change is a single UPDATE ... RETURNING; on databases that cannot
+        return the previous values from it (SQLite), they are read first.
+        
         Args:
             task_id (int): ID of task to update
             new_name (Optional[str]): New task name
             new_content (Optional[str]): New task content
             session (Session): Database session
+            validated (bool): Skip the checks, the new values are known to be valid
             
         Returns:
             OperationResponse:
                 - success=True with updated TaskSchema if successful
                 - success=False with error message if task not found or validation fails
         """
-        task = session.get(TaskDB, task_id)
-        if task is None:
-            return OperationResponse(success=False, message="Task not found")
-        
-        if new_name:
-            name_validation = name_check(new_name)
-            if not name_validation.success:
-                return OperationResponse(success=False, message=name_validation.message)
-            task.name = new_name
+        if validated:
+            values = edit_values(new_name, new_content)
+        else:
+            error, values = check_task_edit(new_name, new_content)
+            if error:
+                return OperationResponse(success=False, message=error)
         
-        if new_content:
-            content_validation = content_check(new_content)
-            if not content_validation.success:
-                return OperationResponse(success=False, message=content_validation.message)
-            task.content = new_content
+        changed = self.storage.update(session, task_id, values)
+        if changed is None:
+            return OperationResponse(success=False, message="Task not found")
+        task_schema = row_to_schema(changed[0])
+        if values:
+            self._notify("updated", task_schema.id, task_schema, row_to_schema(changed[1]))
+        return OperationResponse(success=True, message="Task updated successfully", data=task_schema)
+
+    def _change_status(self, task_id, from_status, to_status, session: Session):
+        """
+        Move a task from one status to another with a conditional UPDATE.
         
-        session.commit()
-        session.refresh(task)
+        Args:
+            task_id (int): ID of task to change
+            from_status (str): Status the task must currently have
+            to_status (str): New status
+            session (Session): Database session
+            
+        Returns:
+            tuple: (updated TaskSchema or None, whether the task exists)
+        """
+        row, found = self.storage.set_status(session, task_id, from_status, to_status)
+        return self._status_changed(row, found, from_status)
+
+    def _status_changed(self, row, found, from_status):
+        """Notify listeners of a status change row: (TaskSchema or None, whether the task exists)."""
+        if row is None:
+            return None, found
         
-        task_schema = TaskSchema(id=task.id, name=task.name, content=task.content, status=task.status)
-        return OperationResponse(success=True, message="Task updated successfully", data=task_schema)
+        task_schema = row_to_schema(row)
+        self._notify("status_changed", task_schema.id, task_schema, task_schema.model_copy(update={"status": from_status}))
+        return task_schema, True
 
     def mark_completed(self, task_id, session: Session):
         """
@@ -172,18 +1323,7 @@ class Manager:
                 - success=True with updated TaskSchema if successful
                 - success=False with error message if task not found or already completed
         """
-        task = session.get(TaskDB, task_id)
-        if task is None:
-            return OperationResponse(success=False, message="Task not found")
-        if task.status == "Completed":
-            return OperationResponse(success=False, message="Task is already completed")
-        
-        task.status = "Completed"
-        session.commit()
-        session.refresh(task)
-        
-        task_schema = TaskSchema(id=task.id, name=task.name, content=task.content, status=task.status)
-        return OperationResponse(success=True, message="Task marked as completed", data=task_schema)
+        return status_response(*self._change_status(task_id, "Todo", "Completed", session), "Completed")
 
     def mark_todo(self, task_id, session: Session):
         """
@@ -198,18 +1338,7 @@ class Manager:
                 - success=True with updated TaskSchema if successful
                 - success=False with error message if task not found or already to-do
         """
-        task = session.get(TaskDB, task_id)
-        if task is None:
-            return OperationResponse(success=False, message="Task not found")
-        if task.status == "Todo":
-            return OperationResponse(success=False, message="Task is already marked as to-do")
-        
-        task.status = "Todo"
-        session.commit()
-        session.refresh(task)
-        
-        task_schema = TaskSchema(id=task.id, name=task.name, content=task.content, status=task.status)
-        return OperationResponse(success=True, message="Task marked as to-do", data=task_schema)
+        return status_response(*self._change_status(task_id, "Completed", "Todo", session), "Todo")
 
     def delete_task(self, task_id, session: Session):
         """
@@ -224,44 +1353,183 @@ class Manager:
                 - success=True if deletion successful
                 - success=False with error message if task not found
         """
-        task = session.get(TaskDB, task_id)
-        if task is None:
+        row = self.storage.delete(session, task_id)
+        if row is None:
             return OperationResponse(success=False, message="Task not found")
-        
-        session.delete(task)
-        session.commit()
+        self._notify("deleted", task_id, previous=row_to_schema(row))
         return OperationResponse(success=True, message="Task deleted successfully")
 
-    def get_completed_tasks(self, session: Session):
+    def get_stats(self, session: Session):
         """
-        Retrieve all completed tasks from database.
+        Count tasks by status with one aggregate query.
         
         Args:
             session (Session): Database session
             
         Returns:
-            TaskListResponse: List of all tasks with status "Completed"
+            TaskStatsResponse: Total, to-do and completed counts
         """
-        tasks = session.exec(select(TaskDB).where(TaskDB.status == "Completed")).all()
-        tasks_data = [TaskSchema(id=t.id, name=t.name, content=t.content, status=t.status) for t in tasks]
+        return stats_response(self.storage.stats(session))
+
+    def count_tasks(self, session: Session, status=None, name=None):
+        """
+        Count the tasks a list method would return across all pages.
+        
+        Args:
+            session (Session): Database session
+            status (Optional[str]): "todo" or "completed" to filter
+            name (Optional[str]): Exact task name to filter
+            
+        Returns:
+            int: Number of matching tasks
+        """
+        return self.storage.count(session, status, name)
+
+    def change_version(self, session: Session):
+        """
+        Get the current change version: that of the last committed write.
+        
+        Every write through any process bumps it, so it can serve as a
+        validator for anything read from the tasks table.
+        
+        Args:
+            session (Session): Database session
+            
+        Returns:
+            int: Last committed change version
+        """
+        return self.storage.version(session)
+
+    def mark_many(self, selection, status, session: Session):
+        """
+        Move many tasks to a status with one UPDATE statement.
+        
+        Args:
+            selection: List of task IDs, or a TaskFilter
+            status (str): Target status, "todo" or "completed"
+            session (Session): Database session
+            
+        Returns:
+            BulkChangeResponse: Changed task IDs; requested IDs that were not
+                found or already had the status are listed as skipped
+        """
+        to_status = STATUS_VALUES[status]
+        from_status = STATUS_VALUES["completed" if status == "todo" else "todo"]
+        try:
+            rows = self.storage.set_status_many(session, selection, from_status, to_status)
+        except ValueError as e:
+            return BulkChangeResponse(success=False, message=str(e))
+        
+        for row in rows:
+            task_schema = row_to_schema(row)
+            self._notify("status_changed", task_schema.id, task_schema, task_schema.model_copy(update={"status": from_status}))
+        return bulk_change_response(selection, rows, f"marked as {status}")
+
+    def delete_many(self, selection, session: Session):
+        """
+        Delete many tasks with one DELETE statement.
+        
+        Args:
+            selection: List of task IDs, or a TaskFilter
+            session (Session): Database session
+            
+        Returns:
+            BulkChangeResponse: Deleted task IDs; requested IDs that were not
+                found are listed as skipped
+        """
+        try:
+            rows = self.storage.delete_many(session, selection)
+        except ValueError as e:
+            return BulkChangeResponse(success=False, message=str(e))
+        
+        for row in rows:
+            self._notify("deleted", row[0], previous=row_to_schema(row))
+        return bulk_change_response(selection, rows, "deleted")
+
+    def get_completed_tasks(self, session: Session, limit=None, after=None, fields=None):
+        """
+        Retrieve all completed tasks from database, one page at a time.
+        
+        Args:
+            session (Session): Database session
+            limit (Optional[int]): Page size, None for all tasks
+            after (Optional[str]): Cursor returned by a previous page
+            fields (Optional[list]): Task fields to load (see parse_fields), None for all
+            
+        Returns:
+            TaskListResponse: Tasks with status "Completed" ordered by ID, with next_cursor if more remain
+        """
+        try:
+            tasks_data, next_cursor = self._list_tasks(session, "completed", limit=limit, after=after, fields=fields)
+        except ValueError as e:
+            return TaskListResponse(success=False, message=str(e))
         if not tasks_data:
             return TaskListResponse(success=True, message="No completed tasks found", data=[])
-        return TaskListResponse(success=True, message="Completed tasks retrieved", data=tasks_data)
+        return TaskListResponse(success=True, message="Completed tasks retrieved", data=tasks_data, next_cursor=next_cursor)
 
-    def get_todo_tasks(self, session: Session):
+    def get_todo_tasks(self, session: Session, limit=None, after=None, fields=None):
         """
-        Retrieve all to-do tasks from database.
+        Retrieve all to-do tasks from database, one page at a time.
         
         Args:
             session (Session): Database session
+            limit (Optional[int]): Page size, None for all tasks
+            after (Optional[str]): Cursor returned by a previous page
+            fields (Optional[list]): Task fields to load (see parse_fields), None for all
             
         Returns:
-            TaskListResponse: List of all tasks with status "Todo"
+            TaskListResponse: Tasks with status "Todo" ordered by ID, with next_cursor if more remain
         """
-        tasks = session.exec(select(TaskDB).where(TaskDB.status == "Todo")).all()
-        tasks_data = [TaskSchema(id=t.id, name=t.name, content=t.content, status=t.status) for t in tasks]
+        try:
+            tasks_data, next_cursor = self._list_tasks(session, "todo", limit=limit, after=after, fields=fields)
+        except ValueError as e:
+            return TaskListResponse(success=False, message=str(e))
         if not tasks_data:
             return TaskListResponse(success=True, message="No to-do tasks found", data=[])
-        return TaskListResponse(success=True, message="To-do tasks retrieved", data=tasks_data)
+        return TaskListResponse(success=True, message="To-do tasks retrieved", data=tasks_data, next_cursor=next_cursor)
 
-    
+    def export_tasks(self, session: Session, status=None, chunk_size=1000):
+        """
+        Stream tasks from database as newline-delimited JSON.
+        
+        Rows are read through a server-side cursor (yield_per) and encoded
+        chunk by chunk, so memory use does not grow with the table size.
+        
+        Args:
+            session (Session): Database session, must stay open while iterating
+            status (Optional[str]): "todo" or "completed" to filter, None for all tasks
+            chunk_size (int): Rows fetched and encoded per chunk
+            
+        Yields:
+            bytes: One chunk of NDJSON lines, one task per line
+            
+        Raises:
+            ValueError: If status is not a known filter
+        """
+        for rows in self.storage.export(session, status, chunk_size):
+            yield ndjson_chunk(rows)
+
+    def sync(self, session: Session, since=None, limit=1000):
+        """
+        Get the tasks changed and deleted since a change version (delta sync).
+        
+        Every write transaction stamps what it writes with a new version,
+        and deletes leave tombstones, so a client keeping a local copy only
+        downloads what changed. Pages hold about limit changes but never end
+        inside a version (a bulk change larger than limit comes in one page).
+        
+        Args:
+            session (Session): Database session
+            since (Optional[int]): Version from the previous sync, None for everything
+            limit (int): Target number of changes per page
+            
+        Returns:
+            SyncResponse: Changes after since, the version to continue from,
+                and whether more changes follow
+        """
+        since = -1 if since is None else since
+        tasks, tombstones = self.storage.changes(session, since, limit + 1)
+        version, has_more, refetch = sync_window(tasks, tombstones, since, limit)
+        if refetch:
+            tasks, tombstones = self.storage.changes(session, version - 1, upto=version)
+        return sync_response(tasks, tombstones, version, has_more)
@@ -2,83 +2,357 @@
 FastAPI Web Application for Task Manager
 
 This module provides HTTP endpoints for the task management system.
-It uses the existing Manager class from logic.py without any modifications.
+Routes are async and use AsyncManager from async_logic.py on the async
+engine, so requests waiting on the database do not occupy thread pool slots.
+
+Task GET routes send strong ETags derived from the database change
+version (the TaskVersion row every write transaction bumps, from any
+process), and answer a matching If-None-Match with 304 Not Modified after
+one primary-key read of that row, without loading tasks.
+
+List routes take total=true to add an X-Total-Count header with the number
+of matching tasks across all pages (one extra COUNT query). List and
+search routes take fields=name,status (any of id, name, content, status)
+to load and return only those task fields; the ID is always included.
+
+Routes return their response models through json_response(), which
+serializes them straight to JSON bytes. The models are built by the
+managers from trusted database rows, so FastAPI's response_model
+re-validation is skipped; response_model is kept for the OpenAPI schema.
+
+Task input is validated once, when the request is parsed: TaskCreate and
+TaskUpdate carry the length limits as field constraints (invalid input is
+answered with 422), and the manager is told to skip its own checks.
+
+Every request is recorded by MetricsMiddleware (metrics.py): latency,
+status and SQL statement counts per route, served at GET /metrics in the
+Prometheus text format.
+
+Task creation and status changes can be committed in shared batches
+(group_commit.py) - enable with TASKMANAGER_WRITE_QUEUE_ENABLED=true.
+
+Clients can follow changes instead of polling: GET /tasks/changes streams
+every committed create, update, status change and delete as Server-Sent
+Events (changes.py). Clients that go offline catch up with GET
+/tasks/sync, which returns the tasks changed and deleted since a change
+version - including writes made by the CLI and the importer.
+
+Nothing touches the database at import: the async engine is created and
+the schema checked once, in the app's lifespan, and the engine is
+disposed on shutdown.
 """
 
-from fastapi import FastAPI, Depends, HTTPException
-from sqlmodel import Session
-from database import get_session
-from logic import Manager
-from model import TaskSchema, OperationResponse, TaskListResponse
+from contextlib import asynccontextmanager
+from typing import Annotated, List, Literal, Optional
+from fastapi import FastAPI, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlmodel.ext.asyncio.session import AsyncSession
+from config import ApiSettings, CacheSettings, ChangesSettings, WriteQueueSettings, load_settings
+from database import get_async_session, get_async_session_context, get_async_engine, get_pool_stats, settings
+from changes import ChangeBroadcaster, create_relay
+from async_logic import AsyncManager
+from cache import CachedAsyncManager, TaskCache
+from group_commit import AsyncGroupCommitQueue
+from logic import task_to_schema
+from metrics import MetricsMiddleware, MetricsRegistry
+from model import (OperationResponse, TaskListResponse, BulkOperationResponse, BulkChangeResponse, TaskCreate, TaskUpdate,
+                   BulkTaskItem, BulkStatusRequest, BulkDeleteRequest, TaskStatsResponse, PoolStatsResponse,
+                   CacheStatsResponse, SyncResponse)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create the schema on startup and close pooled connections on shutdown."""
+    await manager.init()
+    await changes.start()
+    yield
+    await changes.close()
+    await manager.close()
+    await get_async_engine().dispose()
+
+app = FastAPI(title="Task Manager API", description="REST API for managing tasks", lifespan=lifespan)
+
+# Request metrics, served at GET /metrics
+metrics = MetricsRegistry()
+app.add_middleware(MetricsMiddleware, registry=metrics)
+
+# Optional group commit of writes - enable with TASKMANAGER_WRITE_QUEUE_ENABLED=true
+write_queue_settings = load_settings("write_queue", WriteQueueSettings)
+write_queue = None
+if write_queue_settings.enabled:
+    write_queue = AsyncGroupCommitQueue(max_batch=write_queue_settings.max_batch,
+                                        max_delay_ms=write_queue_settings.max_delay_ms,
+                                        max_pending=write_queue_settings.max_pending,
+                                        submit_timeout=write_queue_settings.submit_timeout)
+
+# Optional read cache - enable with TASKMANAGER_CACHE_ENABLED=true
+cache_settings = load_settings("cache", CacheSettings)
+if cache_settings.enabled:
+    manager = CachedAsyncManager(TaskCache(cache_settings.max_tasks, cache_settings.max_lists, cache_settings.ttl),
+                                 write_queue)
+else:
+    manager = AsyncManager(write_queue)
+
+# Server-Sent Events change feed, served at GET /tasks/changes
+changes_settings = load_settings("changes", ChangesSettings)
+changes = ChangeBroadcaster(changes_settings.buffer_size, changes_settings.history,
+                            create_relay(changes_settings.relay, settings.url))
+manager.add_listener(changes)
+
+async def conditional_get(request: Request, session: AsyncSession):
+    """
+    Check a conditional GET against the current change version.
+    
+    The version is read before the route loads anything, so the ETag sent
+    is never newer than the data: a write in between only costs the client
+    one more full response, never a stale 304. The cached manager keeps the
+    version read here for the request's transaction and only serves entries
+    cached at it, so a cached body always matches its ETag.
+    
+    Returns:
+        tuple: (ETag to send, 304 response if the request's If-None-Match
+            matches, None otherwise)
+    """
+    etag = f'"v{await manager.change_version(session)}"'
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+        if "*" in candidates or etag in candidates:
+            return etag, Response(status_code=304, headers={"ETag": etag})
+    return etag, None
+
+def json_response(model, etag=None, total=None):
+    """
+    Serialize a response model directly to a JSON response.
+    
+    Args:
+        model (BaseModel): Response model built by the manager
+        etag (Optional[str]): ETag header to send
+        total (Optional[int]): X-Total-Count header to send
+        
+    Returns:
+        Response: application/json response
+    """
+    headers = {}
+    if etag:
+        headers["ETag"] = etag
+    if total is not None:
+        headers["X-Total-Count"] = str(total)
+    return Response(content=model.model_dump_json(), media_type="application/json", headers=headers)
 
-app = FastAPI(title="Task Manager API", description="REST API for managing tasks")
-manager = Manager()
+# Request limits - configure with TASKMANAGER_API_* or taskmanager.ini
+api_settings = load_settings("api", ApiSettings)
+BULK_MAX_SIZE = api_settings.bulk_max_size
+PAGE_DEFAULT_SIZE = api_settings.page_default_size
+PAGE_MAX_SIZE = api_settings.page_max_size
 
-@app.on_event("startup")
-def on_startup():
-    """Initialize database on startup."""
-    pass  # Manager.__init__ already creates tables
+# fields= parameter of the list and search routes
+Fields = Annotated[Optional[str], Query(description="Comma-separated task fields to return "
+                                                    "(id, name, content, status), default all")]
+
+def field_list(fields):
+    """Split a fields= parameter into the field names the managers take."""
+    return None if fields is None else fields.split(",")
 
 @app.post("/tasks/", response_model=OperationResponse)
-def create_task(name: str, content: str, session: Session = Depends(get_session)):
+async def create_task(task: Annotated[TaskCreate, Query()], session: AsyncSession = Depends(get_async_session)):
     """Create a new task."""
     try:
-        return manager.add_task(name, content, session)
+        return json_response(await manager.add_task(task.name, task.content, session, validated=True))
+    except Exception as e:
+        return json_response(OperationResponse(success=False, message=str(e)))
+
+@app.post("/tasks/bulk", response_model=BulkOperationResponse)
+async def create_tasks(items: List[BulkTaskItem], session: AsyncSession = Depends(get_async_session)):
+    """Create many tasks in one transaction."""
+    if len(items) > BULK_MAX_SIZE:
+        return json_response(BulkOperationResponse(success=False, message=f"Batch too large: at most {BULK_MAX_SIZE} tasks per request"))
+    try:
+        return json_response(await manager.add_tasks(items, session))
     except Exception as e:
-        return OperationResponse(success=False, message=str(e))
+        return json_response(BulkOperationResponse(success=False, message=str(e)))
+
+def bulk_selection(body):
+    """
+    Get the IDs or filter of a bulk request body.
+    
+    Returns:
+        tuple: (list of IDs or TaskFilter, error message or None)
+    """
+    if (body.ids is None) == (body.filter is None):
+        return None, "Give exactly one of ids and filter"
+    if body.ids is not None and len(body.ids) > BULK_MAX_SIZE:
+        return None, f"Batch too large: at most {BULK_MAX_SIZE} tasks per request"
+    return (body.ids if body.ids is not None else body.filter), None
+
+@app.patch("/tasks/bulk/status", response_model=BulkChangeResponse)
+async def mark_tasks(body: BulkStatusRequest, session: AsyncSession = Depends(get_async_session)):
+    """Move many tasks to a status in one statement."""
+    selection, error = bulk_selection(body)
+    if error:
+        return json_response(BulkChangeResponse(success=False, message=error))
+    return json_response(await manager.mark_many(selection, body.status, session))
+
+@app.delete("/tasks/bulk", response_model=BulkChangeResponse)
+async def delete_tasks(body: BulkDeleteRequest, session: AsyncSession = Depends(get_async_session)):
+    """Delete many tasks in one statement."""
+    selection, error = bulk_selection(body)
+    if error:
+        return json_response(BulkChangeResponse(success=False, message=error))
+    return json_response(await manager.delete_many(selection, session))
 
 @app.get("/tasks/", response_model=TaskListResponse)
-def get_all_tasks(session: Session = Depends(get_session)):
-    """Get all tasks."""
+async def get_all_tasks(request: Request,
+                        limit: int = Query(PAGE_DEFAULT_SIZE, ge=1, le=PAGE_MAX_SIZE), after: Optional[str] = None,
+                        total: bool = False, fields: Fields = None, session: AsyncSession = Depends(get_async_session)):
+    """Get all tasks, one page at a time."""
+    etag, unchanged = await conditional_get(request, session)
+    if unchanged is not None:
+        return unchanged
     try:
-        return manager.get_all_tasks(session)
+        result = await manager.get_all_tasks(session, limit, after, field_list(fields))
+        return json_response(result, etag, await manager.count_tasks(session) if total else None)
     except Exception as e:
-        return TaskListResponse(success=False, message=str(e))
+        return json_response(TaskListResponse(success=False, message=str(e)), etag)
+
+@app.get("/tasks/export")
+async def export_tasks(status: Optional[Literal["todo", "completed"]] = None):
+    """Stream all tasks as newline-delimited JSON."""
+    async def generate():
+        # The session lives as long as the stream, not the request handler
+        async with get_async_session_context() as session:
+            async for chunk in manager.export_tasks(session, status):
+                yield chunk
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+@app.get("/tasks/changes")
+async def task_changes(last_event_id: Optional[str] = Header(None)):
+    """
+    Stream task changes as Server-Sent Events.
+    
+    Each event's type is the change kind ("created", "updated",
+    "status_changed", "deleted") and its data the TaskEvent JSON. A "reset"
+    event means changes were missed: refetch the list, then keep applying
+    events. Reconnecting with Last-Event-ID resumes where the client left off.
+    """
+    return StreamingResponse(changes.stream(last_event_id, changes_settings.keepalive),
+                             media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+@app.get("/tasks/sync", response_model=SyncResponse)
+async def sync_tasks(since: Optional[int] = Query(None, ge=0),
+                     limit: int = Query(PAGE_DEFAULT_SIZE, ge=1, le=PAGE_MAX_SIZE),
+                     session: AsyncSession = Depends(get_async_session)):
+    """
+    Get the tasks changed and deleted since a change version.
+    
+    Start without since (everything), then pass the returned version back
+    as since; repeat while has_more is true.
+    """
+    return json_response(await manager.sync(session, since, limit))
+
+@app.get("/tasks/search", response_model=TaskListResponse)
+async def search_tasks(request: Request,
+                       q: str = Query(..., min_length=1), limit: int = Query(20, ge=1, le=PAGE_MAX_SIZE),
+                       after: Optional[str] = None, fields: Fields = None,
+                       session: AsyncSession = Depends(get_async_session)):
+    """Full-text search over task names and descriptions."""
+    etag, unchanged = await conditional_get(request, session)
+    if unchanged is not None:
+        return unchanged
+    return json_response(await manager.search(q, session, limit, after, field_list(fields)), etag)
+
+@app.get("/tasks/stats", response_model=TaskStatsResponse)
+async def get_task_stats(request: Request, session: AsyncSession = Depends(get_async_session)):
+    """Get total, to-do and completed task counts."""
+    etag, unchanged = await conditional_get(request, session)
+    if unchanged is not None:
+        return unchanged
+    return json_response(await manager.get_stats(session), etag)
 
 @app.get("/tasks/{task_id}", response_model=OperationResponse)
-def get_task(task_id: int, session: Session = Depends(get_session)):
+async def get_task(request: Request,
+                   task_id: int, session: AsyncSession = Depends(get_async_session)):
     """Get a specific task by ID."""
-    task = manager.search_by_id(task_id, session)
+    etag, unchanged = await conditional_get(request, session)
+    if unchanged is not None:
+        return unchanged
+    task = await manager.search_by_id(task_id, session)
     if not task:
-        return OperationResponse(success=False, message="Task not found")
-    return OperationResponse(success=True, data=TaskSchema.from_orm(task))
+        return json_response(OperationResponse(success=False, message="Task not found"), etag)
+    return json_response(OperationResponse(success=True, message="Task retrieved", data=task_to_schema(task)), etag)
 
 @app.put("/tasks/{task_id}", response_model=OperationResponse)
-def update_task(task_id: int, name: str = None, content: str = None, session: Session = Depends(get_session)):
+async def update_task(task_id: int, edit: Annotated[TaskUpdate, Query()], session: AsyncSession = Depends(get_async_session)):
     """Update a task."""
-    return manager.update_task(task_id, name, content, session)
+    return json_response(await manager.update_task(task_id, edit.name, edit.content, session, validated=True))
 
 @app.delete("/tasks/{task_id}", response_model=OperationResponse)
-def delete_task(task_id: int, session: Session = Depends(get_session)):
+async def delete_task(task_id: int, session: AsyncSession = Depends(get_async_session)):
     """Delete a task."""
-    return manager.delete_task(task_id, session)
+    return json_response(await manager.delete_task(task_id, session))
 
 @app.patch("/tasks/{task_id}/complete", response_model=OperationResponse)
-def mark_task_completed(task_id: int, session: Session = Depends(get_session)):
+async def mark_task_completed(task_id: int, session: AsyncSession = Depends(get_async_session)):
     """Mark a task as completed."""
-    return manager.mark_completed(task_id, session)
+    return json_response(await manager.mark_completed(task_id, session))
 
 @app.patch("/tasks/{task_id}/todo", response_model=OperationResponse)
-def mark_task_todo(task_id: int, session: Session = Depends(get_session)):
+async def mark_task_todo(task_id: int, session: AsyncSession = Depends(get_async_session)):
     """Mark a task as to-do."""
-    return manager.mark_todo(task_id, session)
+    return json_response(await manager.mark_todo(task_id, session))
 
 @app.get("/tasks/completed/", response_model=TaskListResponse)
-def get_completed_tasks(session: Session = Depends(get_session)):
-    """Get all completed tasks."""
-    return manager.get_completed_tasks(session)
+async def get_completed_tasks(request: Request,
+                              limit: int = Query(PAGE_DEFAULT_SIZE, ge=1, le=PAGE_MAX_SIZE), after: Optional[str] = None,
+                              total: bool = False, fields: Fields = None,
+                              session: AsyncSession = Depends(get_async_session)):
+    """Get all completed tasks, one page at a time."""
+    etag, unchanged = await conditional_get(request, session)
+    if unchanged is not None:
+        return unchanged
+    result = await manager.get_completed_tasks(session, limit, after, field_list(fields))
+    return json_response(result, etag, await manager.count_tasks(session, "completed") if total else None)
 
 @app.get("/tasks/todo/", response_model=TaskListResponse)
-def get_todo_tasks(session: Session = Depends(get_session)):
-    """Get all to-do tasks."""
-    return manager.get_todo_tasks(session)
+async def get_todo_tasks(request: Request,
+                         limit: int = Query(PAGE_DEFAULT_SIZE, ge=1, le=PAGE_MAX_SIZE), after: Optional[str] = None,
+                         total: bool = False, fields: Fields = None,
+                         session: AsyncSession = Depends(get_async_session)):
+    """Get all to-do tasks, one page at a time."""
+    etag, unchanged = await conditional_get(request, session)
+    if unchanged is not None:
+        return unchanged
+    result = await manager.get_todo_tasks(session, limit, after, field_list(fields))
+    return json_response(result, etag, await manager.count_tasks(session, "todo") if total else None)
 
 @app.get("/tasks/by-name/{name}", response_model=TaskListResponse)
-def get_tasks_by_name(name: str, session: Session = Depends(get_session)):
-    """Get tasks by name."""
-    tasks = manager.search_by_name(name, session)
-    tasks_data = [TaskSchema.from_orm(t) for t in tasks]
-    return TaskListResponse(success=True, message="Tasks retrieved", data=tasks_data)
+async def get_tasks_by_name(request: Request,
+                            name: str, limit: int = Query(PAGE_DEFAULT_SIZE, ge=1, le=PAGE_MAX_SIZE),
+                            after: Optional[str] = None, total: bool = False, fields: Fields = None,
+                            session: AsyncSession = Depends(get_async_session)):
+    """Get tasks by name, one page at a time."""
+    etag, unchanged = await conditional_get(request, session)
+    if unchanged is not None:
+        return unchanged
+    result = await manager.get_tasks_by_name(name, session, limit, after, field_list(fields))
+    return json_response(result, etag, await manager.count_tasks(session, name=name) if total else None)
+
+@app.get("/internal/pool", response_model=PoolStatsResponse)
+async def get_pool_statistics():
+    """Get live database connection pool statistics."""
+    return PoolStatsResponse(**get_pool_stats(get_async_engine()))
+
+@app.get("/internal/cache", response_model=CacheStatsResponse)
+async def get_cache_statistics():
+    """Get read cache hit/miss/eviction counters."""
+    if not cache_settings.enabled:
+        return CacheStatsResponse(enabled=False)
+    return CacheStatsResponse(enabled=True, **manager.cache.stats())
+
+@app.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Get request and SQL metrics in the Prometheus text format."""
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 if __name__ == "__main__":
     import uvicorn
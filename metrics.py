@@ -0,0 +1,199 @@
+"""
+Prometheus Metrics
+
+This module collects request metrics for the FastAPI app and renders them
+in the Prometheus text exposition format (served at GET /metrics):
+- MetricsRegistry: in-process counters, gauges and histograms
+- MetricsMiddleware: pure ASGI middleware recording every HTTP request
+
+Recorded per route template (e.g. /tasks/{task_id}) and method:
+- taskmanager_http_requests_total: requests by response status
+- taskmanager_http_request_duration_seconds: latency histogram
+- taskmanager_db_statements_per_request: SQL statements per request
+- taskmanager_db_time_per_request_seconds: time spent in SQL per request
+- taskmanager_http_requests_in_flight: requests being handled (no labels)
+
+SQL statements are counted by the engine listeners from database.py,
+scoped to the request with database.track_queries(). When SQL profiling
+is enabled, each finished request is also checked by
+database.report_queries() for too many or repeated statements.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+
+from database import report_queries, track_queries
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_TIME_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+STATEMENT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# Route label for requests that matched no route, so unknown paths do not
+# create new label values
+UNMATCHED_ROUTE = "unmatched"
+
+
+class Histogram:
+    """
+    Histogram with fixed bucket upper bounds.
+    
+    Attributes:
+        buckets (tuple): Sorted upper bounds (an implicit +Inf bucket follows)
+        counts (list): Observations per bucket, not cumulative
+        sum (float): Sum of all observations
+        count (int): Number of observations
+    """
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """Record one value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        Get cumulative bucket counts in exposition order.
+        
+        Returns:
+            list: (upper bound label, count of observations <= bound) pairs, ending with "+Inf"
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + ("+Inf",), self.counts):
+            total += count
+            result.append((bound if bound == "+Inf" else repr(float(bound)), total))
+        return result
+
+
+def _escape(value):
+    """Escape a label value for the text format."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels):
+    """Format a Prometheus label set."""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class MetricsRegistry:
+    """
+    Request metrics for one process.
+    
+    Updated by MetricsMiddleware; render() produces the text served at
+    GET /metrics. Safe to update from several threads.
+    
+    Attributes:
+        in_flight (int): Requests currently being handled
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self._requests = {}
+        self._durations = {}
+        self._statements = {}
+        self._db_time = {}
+
+    def request_started(self):
+        """Count a request as in flight."""
+        with self._lock:
+            self.in_flight += 1
+
+    def request_finished(self, method, route, status, seconds, query_stats):
+        """
+        Record a finished request.
+        
+        Args:
+            method (str): HTTP method
+            route (str): Route template, or UNMATCHED_ROUTE
+            status (int): Response status code
+            seconds (float): Time to handle the request
+            query_stats (QueryStats): SQL statements executed for the request
+        """
+        key = (method, route)
+        with self._lock:
+            self.in_flight -= 1
+            status_key = (method, route, status)
+            self._requests[status_key] = self._requests.get(status_key, 0) + 1
+            if key not in self._durations:
+                self._durations[key] = Histogram(LATENCY_BUCKETS)
+                self._statements[key] = Histogram(STATEMENT_BUCKETS)
+                self._db_time[key] = Histogram(DB_TIME_BUCKETS)
+            self._durations[key].observe(seconds)
+            self._statements[key].observe(query_stats.statements)
+            self._db_time[key].observe(query_stats.db_time)
+
+    def render(self):
+        """
+        Render all metrics in the Prometheus text format (version 0.0.4).
+        
+        Returns:
+            str: Exposition text
+        """
+        with self._lock:
+            lines = [
+                "# HELP taskmanager_http_requests_in_flight HTTP requests currently being handled.",
+                "# TYPE taskmanager_http_requests_in_flight gauge",
+                f"taskmanager_http_requests_in_flight {self.in_flight}",
+                "# HELP taskmanager_http_requests_total HTTP requests by route and response status.",
+                "# TYPE taskmanager_http_requests_total counter",
+            ]
+            for (method, route, status), count in sorted(self._requests.items()):
+                lines.append(f"taskmanager_http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+            for name, help_text, histograms in (
+                ("taskmanager_http_request_duration_seconds", "HTTP request latency.", self._durations),
+                ("taskmanager_db_statements_per_request", "SQL statements executed per HTTP request.", self._statements),
+                ("taskmanager_db_time_per_request_seconds", "Time spent executing SQL per HTTP request.", self._db_time),
+            ):
+                lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+                for (method, route), histogram in sorted(histograms.items()):
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{name}_bucket{_labels(method=method, route=route, le=bound)} {count}")
+                    lines.append(f"{name}_sum{_labels(method=method, route=route)} {histogram.sum!r}")
+                    lines.append(f"{name}_count{_labels(method=method, route=route)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware that records every HTTP request in a MetricsRegistry.
+    
+    Requests are labelled with the matched route's path template, read from
+    the scope after routing, so path parameters do not multiply label values.
+    """
+
+    def __init__(self, app, registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+        
+        self.registry.request_started()
+        start = time.perf_counter()
+        with track_queries() as query_stats:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+                self.registry.request_finished(scope["method"], route, status, time.perf_counter() - start, query_stats)
+                report_queries(query_stats, f"{scope['method']} {route}")
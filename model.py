@@ -2,33 +2,72 @@
 Task Management Data Models
 
 This module contains:
-- Task: Legacy task model (will be migrated to Pydantic)
+- task: Compact task record (row type of the in-memory store)
 - Pydantic response models for API responses:
   - TaskSchema: Represents task data
+  - PartialTaskSchema: Task with only some fields (field projection, see
+    partial_task_model)
   - ValidationResponse: Response from validation operations
   - OperationResponse: Response from CRUD operations
   - TaskListResponse: Response from list operations
+  - BulkOperationResponse: Response from bulk create operations
+  - BulkChangeResponse: Response from bulk status changes and deletes
+  - ImportResponse: Outcome of a file import (importer.py)
+  - SyncResponse: Changes since a version (delta sync)
+  - TaskStatsResponse: Task counts by status
+  - PoolStatsResponse: Connection pool statistics
+  - CacheStatsResponse: Read cache statistics
+- TaskEvent: Notification sent to Manager listeners after every write
+- Pydantic request models:
+  - TaskCreate / TaskUpdate: Input for creating and editing a task, with
+    the name and content length limits (NAME_MAX_LENGTH, CONTENT_MAX_LENGTH)
+    declared as field constraints
+  - BulkTaskItem: Item of a bulk create request, checked per item by the Manager
+  - TaskFilter: Selects tasks by status and/or name for bulk operations
+  - BulkStatusRequest / BulkDeleteRequest: Input for bulk status changes and deletes
 """
 
-from pydantic import BaseModel
-from typing import Optional, List
+from functools import lru_cache
+from pydantic import BaseModel, Discriminator, Field, SerializeAsAny, Tag, create_model
+from typing import Annotated, Optional, List, Literal, Union
+
+
+# Task field length limits, shared by the request models and validators.py
+NAME_MAX_LENGTH = 50
+CONTENT_MAX_LENGTH = 500
 
 
 class task:
     """
-    Legacy Task model - represents a single task.
+    Compact task record - represents a single task.
+    
+    Used as the row type of storage.MemoryTaskStore. Besides attribute
+    access it unpacks and indexes like an (id, name, content, status) row,
+    so the same helpers handle it and SQL result rows.
     
     Attributes:
         id (int): Unique identifier for the task
         name (str): Task name
         content (str): Task description
         status (str): Current status ("Todo" or "Completed")
+        row_version (int): Change version of the last write
+        updated_at (Optional[datetime]): Time of the last write
     """
-    def __init__(self):
-        self.id = None
-        self.name = None
-        self.content = None
-        self.status = None
+    __slots__ = ("id", "name", "content", "status", "row_version", "updated_at")
+
+    def __init__(self, id=None, name=None, content=None, status=None, row_version=0, updated_at=None):
+        self.id = id
+        self.name = name
+        self.content = content
+        self.status = status
+        self.row_version = row_version
+        self.updated_at = updated_at
+
+    def __iter__(self):
+        return iter((self.id, self.name, self.content, self.status))
+
+    def __getitem__(self, index):
+        return (self.id, self.name, self.content, self.status)[index]
 
     def set(self, num, name, content):
         """
@@ -77,6 +116,50 @@ class TaskSchema(BaseModel):
         from_attributes = True
 
 
+class PartialTaskSchema(BaseModel):
+    """
+    Task data limited to the fields a list request asked for (fields=...).
+    
+    Base class only: partial_task_model() builds the subclass for a set of
+    fields, which declares exactly those fields (id, name, content, status),
+    so the fields not asked for are left out of the JSON.
+    """
+
+
+# Types of the task fields a PartialTaskSchema can carry
+PARTIAL_TASK_FIELDS = {"id": int, "name": str, "content": str, "status": str}
+
+
+@lru_cache(maxsize=None)
+def partial_task_model(fields):
+    """
+    Get the PartialTaskSchema subclass for a set of fields.
+    
+    Models are built once per field set and reused.
+    
+    Args:
+        fields (tuple): Field names, from PARTIAL_TASK_FIELDS
+        
+    Returns:
+        type: PartialTaskSchema subclass with exactly these fields, all required
+    """
+    return create_model("PartialTaskSchema_" + "_".join(fields), __base__=PartialTaskSchema,
+                        **{name: (PARTIAL_TASK_FIELDS[name], ...) for name in fields})
+
+
+def _task_item_kind(item):
+    return "partial" if isinstance(item, PartialTaskSchema) else "full"
+
+
+# Item of a task list: a TaskSchema, or a PartialTaskSchema when fields were
+# selected. The discriminator picks the model with one isinstance check, and
+# SerializeAsAny makes partial items serialize their own fields, not the
+# (empty) base's.
+TaskItem = Annotated[Union[Annotated[TaskSchema, Tag("full")],
+                           Annotated[SerializeAsAny[PartialTaskSchema], Tag("partial")]],
+                     Discriminator(_task_item_kind)]
+
+
 class ValidationResponse(BaseModel):
     """
     Response model for validation operations.
@@ -118,8 +201,288 @@ class TaskListResponse(BaseModel):
     Attributes:
         success (bool): Whether operation succeeded
         message (str): Operation result message
-        data (List[TaskSchema]): List of tasks (empty if none found)
+        data (List[TaskSchema]): List of tasks (empty if none found); PartialTaskSchema
+            items when the request selected fields
+        next_cursor (Optional[str]): Cursor for the next page, None on the last page
+    """
+    success: bool
+    message: str
+    data: List[TaskItem] = []
+    next_cursor: Optional[str] = None
+
+
+class BulkOperationResponse(BaseModel):
+    """
+    Response model for bulk operations.
+    
+    Used by Manager.add_tasks to report the outcome of every item in a batch.
+    
+    Attributes:
+        success (bool): Whether the batch was processed
+        message (str): Operation result message
+        created (int): Number of tasks inserted
+        results (List[OperationResponse]): Per-item results, in input order
+    """
+    success: bool
+    message: str
+    created: int = 0
+    results: List[OperationResponse] = []
+
+
+class BulkChangeResponse(BaseModel):
+    """
+    Response model for bulk status changes and deletes.
+    
+    Used by Manager.mark_many and Manager.delete_many.
+    
+    Attributes:
+        success (bool): Whether the batch was processed
+        message (str): Operation result message
+        count (int): Number of tasks changed
+        ids (List[int]): IDs of the changed tasks
+        skipped (List[int]): Requested IDs that were not changed (not found
+            or already in the target state); always empty for filters
+    """
+    success: bool
+    message: str
+    count: int = 0
+    ids: List[int] = []
+    skipped: List[int] = []
+
+
+class ImportResponse(BaseModel):
+    """
+    Response model for file imports.
+    
+    Used by importer.import_tasks.
+    
+    Attributes:
+        success (bool): Whether the whole file was read
+        message (str): Operation result message
+        imported (int): Number of tasks inserted
+        rejected (int): Number of records that failed validation
+        seconds (float): Time taken
+        error_file (Optional[str]): File the rejected records were written to, if any
+    """
+    success: bool
+    message: str
+    imported: int = 0
+    rejected: int = 0
+    seconds: float = 0.0
+    error_file: Optional[str] = None
+
+
+class SyncResponse(BaseModel):
+    """
+    Response model for delta sync.
+    
+    Used by Manager.sync and GET /tasks/sync. Apply changed and deleted to
+    the local copy, store version and pass it as since next time; while
+    has_more is set, call again right away.
+    
+    Attributes:
+        success (bool): Whether the changes were retrieved
+        message (str): Operation result message
+        version (int): Change version the local copy is up to date with
+        changed (List[TaskSchema]): Tasks created or changed since the given version
+        deleted (List[int]): IDs of tasks deleted since the given version
+        has_more (bool): Whether more changes follow version
+    """
+    success: bool
+    message: str
+    version: int = 0
+    changed: List[TaskSchema] = []
+    deleted: List[int] = []
+    has_more: bool = False
+
+
+class TaskStatsResponse(BaseModel):
+    """
+    Response model for task statistics.
+    
+    Attributes:
+        success (bool): Whether operation succeeded
+        message (str): Operation result message
+        total (int): Number of tasks
+        todo (int): Number of tasks with status "Todo"
+        completed (int): Number of tasks with status "Completed"
     """
     success: bool
     message: str
-    data: List[TaskSchema] = []
+    total: int = 0
+    todo: int = 0
+    completed: int = 0
+
+
+class PoolStatsResponse(BaseModel):
+    """
+    Response model for connection pool statistics.
+    
+    Attributes:
+        pool_class (str): Pool implementation in use
+        size (int): Configured pool size
+        checked_in (int): Idle connections in the pool
+        checked_out (int): Connections currently in use
+        overflow (int): Connections open beyond the pool size
+        waits (int): Number of checkouts since startup
+        wait_time_total_ms (float): Total time spent waiting for a connection
+        wait_time_max_ms (float): Longest single wait for a connection
+        timeouts (int): Checkouts that timed out waiting for a connection
+    """
+    pool_class: str
+    size: int = 0
+    checked_in: int = 0
+    checked_out: int = 0
+    overflow: int = 0
+    waits: int = 0
+    wait_time_total_ms: float = 0.0
+    wait_time_max_ms: float = 0.0
+    timeouts: int = 0
+
+
+class CacheCounters(BaseModel):
+    """
+    Counters for one cache.
+    
+    Attributes:
+        size (int): Entries currently cached
+        max_entries (int): Capacity
+        hits (int): Lookups served from the cache
+        misses (int): Lookups that went to the database
+        evictions (int): Entries dropped to stay within capacity
+        expirations (int): Entries dropped because their TTL ran out
+    """
+    size: int = 0
+    max_entries: int = 0
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+
+class CacheStatsResponse(BaseModel):
+    """
+    Response model for read cache statistics.
+    
+    Attributes:
+        enabled (bool): Whether the cache is in use
+        tasks (Optional[CacheCounters]): Single-task cache counters
+        lists (Optional[CacheCounters]): List-page cache counters
+    """
+    enabled: bool
+    tasks: Optional[CacheCounters] = None
+    lists: Optional[CacheCounters] = None
+
+
+# ===== EVENT MODELS =====
+
+class TaskEvent(BaseModel):
+    """
+    Notification of a committed task change.
+    
+    Sent by Manager and AsyncManager to their listeners after every
+    successful write (used e.g. for cache invalidation).
+    
+    Attributes:
+        kind (str): "created", "updated", "status_changed" or "deleted"
+        task_id (int): ID of the changed task
+        data (Optional[TaskSchema]): Task after the change (None for deletes)
+        previous (Optional[TaskSchema]): Task before the change (None for creates)
+    """
+    kind: Literal["created", "updated", "status_changed", "deleted"]
+    task_id: int
+    data: Optional[TaskSchema] = None
+    previous: Optional[TaskSchema] = None
+
+
+# ===== PYDANTIC REQUEST MODELS =====
+
+class TaskCreate(BaseModel):
+    """
+    Pydantic model for task creation input.
+    
+    Used for the POST /tasks/ query parameters. The length limits are
+    checked when the request is parsed, so the Manager is called with
+    validated=True and does not check them again.
+    
+    Attributes:
+        name (str): Task name (1-50 characters)
+        content (str): Task description (1-500 characters)
+    """
+    name: str = Field(min_length=1, max_length=NAME_MAX_LENGTH)
+    content: str = Field(min_length=1, max_length=CONTENT_MAX_LENGTH)
+
+
+class TaskUpdate(BaseModel):
+    """
+    Pydantic model for task edit input.
+    
+    Used for the PUT /tasks/{task_id} query parameters. Fields left out
+    are not changed.
+    
+    Attributes:
+        name (Optional[str]): New task name (1-50 characters)
+        content (Optional[str]): New task description (1-500 characters)
+    """
+    name: Optional[str] = Field(default=None, min_length=1, max_length=NAME_MAX_LENGTH)
+    content: Optional[str] = Field(default=None, min_length=1, max_length=CONTENT_MAX_LENGTH)
+
+
+class BulkTaskItem(BaseModel):
+    """
+    Pydantic model for one item of a POST /tasks/bulk request body.
+    
+    Not constrained on purpose: Manager.add_tasks checks every item and
+    reports invalid ones in its results, so one bad item does not reject
+    the whole batch.
+    
+    Attributes:
+        name (str): Task name
+        content (str): Task description
+    """
+    name: str
+    content: str
+
+
+class TaskFilter(BaseModel):
+    """
+    Pydantic model selecting tasks for a bulk operation.
+    
+    At least one criterion must be set; set criteria are combined with AND.
+    
+    Attributes:
+        status (Optional[str]): "todo" or "completed"
+        name (Optional[str]): Exact task name
+    """
+    status: Optional[Literal["todo", "completed"]] = None
+    name: Optional[str] = None
+
+
+class BulkStatusRequest(BaseModel):
+    """
+    Pydantic model for PATCH /tasks/bulk/status input.
+    
+    Exactly one of ids and filter must be given.
+    
+    Attributes:
+        ids (Optional[List[int]]): Tasks to change
+        filter (Optional[TaskFilter]): Criteria selecting the tasks to change
+        status (str): Target status, "todo" or "completed"
+    """
+    ids: Optional[List[int]] = None
+    filter: Optional[TaskFilter] = None
+    status: Literal["todo", "completed"]
+
+
+class BulkDeleteRequest(BaseModel):
+    """
+    Pydantic model for DELETE /tasks/bulk input.
+    
+    Exactly one of ids and filter must be given.
+    
+    Attributes:
+        ids (Optional[List[int]]): Tasks to delete
+        filter (Optional[TaskFilter]): Criteria selecting the tasks to delete
+    """
+    ids: Optional[List[int]] = None
+    filter: Optional[TaskFilter] = None
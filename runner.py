@@ -13,6 +13,9 @@ Helper functions:
 - get_task_name_from_user(): Get and validate task name input
 - get_task_content_from_user(): Get and validate task content input
 
+Input is validated once, at the prompt, and passed to the Manager with
+validated=True so it is not checked again.
+
 Menu functions (each handles one main menu operation):
 - create_task()
 - view_tasks()
@@ -22,15 +25,195 @@ Menu functions (each handles one main menu operation):
 - view_todo_tasks()
 - edit_task()
 - delete_task()
+
+Each menu operation runs inside database.profile_operation(), so with SQL
+profiling enabled it is checked for too many or repeated statements.
+
+Task lists (view_tasks, delete_task) are paged by TaskPager: one page of
+names at a time through keyset queries, the next page prefetched in the
+background, and each screen printed with a single write.
+
+Storage: tasks go to the configured database, or stay in memory for the
+run with TASKMANAGER_DATABASE_URL=memory:// (embedded mode, see storage.py).
+
+Startup: the menu is shown before anything heavy is loaded. Pydantic,
+SQLModel and the database driver are imported, and the engine and schema
+set up, on the first operation that needs them (imports are local to the
+functions below for that reason).
 """
 
-from model import TaskSchema
-from logic import Manager
-from validators import validate_id, name_check, content_check
-from database import get_session_context
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from logic import Manager
+    from model import TaskSchema
+
+# Tasks shown per screen in paged lists
+PAGE_SIZE = 20
+
+
+def open_session():
+    """
+    Open a database session, loading the database layer on first use.
+    
+    Returns:
+        Session: Session usable as a context manager
+    """
+    from database import get_session_context
+    return get_session_context()
+
+
+def write_screen(lines):
+    """
+    Print a screen of lines with one write.
+    
+    Args:
+        lines (list): Lines to print
+    """
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
-def display_task_detail(task_schema: TaskSchema):
+class TaskPager:
+    """
+    Numbered task list loaded one page at a time.
+    
+    Pages are fetched with keyset queries (the list cursor), each in its
+    own session, and kept once fetched, so serial numbers stay stable and
+    going back needs no query. While a page is shown, the next one is
+    fetched in a background thread. Selecting a serial number past the
+    loaded pages fetches the missing ones with one query. Fetches run on
+    the pager's thread, so profile_operation() does not count them.
+    
+    Use as a context manager so the background thread is stopped.
+    """
+
+    def __init__(self, fetch, page_size=PAGE_SIZE):
+        """
+        Args:
+            fetch (callable): fetch(session, limit, after) -> TaskListResponse,
+                e.g. a Manager list method
+            page_size (int): Tasks per page
+        """
+        self.fetch = fetch
+        self.page_size = page_size
+        self.page = 0
+        self._pages = []
+        self._next_cursor = None
+        self._done = False
+        self._pending = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="task-pager")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Stop the background thread (waits for a prefetch in progress)."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch(self, after, limit):
+        with open_session() as session:
+            response = self.fetch(session, limit, after)
+        return response.data, response.next_cursor
+
+    def _prefetch(self):
+        """Start fetching the page after the loaded ones, if not already started."""
+        if self._pending is None and not self._done:
+            self._pending = self._executor.submit(self._fetch, self._next_cursor, self.page_size)
+
+    def _load(self, pages=1):
+        """
+        Load the next pages: the running prefetch, then the rest in one query.
+        
+        Returns:
+            bool: Whether any task was loaded
+        """
+        loaded = False
+        while pages > 0 and not self._done:
+            if self._pending is None:
+                self._pending = self._executor.submit(self._fetch, self._next_cursor, self.page_size * pages)
+            pending, self._pending = self._pending, None
+            tasks, self._next_cursor = pending.result()
+            self._done = self._next_cursor is None
+            for start in range(0, len(tasks), self.page_size):
+                self._pages.append(tasks[start:start + self.page_size])
+                pages -= 1
+                loaded = True
+            if not tasks:
+                break
+        return loaded
+
+    def current(self):
+        """
+        Get the tasks of the current page, loading it if needed.
+        
+        Returns:
+            list: (serial number, task) pairs, empty if there are no tasks
+        """
+        if self.page >= len(self._pages):
+            self._load()
+        if self.page >= len(self._pages):
+            return []
+        if self.page == len(self._pages) - 1:
+            self._prefetch()
+        first = self.page * self.page_size + 1
+        return list(enumerate(self._pages[self.page], first))
+
+    def next_page(self):
+        """Move to the next page; False if this is the last one."""
+        if self.page + 1 < len(self._pages) or self._load():
+            self.page += 1
+            return True
+        return False
+
+    def previous_page(self):
+        """Move to the previous page; False if this is the first one."""
+        if self.page == 0:
+            return False
+        self.page -= 1
+        return True
+
+    def task_at(self, serial):
+        """
+        Get the task with a serial number, on any page.
+        
+        Args:
+            serial (int): Serial number, from 1
+            
+        Returns:
+            Task item (ID and name), None if there is no such task
+        """
+        if serial < 1:
+            return None
+        page, index = divmod(serial - 1, self.page_size)
+        if page >= len(self._pages):
+            self._load(page + 1 - len(self._pages))
+        if page >= len(self._pages) or index >= len(self._pages[page]):
+            return None
+        return self._pages[page][index]
+
+    def render(self):
+        """
+        Build the lines of the current page.
+        
+        Returns:
+            list: One line per task, then the page position
+        """
+        tasks = self.current()
+        if not tasks:
+            return ["No tasks found."]
+        lines = [f"No. {sno}: {t.name} [{t.id}]" for sno, t in tasks]
+        more = "" if self._done and self.page == len(self._pages) - 1 else ", more on the next page"
+        lines.append(f"\nPage {self.page + 1} (tasks {tasks[0][0]}-{tasks[-1][0]}{more})")
+        return lines
+
+
+def display_task_detail(task_schema: "TaskSchema"):
     """
     Display detailed task information.
     
@@ -55,6 +238,8 @@ def get_task_id_from_user(prompt="Enter task ID (enter 0 to cancel): "):
     Returns:
         Optional[int]: Parsed task ID or None if user cancelled
     """
+    from validators import validate_id
+
     while True:
         u = input(prompt)
         if u == "0":
@@ -79,14 +264,16 @@ def get_task_name_from_user(prompt="Enter task name (enter 0 to cancel): "):
     Returns:
         Optional[str]: Valid task name or None if user entered 0
     """
+    from validators import name_error
+
     while True:
         name = input(prompt)
         if name == "0":
             return None
         stripped_name = name.strip()
-        validation = name_check(stripped_name)
-        if not validation.success:
-            print(f"{validation.message}\n")
+        error = name_error(stripped_name)
+        if error:
+            print(f"{error}\n")
             continue
         return stripped_name
 
@@ -104,14 +291,16 @@ def get_task_content_from_user(prompt="Enter task description (enter 0 to cancel
     Returns:
         Optional[str]: Valid task content or None if user entered 0
     """
+    from validators import content_error
+
     while True:
         content = input(prompt)
         if content == "0":
             return None
         stripped_content = content.strip()
-        validation = content_check(stripped_content)
-        if not validation.success:
-            print(f"{validation.message}\n")
+        error = content_error(stripped_content)
+        if error:
+            print(f"{error}\n")
             continue
         return stripped_content
 
@@ -136,8 +325,8 @@ def create_task(manager):
         print("Task creation cancelled.\n")
         return
     
-    with get_session_context() as session:
-        response = manager.add_task(name, content, session)
+    with open_session() as session:
+        response = manager.add_task(name, content, session, validated=True)
         print(f"{response.message}\n")
 
 
@@ -145,35 +334,49 @@ def view_tasks(manager):
     """
     UI flow for viewing tasks with multiple search options.
     
+    Shows one page of the task list at a time (see TaskPager).
+    
     Menu options:
-    1. View by serial number (position in list)
+    1. View by serial number (position in list, on any page)
     2. View by name (search and filter)
     3. View by ID (exact ID match)
+    n / p. Next / previous page
     
     Args:
         manager (Manager): Manager instance
     """
-    with get_session_context() as session:
-        response = manager.get_all_tasks(session)
-        tasks = response.data
-        
-        if not tasks:
+    from model import TaskSchema
+
+    # The list only shows names; a task's description is loaded when it is selected
+    pager = TaskPager(lambda session, limit, after: manager.get_all_tasks(session, limit, after, fields=["name"]))
+    with pager, open_session() as session:
+        if not pager.current():
             print("No tasks found.\n")
             return
         
         while True:
-            # Display all tasks
-            for sno, t in enumerate(tasks, 1):
-                print(f"No. {sno}: {t.name} [{t.id}]")
-            
-            print("\n1. View by Serial Number")
-            print("2. View by Name")
-            print("3. View by ID")
-            print("0. Exit\n")
+            write_screen(pager.render() + [
+                "",
+                "1. View by Serial Number",
+                "2. View by Name",
+                "3. View by ID",
+                "n. Next Page",
+                "p. Previous Page",
+                "0. Exit",
+                "",
+            ])
             
             choice = input("Enter choice: ")
             
-            if choice == "1":
+            if choice == "n":
+                if not pager.next_page():
+                    print("Error: This is the last page.\n")
+            
+            elif choice == "p":
+                if not pager.previous_page():
+                    print("Error: This is the first page.\n")
+            
+            elif choice == "1":
                 while True:
                     user_input = input("Enter serial number (enter 0 to cancel): ")
                     if user_input == "0":
@@ -181,11 +384,15 @@ def view_tasks(manager):
                         break
                     try:
                         serial = int(user_input)
-                        if serial < 1 or serial > len(tasks):
+                        listed = pager.task_at(serial)
+                        if listed is None:
                             print("Error: Serial number is out of range.\n")
                             continue
-                        task_obj = tasks[serial - 1]
-                        display_task_detail(task_obj)
+                        task_obj = manager.search_by_id(listed.id, session)
+                        if task_obj:
+                            display_task_detail(TaskSchema.from_orm(task_obj))
+                        else:
+                            print("Error: Task not found.\n")
                         break
                     except ValueError:
                         print("Error: Please enter a valid numeric serial number.\n")
@@ -228,7 +435,7 @@ def view_tasks(manager):
                 break
             
             else:
-                print("Error: Please enter a valid choice (1,2,3,0).\n")
+                print("Error: Please enter a valid choice (1,2,3,n,p,0).\n")
 
 
 def mark_task_completed(manager):
@@ -242,7 +449,7 @@ def mark_task_completed(manager):
     """
     task_id = get_task_id_from_user()
     if task_id:
-        with get_session_context() as session:
+        with open_session() as session:
             response = manager.mark_completed(task_id, session)
             print(f"{response.message}\n")
 
@@ -258,7 +465,7 @@ def mark_task_todo(manager):
     """
     task_id = get_task_id_from_user()
     if task_id:
-        with get_session_context() as session:
+        with open_session() as session:
             response = manager.mark_todo(task_id, session)
             print(f"{response.message}\n")
 
@@ -272,8 +479,8 @@ def view_completed_tasks(manager):
     Args:
         manager (Manager): Manager instance
     """
-    with get_session_context() as session:
-        response = manager.get_completed_tasks(session)
+    with open_session() as session:
+        response = manager.get_completed_tasks(session, fields=["name"])
         if not response.data:
             print(f"{response.message}\n")
         else:
@@ -291,8 +498,8 @@ def view_todo_tasks(manager):
     Args:
         manager (Manager): Manager instance
     """
-    with get_session_context() as session:
-        response = manager.get_todo_tasks(session)
+    with open_session() as session:
+        response = manager.get_todo_tasks(session, fields=["name"])
         if not response.data:
             print(f"{response.message}\n")
         else:
@@ -319,7 +526,7 @@ def edit_task(manager):
         print("Operation cancelled.\n")
         return
     
-    with get_session_context() as session:
+    with open_session() as session:
         task_obj = manager.search_by_id(task_id, session)
         if task_obj is None:
             print("Error: No task found with that ID.\n")
@@ -335,13 +542,13 @@ def edit_task(manager):
             if choice == "1":
                 new_name = get_task_name_from_user("Enter new task name (enter 0 to cancel): ")
                 if new_name:
-                    response = manager.update_task(task_id, new_name=new_name, session=session)
+                    response = manager.update_task(task_id, new_name=new_name, session=session, validated=True)
                     print(f"{response.message}\n")
             
             elif choice == "2":
                 new_content = get_task_content_from_user("Enter new task description (enter 0 to cancel): ")
                 if new_content:
-                    response = manager.update_task(task_id, new_content=new_content, session=session)
+                    response = manager.update_task(task_id, new_content=new_content, session=session, validated=True)
                     print(f"{response.message}\n")
             
             elif choice == "0":
@@ -356,35 +563,63 @@ def delete_task(manager):
     """
     UI flow for deleting a task.
     
-    Lists all tasks and gets task ID to delete.
-    Calls manager.delete_task().
+    Lists the tasks one page at a time (see TaskPager) and gets the task ID
+    to delete. Calls manager.delete_task().
     
     Args:
         manager (Manager): Manager instance
     """
-    with get_session_context() as session:
-        response = manager.get_all_tasks(session)
-        tasks = response.data
-        
-        if not tasks:
+    from validators import validate_id
+
+    pager = TaskPager(lambda session, limit, after: manager.get_all_tasks(session, limit, after, fields=["name"]))
+    with pager:
+        if not pager.current():
             print("No tasks found.\n")
             return
         
-        for sno, t in enumerate(tasks, 1):
-            print(f"No. {sno}: {t.name} [{t.id}]")
-        print()
-        
-        task_id = get_task_id_from_user("Enter task ID to delete (enter 0 to cancel): ")
-        if task_id:
-            response = manager.delete_task(task_id, session)
-            print(f"{response.message}\n")
+        while True:
+            write_screen(pager.render() + ["", "n. Next Page", "p. Previous Page", ""])
+            u = input("Enter task ID to delete (enter 0 to cancel): ")
+            if u == "0":
+                return
+            if u == "n":
+                if not pager.next_page():
+                    print("Error: This is the last page.\n")
+                continue
+            if u == "p":
+                if not pager.previous_page():
+                    print("Error: This is the first page.\n")
+                continue
+            validation = validate_id(u)
+            if not validation.success:
+                print(f"{validation.message}\n")
+                continue
+            break
+    
+    with open_session() as session:
+        response = manager.delete_task(validation.data, session)
+        print(f"{response.message}\n")
 
 
 
 
 
+# Menu choice -> operation
+MENU = {
+    "1": create_task,
+    "2": view_tasks,
+    "3": mark_task_completed,
+    "4": mark_task_todo,
+    "5": view_completed_tasks,
+    "6": view_todo_tasks,
+    "7": edit_task,
+    "8": delete_task,
+}
+
+
 if __name__ == '__main__':
-    manager = Manager()
+    # Created on the first operation, so the menu appears without loading the database layer
+    manager = None
 
     while True:
         print("\n=== Task Manager ===")
@@ -401,29 +636,15 @@ if __name__ == '__main__':
 
         choice = input("Enter your choice: ")
 
-        if choice == "1":
-            create_task(manager)
-
-        elif choice == "2":
-            view_tasks(manager)
-
-        elif choice == "3":
-            mark_task_completed(manager)
-
-        elif choice == "4":
-            mark_task_todo(manager)
-
-        elif choice == "5":
-            view_completed_tasks(manager)
-
-        elif choice == "6":
-            view_todo_tasks(manager)
-
-        elif choice == "7":
-            edit_task(manager)
+        if choice in MENU:
+            from database import profile_operation
 
-        elif choice == "8":
-            delete_task(manager)
+            if manager is None:
+                from logic import Manager, create_store
+                manager = Manager(create_store())
+            operation = MENU[choice]
+            with profile_operation(operation.__name__):
+                operation(manager)
 
         elif choice == "0":
             print("Thank you for using Task Manager. Goodbye!\n")
@@ -0,0 +1,475 @@
+"""
+Task Storage Backends
+
+Manager (logic.py) reads and writes tasks through a TaskStore, so the
+business logic does not depend on how tasks are stored:
+- TaskStore: the storage interface
+- MemoryTaskStore: pure in-memory engine, no database needed (tests,
+  benchmarks, and the CLI's embedded mode - TASKMANAGER_DATABASE_URL=memory://)
+- logic.SQLTaskStore / PostgresTaskStore / SQLiteTaskStore: SQL engines on
+  SQLModel sessions
+
+Every method takes the caller's session as its first argument. SQL stores
+run their statements on it and commit their writes; the in-memory store
+ignores it (None is fine).
+
+Rows returned by a store are (id, name, content, status) records that can
+be unpacked, indexed and read by attribute: SQLAlchemy rows for SQL stores,
+model.task objects for the in-memory store. List and search take a field
+projection (logic.parse_fields); the rows then hold only those fields, in
+that order (SQL stores select only those columns).
+
+This module only depends on model.py, so the in-memory store can be used
+without importing SQLAlchemy.
+"""
+
+import base64
+import re
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_right, insort
+from collections import namedtuple
+from operator import attrgetter
+from datetime import datetime, timezone
+
+from model import task, TaskFilter
+
+
+# Deleted task, as returned by TaskStore.changes
+Tombstone = namedtuple("Tombstone", ["task_id", "row_version"])
+
+# Stored status value for each status filter key
+STATUS_VALUES = {
+    "todo": "Todo",
+    "completed": "Completed",
+}
+
+
+def encode_cursor(task_id):
+    """
+    Encode a task ID as an opaque pagination cursor.
+    
+    Args:
+        task_id (int): ID of the last task on a page
+    
+    Returns:
+        str: URL-safe cursor string
+    """
+    return base64.urlsafe_b64encode(str(task_id).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor):
+    """
+    Decode a pagination cursor produced by encode_cursor.
+    
+    Args:
+        cursor (str): Cursor string
+    
+    Returns:
+        Optional[int]: Task ID the cursor points after, None if the cursor is invalid
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (ValueError, TypeError):
+        return None
+
+
+def cursor_position(after):
+    """
+    Decode an optional cursor, rejecting invalid ones.
+    
+    Args:
+        after (Optional[str]): Cursor returned by a previous page
+    
+    Returns:
+        Optional[int]: Decoded position, None if no cursor was given
+    
+    Raises:
+        ValueError: If the cursor is invalid
+    """
+    if after is None:
+        return None
+    position = decode_cursor(after)
+    if position is None:
+        raise ValueError("Invalid cursor")
+    return position
+
+
+class TaskStore(ABC):
+    """
+    Storage interface used by Manager.
+    
+    Status arguments named status are filter keys ("todo" / "completed");
+    from_status / to_status are stored values ("Todo" / "Completed").
+    Selections are a list of task IDs or a TaskFilter.
+    """
+
+    @abstractmethod
+    def get(self, session, task_id):
+        """Get one task object by ID, None if it does not exist."""
+
+    @abstractmethod
+    def find_by_name(self, session, name):
+        """Get all task objects with exactly this name."""
+
+    @abstractmethod
+    def list_page(self, session, status=None, name=None, limit=None, after=None, fields=None):
+        """
+        Fetch one page of rows ordered by ID.
+        
+        Returns:
+            list: Up to limit + 1 rows (the extra row signals another page),
+                with only the given fields if fields is set
+        
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+
+    @abstractmethod
+    def search(self, session, query, limit, after=None, fields=None):
+        """
+        Fetch one page of a ranked full-text search.
+        
+        Returns:
+            tuple: (up to limit + 1 rows, with only the given fields if fields is set,
+                offset of the page)
+        
+        Raises:
+            ValueError: If the query is empty, the cursor is invalid or
+                search is not supported
+        """
+
+    @abstractmethod
+    def insert(self, session, name, content):
+        """Insert one to-do task and return its row."""
+
+    @abstractmethod
+    def insert_many(self, session, rows):
+        """Insert {"name", "content", "status"} dicts and return their rows, in order."""
+
+    @abstractmethod
+    def update(self, session, task_id, values):
+        """
+        Change a task's columns.
+        
+        Returns:
+            Optional[tuple]: (new row, previous row), None if the task does not exist
+        """
+
+    @abstractmethod
+    def set_status(self, session, task_id, from_status, to_status):
+        """
+        Move a task from one status to another.
+        
+        Returns:
+            tuple: (new row, or None if the task does not have from_status,
+                whether the task exists)
+        """
+
+    @abstractmethod
+    def delete(self, session, task_id):
+        """Delete a task and return its last row, None if it does not exist."""
+
+    @abstractmethod
+    def set_status_many(self, session, selection, from_status, to_status):
+        """
+        Move the selected tasks that have from_status to to_status.
+        
+        Returns:
+            list: New rows of the changed tasks
+        
+        Raises:
+            ValueError: If the selection is empty
+        """
+
+    @abstractmethod
+    def delete_many(self, session, selection):
+        """
+        Delete the selected tasks.
+        
+        Returns:
+            list: Last rows of the deleted tasks
+        
+        Raises:
+            ValueError: If the selection is empty
+        """
+
+    @abstractmethod
+    def stats(self, session):
+        """Count tasks per stored status, as (status, count) pairs."""
+
+    @abstractmethod
+    def count(self, session, status=None, name=None):
+        """Count the tasks list_page would return across all pages."""
+
+    @abstractmethod
+    def version(self, session):
+        """Get the current change version (that of the last committed write)."""
+
+    @abstractmethod
+    def export(self, session, status=None, chunk_size=1000):
+        """
+        Iterate over all (or all to-do / completed) rows ordered by ID.
+        
+        Yields:
+            list: Up to chunk_size rows
+        
+        Raises:
+            ValueError: If status is not a known filter
+        """
+
+    @abstractmethod
+    def changes(self, session, since, limit=None, upto=None):
+        """
+        Fetch tasks written and deleted after a change version.
+        
+        Every write transaction stamps the rows it writes, and the
+        tombstones of the tasks it deletes, with one new version.
+        
+        Returns:
+            tuple: (task rows with row_version, tombstones with task_id and
+                row_version), each ordered by version, at most limit of each,
+                only versions up to upto
+        """
+
+
+def _project(records, fields):
+    """Reduce records to tuples of the given fields, in order (None keeps the records)."""
+    if fields is None:
+        return records
+    getter = attrgetter(*fields)
+    if len(fields) == 1:
+        return [(getter(record),) for record in records]
+    return [getter(record) for record in records]
+
+
+def _words(text):
+    """Split text into lower-case words for in-memory search."""
+    return re.findall(r"\w+", text.lower())
+
+
+class MemoryTaskStore(TaskStore):
+    """
+    Pure in-memory task engine.
+    
+    Tasks are model.task records (__slots__, never changed after they are
+    stored: edits store a new record), so rows handed out stay valid.
+    Hash indexes on name and status map to ID lists kept in ID order,
+    which makes keyset pages a bisect and a slice. Full-text search and
+    changes() scan every task.
+    
+    Data lives only as long as the process. Safe to use from several threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._tasks = {}
+        self._ids = []
+        self._by_name = {}
+        self._by_status = {}
+        self._next_id = 1
+        self._version = 0
+        self._tombstones = []
+
+    # ----- index maintenance (callers hold the lock) -----
+
+    @staticmethod
+    def _index_add(index, key, task_id):
+        ids = index.setdefault(key, [])
+        if not ids or ids[-1] < task_id:
+            ids.append(task_id)
+        else:
+            insort(ids, task_id)
+
+    @staticmethod
+    def _index_remove(index, key, task_id):
+        ids = index[key]
+        ids.pop(bisect_right(ids, task_id) - 1)
+        if not ids:
+            del index[key]
+
+    def _store(self, record):
+        self._tasks[record.id] = record
+        self._index_add(self._by_name, record.name, record.id)
+        self._index_add(self._by_status, record.status, record.id)
+
+    def _replace(self, old, new):
+        self._tasks[new.id] = new
+        if new.name != old.name:
+            self._index_remove(self._by_name, old.name, old.id)
+            self._index_add(self._by_name, new.name, new.id)
+        if new.status != old.status:
+            self._index_remove(self._by_status, old.status, old.id)
+            self._index_add(self._by_status, new.status, new.id)
+
+    def _remove(self, record):
+        del self._tasks[record.id]
+        self._ids.pop(bisect_right(self._ids, record.id) - 1)
+        self._index_remove(self._by_name, record.name, record.id)
+        self._index_remove(self._by_status, record.status, record.id)
+
+    def _next_version(self):
+        self._version += 1
+        return self._version, datetime.now(timezone.utc)
+
+    def _insert(self, name, content, status, version):
+        record = task(self._next_id, name, content, status, *version)
+        self._next_id += 1
+        self._ids.append(record.id)
+        self._store(record)
+        return record
+
+    def _ordered_ids(self, status=None, name=None):
+        """IDs matching the filters, in ID order (a live index list if only one filter is set)."""
+        if status is not None:
+            if status not in STATUS_VALUES:
+                raise ValueError(f"Unknown status filter: {status}")
+            ids = self._by_status.get(STATUS_VALUES[status], [])
+            if name is not None:
+                ids = [task_id for task_id in ids if self._tasks[task_id].name == name]
+            return ids
+        if name is not None:
+            return self._by_name.get(name, [])
+        return self._ids
+
+    def _selected(self, selection):
+        """Records chosen by a bulk selection, in ID order."""
+        if isinstance(selection, TaskFilter):
+            if selection.status is None and selection.name is None:
+                raise ValueError("Filter must set status or name")
+            return [self._tasks[task_id] for task_id in self._ordered_ids(selection.status, selection.name)]
+        if not selection:
+            raise ValueError("No task IDs given")
+        return [self._tasks[task_id] for task_id in sorted(set(selection)) if task_id in self._tasks]
+
+    # ----- reads -----
+
+    def get(self, session, task_id):
+        return self._tasks.get(task_id)
+
+    def find_by_name(self, session, name):
+        with self._lock:
+            return [self._tasks[task_id] for task_id in self._by_name.get(name, ())]
+
+    def list_page(self, session, status=None, name=None, limit=None, after=None, fields=None):
+        after_id = cursor_position(after)
+        with self._lock:
+            ids = self._ordered_ids(status, name)
+            start = 0 if after_id is None else bisect_right(ids, after_id)
+            end = None if limit is None else start + limit + 1
+            return _project([self._tasks[task_id] for task_id in ids[start:end]], fields)
+
+    def search(self, session, query, limit, after=None, fields=None):
+        if not query or not query.strip():
+            raise ValueError("Search query must not be empty")
+        offset = cursor_position(after) or 0
+        terms = set(_words(query))
+        if not terms:
+            # No word characters: nothing to match, as with the FTS stores
+            return [], offset
+        matches = []
+        with self._lock:
+            records = list(self._tasks.values())
+        for record in records:
+            text = f"{record.name} {record.content}".lower()
+            # Cheap substring test first: most tasks contain none of the terms
+            if not all(term in text for term in terms):
+                continue
+            words = _words(text)
+            if terms.issubset(words):
+                matches.append((-sum(words.count(term) for term in terms), record.id, record))
+        matches.sort(key=lambda match: match[:2])
+        return _project([record for _, _, record in matches[offset:offset + limit + 1]], fields), offset
+
+    def stats(self, session):
+        with self._lock:
+            return [(status, len(ids)) for status, ids in self._by_status.items()]
+
+    def count(self, session, status=None, name=None):
+        with self._lock:
+            return len(self._ordered_ids(status, name))
+
+    def version(self, session):
+        return self._version
+
+    def export(self, session, status=None, chunk_size=1000):
+        with self._lock:
+            ids = list(self._ordered_ids(status))
+        for start in range(0, len(ids), chunk_size):
+            chunk = [self._tasks.get(task_id) for task_id in ids[start:start + chunk_size]]
+            yield [record for record in chunk if record is not None]
+
+    def changes(self, session, since, limit=None, upto=None):
+        upto = self._version if upto is None else upto
+        with self._lock:
+            records = sorted((record for record in self._tasks.values() if since < record.row_version <= upto),
+                             key=lambda record: (record.row_version, record.id))
+            # Tombstones are appended in version order
+            start = bisect_right(self._tombstones, since, key=lambda tombstone: tombstone.row_version)
+            tombstones = [tombstone for tombstone in self._tombstones[start:] if tombstone.row_version <= upto]
+        return records[:limit], tombstones[:limit]
+
+    # ----- writes -----
+
+    def insert(self, session, name, content):
+        with self._lock:
+            return self._insert(name, content, STATUS_VALUES["todo"], self._next_version())
+
+    def insert_many(self, session, rows):
+        with self._lock:
+            version = self._next_version()
+            return [self._insert(row["name"], row["content"], row["status"], version) for row in rows]
+
+    def update(self, session, task_id, values):
+        with self._lock:
+            old = self._tasks.get(task_id)
+            if old is None:
+                return None
+            if not values:
+                return old, old
+            new = task(old.id, values.get("name", old.name), values.get("content", old.content), old.status,
+                       *self._next_version())
+            self._replace(old, new)
+            return new, old
+
+    def set_status(self, session, task_id, from_status, to_status):
+        with self._lock:
+            old = self._tasks.get(task_id)
+            if old is None:
+                return None, False
+            if old.status != from_status:
+                return None, True
+            new = task(old.id, old.name, old.content, to_status, *self._next_version())
+            self._replace(old, new)
+            return new, True
+
+    def delete(self, session, task_id):
+        with self._lock:
+            record = self._tasks.get(task_id)
+            if record is not None:
+                self._remove(record)
+                self._tombstones.append(Tombstone(task_id, self._next_version()[0]))
+            return record
+
+    def set_status_many(self, session, selection, from_status, to_status):
+        with self._lock:
+            changed = []
+            version = None
+            for old in self._selected(selection):
+                if old.status == from_status:
+                    version = version or self._next_version()
+                    new = task(old.id, old.name, old.content, to_status, *version)
+                    self._replace(old, new)
+                    changed.append(new)
+            return changed
+
+    def delete_many(self, session, selection):
+        with self._lock:
+            records = self._selected(selection)
+            if records:
+                version = self._next_version()[0]
+                for record in records:
+                    self._remove(record)
+                    self._tombstones.append(Tombstone(record.id, version))
+            return records
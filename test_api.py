@@ -0,0 +1,99 @@
+"""
+API route tests on an SQLite database, through httpx's ASGI transport.
+
+The app's session dependency and manager are swapped for ones on a fresh
+database, with the read cache off and on. Writes are made the way the CLI
+makes them (a sync Manager on its own engine), so the API process is not
+told about them and only the change version reveals them.
+
+Run with: python -m pytest -q
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+import main
+from async_logic import AsyncManager
+from cache import CachedAsyncManager, TaskCache
+from config import DatabaseSettings
+from database import build_async_engine, build_engine, create_db_and_tables, get_async_session
+from logic import Manager, SQLiteTaskStore
+
+
+@pytest.fixture(params=["uncached", "cached"])
+def api(request, tmp_path, monkeypatch):
+    """Run a test coroutine with (httpx.AsyncClient, CLI Manager, CLI Session) on a fresh database."""
+    settings = DatabaseSettings(url=f"sqlite:///{tmp_path / 'tasks.db'}")
+    engine = build_engine(settings)
+    create_db_and_tables(engine)
+    manager = CachedAsyncManager(TaskCache()) if request.param == "cached" else AsyncManager()
+    monkeypatch.setattr(main, "manager", manager)
+
+    def runner(test):
+        async def run():
+            async_engine = build_async_engine(settings)
+
+            async def session_override():
+                async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                    yield session
+
+            main.app.dependency_overrides[get_async_session] = session_override
+            try:
+                transport = httpx.ASGITransport(app=main.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                    with Session(engine, expire_on_commit=False) as session:
+                        await test(client, Manager(SQLiteTaskStore()), session)
+            finally:
+                main.app.dependency_overrides.pop(get_async_session, None)
+                await async_engine.dispose()
+        asyncio.run(run())
+    yield runner
+    engine.dispose()
+
+
+def test_list_etag_follows_writes_from_other_processes(api):
+    async def test(client, cli, session):
+        cli.add_task("Groceries", "Milk and bread", session)
+        first = await client.get("/tasks/")
+        assert first.status_code == 200
+        etag = first.headers["etag"]
+        assert [t["name"] for t in first.json()["data"]] == ["Groceries"]
+        assert (await client.get("/tasks/", headers={"If-None-Match": etag})).status_code == 304
+
+        cli.add_task("Laundry", "Whites only", session)
+        changed = await client.get("/tasks/", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert [t["name"] for t in changed.json()["data"]] == ["Groceries", "Laundry"]
+        unchanged = await client.get("/tasks/", headers={"If-None-Match": changed.headers["etag"]})
+        assert unchanged.status_code == 304
+        assert unchanged.headers["etag"] == changed.headers["etag"]
+
+        # Unchanged data is served from the cache, at the version of its ETag
+        again = await client.get("/tasks/")
+        assert (again.headers["etag"], again.json()) == (changed.headers["etag"], changed.json())
+        if isinstance(main.manager, CachedAsyncManager):
+            assert main.manager.cache.stats()["lists"]["hits"] == 1
+    api(test)
+
+
+def test_task_and_stats_etags_follow_writes_from_other_processes(api):
+    async def test(client, cli, session):
+        task_id = cli.add_task("Groceries", "Milk and bread", session).data.id
+        task = await client.get(f"/tasks/{task_id}")
+        stats = await client.get("/tasks/stats")
+        assert task.json()["data"]["status"] == "Todo"
+        assert stats.json()["completed"] == 0
+
+        cli.mark_completed(task_id, session)
+        task = await client.get(f"/tasks/{task_id}", headers={"If-None-Match": task.headers["etag"]})
+        stats = await client.get("/tasks/stats", headers={"If-None-Match": stats.headers["etag"]})
+        assert task.status_code == 200 and task.json()["data"]["status"] == "Completed"
+        assert stats.status_code == 200 and stats.json()["completed"] == 1
+        again = await client.get(f"/tasks/{task_id}", headers={"If-None-Match": task.headers["etag"]})
+        assert again.status_code == 304
+    api(test)
@@ -11,6 +11,7 @@ Tests all major functionality:
 """
 
 from logic import Manager
+from storage import MemoryTaskStore
 from validators import name_check, content_check, validate_id
 
 
@@ -57,29 +58,29 @@ def test_manager():
     print("TESTING MANAGER CLASS")
     print("=" * 60)
     
-    manager = Manager()
+    manager = Manager(MemoryTaskStore())
     
     # Test 1: Add tasks
     print("\n1. Creating Tasks:")
-    task1 = manager.add_task("Buy groceries", "Need to buy milk, bread, and eggs")
+    task1 = manager.add_task("Buy groceries", "Need to buy milk, bread, and eggs", None)
     print(f"   Task 1: {task1.success} - {task1.message}")
     print(f"   Created task ID: {task1.data.id if task1.data else 'N/A'}")
     
-    task2 = manager.add_task("Complete project", "Finish the Python refactoring project")
+    task2 = manager.add_task("Complete project", "Finish the Python refactoring project", None)
     print(f"   Task 2: {task2.success} - {task2.message}")
     print(f"   Created task ID: {task2.data.id if task2.data else 'N/A'}")
     
-    task3 = manager.add_task("Exercise", "30 minutes workout")
+    task3 = manager.add_task("Exercise", "30 minutes workout", None)
     print(f"   Task 3: {task3.success} - {task3.message}")
     print(f"   Created task ID: {task3.data.id if task3.data else 'N/A'}")
     
     # Test invalid task creation
-    invalid_task = manager.add_task("", "Empty name")
+    invalid_task = manager.add_task("", "Empty name", None)
     print(f"   Invalid task (empty name): {invalid_task.success} - {invalid_task.message}")
     
     # Test 2: Get all tasks
     print("\n2. Getting All Tasks:")
-    all_tasks = manager.get_all_tasks()
+    all_tasks = manager.get_all_tasks(None)
     print(f"   {all_tasks.message}")
     print(f"   Total tasks: {len(all_tasks.data)}")
     for t in all_tasks.data:
@@ -87,32 +88,32 @@ def test_manager():
     
     # Test 3: Search by ID
     print("\n3. Searching Tasks:")
-    search_id = manager.search_by_id(1)
+    search_id = manager.search_by_id(1, None)
     print(f"   Search by ID (1): {search_id.name if search_id else 'Not found'}")
     
-    search_name = manager.search_by_name("Exercise")
+    search_name = manager.search_by_name("Exercise", None)
     print(f"   Search by name ('Exercise'): Found {len(search_name)} task(s)")
     
     # Test 4: Mark task as completed
     print("\n4. Marking Task as Completed:")
-    mark_completed = manager.mark_completed(1)
+    mark_completed = manager.mark_completed(1, None)
     print(f"   {mark_completed.message}")
     print(f"   Task status: {mark_completed.data.status if mark_completed.data else 'N/A'}")
     
     # Try marking already completed task
-    already_completed = manager.mark_completed(1)
+    already_completed = manager.mark_completed(1, None)
     print(f"   Try marking again: {already_completed.success} - {already_completed.message}")
     
     # Test 5: Mark task as todo
     print("\n5. Marking Task as To-Do:")
-    mark_todo = manager.mark_todo(1)
+    mark_todo = manager.mark_todo(1, None)
     print(f"   {mark_todo.message}")
     print(f"   Task status: {mark_todo.data.status if mark_todo.data else 'N/A'}")
     
     # Test 6: Get completed tasks
     print("\n6. Getting Completed Tasks:")
-    manager.mark_completed(2)
-    completed = manager.get_completed_tasks()
+    manager.mark_completed(2, None)
+    completed = manager.get_completed_tasks(None)
     print(f"   {completed.message}")
     print(f"   Total completed: {len(completed.data)}")
     for t in completed.data:
@@ -120,7 +121,7 @@ def test_manager():
     
     # Test 7: Get todo tasks
     print("\n7. Getting To-Do Tasks:")
-    todo = manager.get_todo_tasks()
+    todo = manager.get_todo_tasks(None)
     print(f"   {todo.message}")
     print(f"   Total to-do: {len(todo.data)}")
     for t in todo.data:
@@ -128,24 +129,24 @@ def test_manager():
     
     # Test 8: Update task
     print("\n8. Updating Task:")
-    update = manager.update_task(3, new_name="Gym session", new_content="1 hour workout")
+    update = manager.update_task(3, new_name="Gym session", new_content="1 hour workout", session=None)
     print(f"   {update.message}")
     print(f"   Updated task: {update.data.name if update.data else 'N/A'}")
     
     # Test invalid update
-    invalid_update = manager.update_task(999, new_name="Test")
+    invalid_update = manager.update_task(999, new_name="Test", session=None)
     print(f"   Update non-existent task: {invalid_update.success} - {invalid_update.message}")
     
     # Test 9: Delete task
     print("\n9. Deleting Task:")
-    delete = manager.delete_task(2)
+    delete = manager.delete_task(2, None)
     print(f"   {delete.message}")
     
-    remaining = manager.get_all_tasks()
+    remaining = manager.get_all_tasks(None)
     print(f"   Remaining tasks: {len(remaining.data)}")
     
     # Test invalid delete
-    invalid_delete = manager.delete_task(999)
+    invalid_delete = manager.delete_task(999, None)
     print(f"   Delete non-existent task: {invalid_delete.success} - {invalid_delete.message}")
 
 
@@ -155,14 +156,14 @@ def test_pydantic_models():
     print("TESTING PYDANTIC MODELS")
     print("=" * 60)
     
-    manager = Manager()
-    task = manager.add_task("Test JSON", "Testing Pydantic serialization")
+    manager = Manager(MemoryTaskStore())
+    task = manager.add_task("Test JSON", "Testing Pydantic serialization", None)
     
     print("\n1. OperationResponse JSON:")
     print(f"   {task.model_dump_json(indent=2)}")
     
     print("\n2. TaskListResponse JSON:")
-    all_tasks = manager.get_all_tasks()
+    all_tasks = manager.get_all_tasks(None)
     print(f"   {all_tasks.model_dump_json(indent=2)}")
 
 
@@ -0,0 +1,112 @@
+"""
+AsyncManager tests on an SQLite database through aiosqlite.
+
+AsyncManager runs the Manager flows (test_manager.py) on an AsyncSession;
+these tests check that every method reaches them and returns the same
+responses, with and without the group commit write queue.
+
+Run with: python -m pytest -q
+"""
+
+import asyncio
+
+import pytest
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from async_logic import AsyncManager
+from config import DatabaseSettings
+from database import build_async_engine, create_db_and_tables_async
+from group_commit import AsyncGroupCommitQueue
+from model import BulkTaskItem, TaskFilter
+
+
+@pytest.fixture(params=["direct", "write_queue"])
+def run(request, tmp_path):
+    """Run a test coroutine with (AsyncManager, AsyncSession) on a fresh database."""
+    def runner(test):
+        async def main():
+            engine = build_async_engine(DatabaseSettings(url=f"sqlite:///{tmp_path / 'tasks.db'}"))
+            await create_db_and_tables_async(engine)
+            write_queue = AsyncGroupCommitQueue(bind=engine) if request.param == "write_queue" else None
+            manager = AsyncManager(write_queue)
+            if write_queue is not None:
+                write_queue.start()
+            try:
+                async with AsyncSession(engine, expire_on_commit=False) as session:
+                    await test(manager, session)
+            finally:
+                await manager.close()
+                await engine.dispose()
+        asyncio.run(main())
+    return runner
+
+
+def test_crud(run):
+    async def test(manager, session):
+        events = []
+        manager.add_listener(events.append)
+        created = await manager.add_task("Exercise", "30 minutes", session)
+        assert created.success
+        task_id = created.data.id
+        assert not (await manager.add_task("", "Empty name", session)).success
+
+        assert (await manager.search_by_id(task_id, session)).name == "Exercise"
+        assert [t.id for t in await manager.search_by_name("Exercise", session)] == [task_id]
+
+        updated = await manager.update_task(task_id, new_name="Gym", session=session)
+        assert updated.success and updated.data.name == "Gym"
+        assert not (await manager.update_task(task_id + 100, new_name="Missing", session=session)).success
+
+        completed = await manager.mark_completed(task_id, session)
+        assert completed.success and completed.data.status == "Completed"
+        assert (await manager.mark_completed(task_id, session)).message == "Task is already completed"
+        assert (await manager.mark_todo(task_id + 100, session)).message == "Task not found"
+        assert (await manager.mark_todo(task_id, session)).data.status == "Todo"
+
+        assert (await manager.delete_task(task_id, session)).success
+        assert not (await manager.delete_task(task_id, session)).success
+        assert [event.kind for event in events] == ["created", "updated", "status_changed", "status_changed", "deleted"]
+    run(test)
+
+
+def test_lists_and_search(run):
+    async def test(manager, session):
+        for name in ["Quarterly report", "Groceries", "Report notes"]:
+            await manager.add_task(name, "Some description", session)
+        await manager.mark_completed(2, session)
+
+        page = await manager.get_all_tasks(session, limit=2, fields=["name"])
+        assert [t.name for t in page.data] == ["Quarterly report", "Groceries"]
+        rest = await manager.get_all_tasks(session, after=page.next_cursor)
+        assert [t.id for t in rest.data] == [3]
+        assert [t.id for t in (await manager.get_completed_tasks(session)).data] == [2]
+        assert [t.id for t in (await manager.get_todo_tasks(session)).data] == [1, 3]
+        assert [t.id for t in (await manager.get_tasks_by_name("Groceries", session)).data] == [2]
+
+        assert sorted(t.id for t in (await manager.search("report", session)).data) == [1, 3]
+        assert (await manager.search("!!!", session)).data == []
+
+        stats = await manager.get_stats(session)
+        assert (stats.total, stats.todo, stats.completed) == (3, 2, 1)
+        assert await manager.count_tasks(session, "todo") == 2
+
+        chunks = [chunk async for chunk in manager.export_tasks(session, "todo")]
+        assert b"".join(chunks).count(b"\n") == 2
+    run(test)
+
+
+def test_bulk_and_sync(run):
+    async def test(manager, session):
+        start = await manager.sync(session)
+        response = await manager.add_tasks([BulkTaskItem(name=f"bulk-{i}", content="x") for i in range(4)], session)
+        ids = [result.data.id for result in response.results]
+
+        assert (await manager.mark_many(ids[:2], "completed", session)).count == 2
+        assert (await manager.mark_many(TaskFilter(status="completed"), "todo", session)).count == 2
+        assert (await manager.delete_many(ids[:1], session)).ids == ids[:1]
+
+        changes = await manager.sync(session, start.version)
+        assert sorted(t.id for t in changes.changed) == ids[1:]
+        assert changes.deleted == ids[:1]
+        assert await manager.change_version(session) == changes.version
+    run(test)
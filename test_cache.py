@@ -0,0 +1,130 @@
+"""
+Read cache tests: LRUCache, TaskCache invalidation and CachedManager on a
+MemoryTaskStore.
+
+Run with: python -m pytest -q
+"""
+
+import asyncio
+
+import httpx
+
+import main
+from cache import CachedAsyncManager, CachedManager, LRUCache, TaskCache
+from logic import Manager
+from storage import MemoryTaskStore
+
+
+def cached_manager(*names):
+    """CachedManager on a MemoryTaskStore holding to-do tasks with the given names."""
+    manager = CachedManager(storage=MemoryTaskStore())
+    for name in names:
+        manager.add_task(name, "Some description", None)
+    return manager
+
+
+def test_write_drops_only_affected_entries():
+    manager = cached_manager("A", "B")
+    manager.get_all_tasks(None)
+    manager.get_todo_tasks(None)
+    manager.get_completed_tasks(None)
+    manager.get_tasks_by_name("A", None)
+    manager.get_tasks_by_name("B", None)
+    manager.count_tasks(None, status="completed")
+    manager.count_tasks(None, name="B")
+    manager.get_stats(None)
+    manager.search_by_id(1, None)
+    manager.search_by_id(2, None)
+    version = manager.change_version(None)
+
+    # Task 1 ("A") moves from todo to completed: only B's entries can stay
+    manager.mark_completed(1, None)
+    dropped = [("all", None, None, None), ("todo", None, None, None), ("completed", None, None, None),
+               (("name", "A"), None, None, None), ("completed", "count", "completed"), ("all", "stats")]
+    kept = [(("name", "B"), None, None, None), (("name", "B"), "count", None)]
+    assert [manager.cache.get_list(key, version) for key in dropped] == [None] * len(dropped)
+    assert all(manager.cache.get_list(key, version) is not None for key in kept)
+    assert manager.cache.get_task(1, version) is None
+    assert manager.cache.get_task(2, version).name == "B"
+
+    # Entries from before the write are not served at the new version
+    assert [t.id for t in manager.get_completed_tasks(None).data] == [1]
+    assert [t.id for t in manager.get_tasks_by_name("B", None).data] == [2]
+
+
+def test_fetch_racing_a_write_is_not_stored():
+    manager = cached_manager("A")
+
+    def racing_fetch():
+        response = Manager.get_all_tasks(manager, None)
+        manager.add_task("B", "Written while the page was read", None)
+        return response
+
+    stale = manager._cached_list(("all", None, None, None), None, racing_fetch)
+    assert [t.name for t in stale.data] == ["A"]
+    assert manager.cache.stats()["lists"]["size"] == 0
+    assert [t.name for t in manager.get_all_tasks(None).data] == ["A", "B"]
+
+
+def test_entries_of_another_version_are_misses():
+    cache = TaskCache()
+    cache.put_list(("all", "stats"), "v1 stats", cache.generation(), 1)
+    assert cache.get_list(("all", "stats"), 2) is None
+    # The mismatched entry is dropped
+    assert cache.get_list(("all", "stats"), 1) is None
+
+
+def test_ttl_expiry():
+    now = [0.0]
+    cache = LRUCache(10, ttl=5.0, clock=lambda: now[0])
+    cache.set("a", 1)
+    now[0] = 4.9
+    assert cache.get("a") == 1
+    now[0] = 5.0
+    assert cache.get("a", None) is None
+    assert (cache.expirations, len(cache)) == (1, 0)
+
+
+def test_lru_eviction():
+    cache = LRUCache(2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b", None) is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.evictions == 1
+
+
+def test_stats_counters():
+    manager = cached_manager("A")
+    manager.get_all_tasks(None)
+    manager.get_all_tasks(None)
+    manager.search_by_id(1, None)
+    manager.search_by_id(1, None)
+    manager.search_by_id(1, None)
+    stats = manager.cache.stats()
+    assert (stats["lists"]["hits"], stats["lists"]["misses"], stats["lists"]["size"]) == (1, 1, 1)
+    assert (stats["tasks"]["hits"], stats["tasks"]["misses"], stats["tasks"]["size"]) == (2, 1, 1)
+
+
+def test_stats_route(monkeypatch):
+    cache = TaskCache(max_tasks=5, max_lists=7)
+    cache.put_list(("all", "stats"), "stats", cache.generation(), 1)
+    cache.get_list(("all", "stats"), 1)
+    cache.get_task(1, 1)
+
+    async def get(path):
+        transport = httpx.ASGITransport(app=main.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return (await client.get(path)).json()
+
+    monkeypatch.setattr(main.cache_settings, "enabled", False)
+    assert asyncio.run(get("/internal/cache")) == {"enabled": False, "tasks": None, "lists": None}
+
+    monkeypatch.setattr(main.cache_settings, "enabled", True)
+    monkeypatch.setattr(main, "manager", CachedAsyncManager(cache))
+    stats = asyncio.run(get("/internal/cache"))
+    assert stats["enabled"]
+    assert stats["lists"] == {"size": 1, "max_entries": 7, "hits": 1, "misses": 0, "evictions": 0, "expirations": 0}
+    assert stats["tasks"] == {"size": 0, "max_entries": 5, "hits": 0, "misses": 1, "evictions": 0, "expirations": 0}
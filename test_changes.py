@@ -0,0 +1,104 @@
+"""
+Change feed tests: ChangeBroadcaster, Subscription and MemoryChangeRelay.
+
+Run with: python -m pytest -q
+"""
+
+import asyncio
+
+from changes import RESET, ChangeBroadcaster, MemoryChangeRelay, format_event
+from model import TaskEvent, TaskSchema
+
+
+def drain(subscription):
+    """Take every buffered (sequence, kind, data) item from a subscription."""
+    items = []
+    while not subscription.queue.empty():
+        items.append(subscription.queue.get_nowait())
+    return items
+
+
+def created(task_id):
+    """TaskEvent for a newly created task."""
+    return TaskEvent(kind="created", task_id=task_id,
+                     data=TaskSchema(id=task_id, name=f"Task {task_id}", content="Some description", status="Todo"))
+
+
+def test_overflow_becomes_one_reset():
+    broadcaster = ChangeBroadcaster(buffer_size=2)
+    subscription = broadcaster.subscribe()
+    for i in range(3):
+        broadcaster.publish("created", f'{{"n": {i}}}')
+    assert drain(subscription) == [(3, RESET, "{}")]
+    assert subscription.resets == 1
+
+    # Delivery resumes with the next event; staying behind still leaves one reset
+    broadcaster.publish("deleted", "{}")
+    assert drain(subscription) == [(4, "deleted", "{}")]
+    for i in range(6):
+        broadcaster.publish("created", f'{{"n": {i}}}')
+    assert [item[:2] for item in drain(subscription)] == [(9, RESET), (10, "created")]
+    broadcaster.unsubscribe(subscription)
+    assert broadcaster.resets == subscription.resets
+
+
+def test_resume_from_last_event_id():
+    broadcaster = ChangeBroadcaster()
+    for kind in ["created", "updated", "deleted"]:
+        broadcaster.publish(kind, "{}")
+    assert [item[:2] for item in drain(broadcaster.subscribe(broadcaster.event_id(1)))] == [(2, "updated"), (3, "deleted")]
+    assert drain(broadcaster.subscribe(broadcaster.event_id(3))) == []
+
+
+def test_reset_for_unknown_or_expired_event_id():
+    broadcaster = ChangeBroadcaster(history=2)
+    for _ in range(4):
+        broadcaster.publish("created", "{}")
+    # The history holds events 3 and 4: resuming after 2 is still complete
+    assert [item[0] for item in drain(broadcaster.subscribe(broadcaster.event_id(2)))] == [3, 4]
+    assert drain(broadcaster.subscribe(broadcaster.event_id(1))) == [(4, RESET, "{}")]
+    # IDs from another process, or from before a restart
+    assert drain(broadcaster.subscribe("1a2b3c-3")) == [(4, RESET, "{}")]
+    assert drain(broadcaster.subscribe(ChangeBroadcaster().event_id(3))) == [(4, RESET, "{}")]
+    assert drain(broadcaster.subscribe("garbage")) == [(4, RESET, "{}")]
+
+
+def test_stream_formats_events():
+    async def main():
+        broadcaster = ChangeBroadcaster()
+        event = created(1)
+        broadcaster(event)
+        stream = broadcaster.stream(broadcaster.event_id(0))
+        assert await anext(stream) == b": connected\n\n"
+        assert await anext(stream) == format_event(broadcaster.event_id(1), "created", event.model_dump_json())
+        assert broadcaster.subscribers == 1
+        await stream.aclose()
+        assert broadcaster.subscribers == 0
+    asyncio.run(main())
+
+
+def test_relay_skips_events_from_the_same_origin():
+    async def main():
+        bus = []
+        first = ChangeBroadcaster(relay=MemoryChangeRelay(bus))
+        second = ChangeBroadcaster(relay=MemoryChangeRelay(bus))
+        await first.start()
+        await second.start()
+        first_subscription = first.subscribe()
+        second_subscription = second.subscribe()
+
+        first(created(1))
+        second(created(2))
+        # Relayed events are delivered on the next loop iteration
+        await asyncio.sleep(0)
+        assert [item[2] for item in drain(first_subscription)] == [created(1).model_dump_json(),
+                                                                   created(2).model_dump_json()]
+        assert [item[2] for item in drain(second_subscription)] == [created(2).model_dump_json(),
+                                                                    created(1).model_dump_json()]
+
+        await first.close()
+        second(created(3))
+        await asyncio.sleep(0)
+        assert drain(first_subscription) == []
+        assert bus == [second.relay]
+    asyncio.run(main())
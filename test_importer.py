@@ -0,0 +1,114 @@
+"""
+Importer tests: CSV and JSONL files loaded into a fresh SQLite database.
+
+Run with: python -m pytest -q
+"""
+
+import json
+
+import pytest
+from sqlmodel import Session, select
+
+from config import DatabaseSettings
+from database import TaskDB, build_engine, create_db_and_tables
+from importer import ErrorFile, check_record, import_tasks, read_csv, read_jsonl
+from logic import Manager, SQLiteTaskStore
+
+
+@pytest.fixture
+def engine(tmp_path):
+    """Engine on a fresh SQLite database file."""
+    engine = build_engine(DatabaseSettings(url=f"sqlite:///{tmp_path / 'tasks.db'}"))
+    create_db_and_tables(engine)
+    yield engine
+    engine.dispose()
+
+
+def import_file(engine, path, reader, **kwargs):
+    """Import a file, returning (ImportResponse, rejected records as dicts)."""
+    errors = ErrorFile(str(path) + ".rejected.jsonl")
+    try:
+        with open(path, encoding="utf-8", newline="") as file:
+            response = import_tasks(reader(file), bind=engine, errors=errors, **kwargs)
+    finally:
+        errors.close()
+    if not errors.count:
+        return response, []
+    with open(errors.path, encoding="utf-8") as file:
+        return response, [json.loads(line) for line in file]
+
+
+def stored_tasks(engine):
+    """(name, content, status, row_version) of every task, by ID."""
+    with Session(engine) as session:
+        rows = session.exec(select(TaskDB).order_by(TaskDB.id)).all()
+        return [(t.name, t.content, t.status, t.row_version) for t in rows]
+
+
+def test_check_record():
+    assert check_record({"name": "Report", "content": "Write it", "status": "COMPLETED", "id": 7}) == \
+        (None, {"name": "Report", "content": "Write it", "status": "Completed"})
+    assert check_record({"name": "Report", "content": "Write it"})[1]["status"] == "Todo"
+    assert check_record(["Report", "Write it"])[0] == "Error: Record is not a JSON object."
+    assert check_record({"name": "Report"})[0] == "Error: Record needs text name and content fields."
+    assert check_record({"name": "", "content": "Write it"})[1] is None
+    assert check_record({"name": "Report", "content": "Write it", "status": "Done"})[0] == "Error: Unknown status 'Done'."
+
+
+def test_import_csv(engine, tmp_path):
+    path = tmp_path / "tasks.csv"
+    path.write_text('name,content,status\n'
+                    'Groceries,"Milk\nand bread",todo\n'
+                    ',Empty name,Todo\n'
+                    'Report,Write it,Done\n'
+                    'Laundry,Whites only,COMPLETED\n', encoding="utf-8")
+    response, rejected = import_file(engine, path, read_csv)
+
+    assert (response.imported, response.rejected) == (2, 2)
+    assert response.error_file == str(path) + ".rejected.jsonl"
+    # The quoted content spans lines 2-3, so the rejections are on lines 4 and 5
+    assert [record["line"] for record in rejected] == [4, 5]
+    assert rejected[1]["error"] == "Error: Unknown status 'Done'."
+    assert rejected[1]["record"] == {"name": "Report", "content": "Write it", "status": "Done"}
+    assert [task[:3] for task in stored_tasks(engine)] == [("Groceries", "Milk\nand bread", "Todo"),
+                                                          ("Laundry", "Whites only", "Completed")]
+
+
+def test_import_jsonl(engine, tmp_path):
+    path = tmp_path / "tasks.jsonl"
+    lines = [json.dumps({"id": 40, "name": "Groceries", "content": "Milk", "status": "Completed"}),
+             "",
+             "{not json",
+             json.dumps(["Report", "Write it"]),
+             json.dumps({"name": "Report"}),
+             json.dumps({"name": "Laundry", "content": "Whites only", "status": "todo"})]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    response, rejected = import_file(engine, path, read_jsonl)
+
+    assert (response.imported, response.rejected) == (2, 3)
+    assert [(record["line"], record["record"]) for record in rejected] == [
+        (3, "{not json"), (4, ["Report", "Write it"]), (5, {"name": "Report"})]
+    # Exported IDs are ignored
+    assert [task[:3] for task in stored_tasks(engine)] == [("Groceries", "Milk", "Completed"),
+                                                          ("Laundry", "Whites only", "Todo")]
+
+
+def test_chunks_commit_with_their_own_version(engine, tmp_path):
+    manager = Manager(SQLiteTaskStore())
+    with Session(engine) as session:
+        start = manager.change_version(session)
+
+    path = tmp_path / "tasks.jsonl"
+    records = [{"name": f"Task {i}", "content": "Imported"} for i in range(5)]
+    # The second chunk (records 2 and 3) is fully rejected and commits nothing
+    records[2]["status"] = records[3]["status"] = "Unknown"
+    path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+    response, rejected = import_file(engine, path, read_jsonl, chunk_size=2)
+
+    assert (response.imported, response.rejected) == (3, 2)
+    versions = [task[3] for task in stored_tasks(engine)]
+    assert versions == [start + 1, start + 1, start + 2]
+    with Session(engine) as session:
+        assert manager.change_version(session) == start + 2
+        changes = manager.sync(session, start)
+    assert sorted(task.name for task in changes.changed) == ["Task 0", "Task 1", "Task 4"]
@@ -0,0 +1,261 @@
+"""
+Manager tests against every task store.
+
+Each test runs twice: on a MemoryTaskStore, and on an SQLiteTaskStore
+backed by a fresh database file, so both stores are held to the same
+behaviour.
+
+Run with: python -m pytest -q
+"""
+
+import pytest
+from sqlmodel import Session
+
+from config import DatabaseSettings
+from database import build_engine, create_db_and_tables
+from logic import Manager, SQLiteTaskStore
+from model import BulkTaskItem, TaskFilter
+from storage import MemoryTaskStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def manager_session(request, tmp_path):
+    """(Manager, session) on the store named by the parameter."""
+    if request.param == "memory":
+        yield Manager(MemoryTaskStore()), None
+        return
+    engine = build_engine(DatabaseSettings(url=f"sqlite:///{tmp_path / 'tasks.db'}"))
+    create_db_and_tables(engine)
+    with Session(engine, expire_on_commit=False) as session:
+        yield Manager(SQLiteTaskStore()), session
+    engine.dispose()
+
+
+def add(manager, session, *names, content="Some description"):
+    """Create tasks and return their IDs."""
+    return [manager.add_task(name, content, session).data.id for name in names]
+
+
+def test_add_and_get(manager_session):
+    manager, session = manager_session
+    response = manager.add_task("Buy groceries", "Milk, bread and eggs", session)
+    assert response.success
+    assert response.data.name == "Buy groceries"
+    assert response.data.status == "Todo"
+
+    task = manager.search_by_id(response.data.id, session)
+    assert (task.name, task.content) == ("Buy groceries", "Milk, bread and eggs")
+    assert manager.search_by_id(response.data.id + 100, session) is None
+    assert [t.id for t in manager.search_by_name("Buy groceries", session)] == [response.data.id]
+
+
+def test_add_rejects_invalid_input(manager_session):
+    manager, session = manager_session
+    assert not manager.add_task("", "Empty name", session).success
+    assert not manager.add_task("x" * 51, "Name too long", session).success
+    assert not manager.add_task("Name", "x" * 501, session).success
+    assert manager.get_all_tasks(session).data == []
+
+
+def test_update(manager_session):
+    manager, session = manager_session
+    [task_id] = add(manager, session, "Exercise")
+
+    response = manager.update_task(task_id, new_name="Gym", new_content="One hour", session=session)
+    assert response.success
+    assert (response.data.name, response.data.content) == ("Gym", "One hour")
+    assert manager.search_by_id(task_id, session).name == "Gym"
+
+    assert not manager.update_task(task_id + 100, new_name="Missing", session=session).success
+    assert not manager.update_task(task_id, new_name="x" * 51, session=session).success
+
+
+def test_status_changes(manager_session):
+    manager, session = manager_session
+    [task_id] = add(manager, session, "Report")
+
+    response = manager.mark_completed(task_id, session)
+    assert response.success and response.data.status == "Completed"
+    assert not manager.mark_completed(task_id, session).success
+
+    response = manager.mark_todo(task_id, session)
+    assert response.success and response.data.status == "Todo"
+    assert not manager.mark_todo(task_id, session).success
+    assert not manager.mark_completed(task_id + 100, session).success
+
+
+def test_delete(manager_session):
+    manager, session = manager_session
+    first, second = add(manager, session, "First", "Second")
+
+    assert manager.delete_task(first, session).success
+    assert not manager.delete_task(first, session).success
+    assert [t.id for t in manager.get_all_tasks(session).data] == [second]
+
+
+def test_keyset_paging(manager_session):
+    manager, session = manager_session
+    ids = add(manager, session, *(f"task-{i}" for i in range(7)))
+
+    seen, cursor = [], None
+    while True:
+        page = manager.get_all_tasks(session, limit=3, after=cursor)
+        assert page.success and len(page.data) <= 3
+        seen += [t.id for t in page.data]
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+    assert seen == ids
+
+    assert not manager.get_all_tasks(session, limit=3, after="not a cursor").success
+
+
+def test_status_lists(manager_session):
+    manager, session = manager_session
+    ids = add(manager, session, "a", "b", "c", "d")
+    manager.mark_completed(ids[1], session)
+    manager.mark_completed(ids[3], session)
+
+    assert [t.id for t in manager.get_completed_tasks(session).data] == [ids[1], ids[3]]
+    todo = manager.get_todo_tasks(session, limit=1)
+    assert [t.id for t in todo.data] == [ids[0]]
+    assert [t.id for t in manager.get_todo_tasks(session, after=todo.next_cursor).data] == [ids[2]]
+    assert manager.count_tasks(session, "completed") == 2
+
+
+def test_tasks_by_name(manager_session):
+    manager, session = manager_session
+    ids = add(manager, session, "same", "other", "same")
+    assert [t.id for t in manager.get_tasks_by_name("same", session).data] == [ids[0], ids[2]]
+    assert manager.count_tasks(session, name="same") == 2
+
+
+def test_field_projection(manager_session):
+    manager, session = manager_session
+    add(manager, session, "a", "b", "c")
+
+    page = manager.get_all_tasks(session, limit=2, fields=["name"])
+    assert [item.model_dump() for item in page.data] == [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    assert [t.name for t in manager.get_all_tasks(session, after=page.next_cursor, fields=["name"]).data] == ["c"]
+    assert not manager.get_all_tasks(session, fields=["bogus"]).success
+    assert not manager.get_all_tasks(session, fields=[""]).success
+
+    # A single field selects one column
+    for response in (manager.get_all_tasks(session, fields=["id"]), manager.get_todo_tasks(session, fields=["id"]),
+                     manager.get_tasks_by_name("b", session, fields=["id"]),
+                     manager.search("b", session, fields=["id"])):
+        assert response.success
+        assert all(item.model_dump().keys() == {"id"} for item in response.data)
+    assert [t.id for t in manager.get_todo_tasks(session, fields=["id"]).data] == [1, 2, 3]
+
+
+def test_search(manager_session):
+    manager, session = manager_session
+    report, _, notes = add(manager, session, "Quarterly report", "Groceries", "Report notes",
+                           content="Write it up")
+    manager.update_task(notes, new_content="Notes about the report", session=session)
+
+    response = manager.search("report", session)
+    assert response.success
+    assert sorted(t.id for t in response.data) == sorted([report, notes])
+
+    assert manager.search("missing", session).data == []
+    assert manager.search("!!!", session).data == []
+    assert not manager.search("", session).success
+
+    first = manager.search("report", session, limit=1)
+    second = manager.search("report", session, limit=1, after=first.next_cursor)
+    assert {first.data[0].id, second.data[0].id} == {report, notes}
+
+
+def test_bulk_add(manager_session):
+    manager, session = manager_session
+    items = [BulkTaskItem(name="one", content="x"), BulkTaskItem(name="", content="x"),
+             BulkTaskItem(name="two", content="y")]
+    response = manager.add_tasks(items, session)
+    assert [result.success for result in response.results] == [True, False, True]
+    assert [t.name for t in manager.get_all_tasks(session).data] == ["one", "two"]
+
+
+def test_bulk_status_and_delete(manager_session):
+    manager, session = manager_session
+    ids = add(manager, session, "a", "b", "c", "d")
+
+    response = manager.mark_many(ids[:3], "completed", session)
+    assert response.success
+    assert manager.count_tasks(session, "completed") == 3
+    assert manager.mark_many(ids[:3], "completed", session).success
+
+    assert manager.mark_many(TaskFilter(status="completed"), "todo", session).success
+    assert manager.count_tasks(session, "completed") == 0
+
+    # Changes that match nothing do not take a version
+    version = manager.change_version(session)
+    assert manager.mark_many([999], "completed", session).skipped == [999]
+    assert manager.delete_many([999], session).skipped == [999]
+    assert manager.change_version(session) == version
+
+    assert manager.delete_many(ids[:2], session).success
+    assert [t.id for t in manager.get_all_tasks(session).data] == ids[2:]
+    assert not manager.delete_many(TaskFilter(), session).success
+
+
+def test_stats(manager_session):
+    manager, session = manager_session
+    ids = add(manager, session, "a", "b", "c")
+    manager.mark_completed(ids[0], session)
+
+    stats = manager.get_stats(session)
+    assert (stats.total, stats.todo, stats.completed) == (3, 2, 1)
+    assert manager.count_tasks(session) == 3
+
+
+def test_sync(manager_session):
+    manager, session = manager_session
+    start = manager.sync(session)
+    assert start.success and start.changed == [] and not start.has_more
+
+    first, second = add(manager, session, "a", "b")
+    response = manager.sync(session, start.version)
+    assert [t.id for t in response.changed] == [first, second]
+    assert response.version > start.version
+
+    manager.mark_completed(first, session)
+    manager.delete_task(second, session)
+    later = manager.sync(session, response.version)
+    assert [(t.id, t.status) for t in later.changed] == [(first, "Completed")]
+    assert later.deleted == [second]
+    assert manager.sync(session, later.version).changed == []
+    assert manager.change_version(session) == later.version
+
+    # A full sync does not report tasks that are already gone
+    assert [t.id for t in manager.sync(session).changed] == [first]
+
+
+def test_sync_pages_never_split_a_version(manager_session):
+    manager, session = manager_session
+    since = manager.sync(session).version
+    ids = add(manager, session, "a", "b")
+    manager.add_tasks([BulkTaskItem(name=f"bulk-{i}", content="x") for i in range(3)], session)
+
+    seen, pages = [], 0
+    while True:
+        page = manager.sync(session, since, limit=1)
+        seen += [t.id for t in page.changed]
+        since, pages = page.version, pages + 1
+        if not page.has_more:
+            break
+    assert seen[:2] == ids and len(seen) == 5
+    # One page per single create, one for the whole bulk insert (which shares a version)
+    assert pages <= 4
+
+
+def test_listeners_get_events(manager_session):
+    manager, session = manager_session
+    events = []
+    manager.add_listener(events.append)
+    [task_id] = add(manager, session, "a")
+    manager.mark_completed(task_id, session)
+    manager.delete_task(task_id, session)
+    assert [(event.kind, event.task_id) for event in events] == [
+        ("created", task_id), ("status_changed", task_id), ("deleted", task_id)]
@@ -6,10 +6,49 @@ This module provides validation functions for task inputs:
 - content_check: Validates task content/description length and format
 - validate_id: Validates and converts task ID to integer
 
-All functions return ValidationResponse Pydantic models.
+These return ValidationResponse Pydantic models. For hot paths (the CLI
+prompts, Manager checks) name_error and content_error apply the same
+rules without allocating: they return an error message or None.
+
+The length limits are declared in model.py, where TaskCreate and
+TaskUpdate enforce them when the API parses a request.
 """
 
-from model import ValidationResponse
+from model import ValidationResponse, NAME_MAX_LENGTH, CONTENT_MAX_LENGTH
+
+
+NAME_ERROR = f"Error: Task name must be between 1 and {NAME_MAX_LENGTH} characters."
+CONTENT_ERROR = f"Error: Description must be between 1 and {CONTENT_MAX_LENGTH} characters."
+
+
+def name_error(text):
+    """
+    Check a task name without building a response object.
+    
+    Args:
+        text (str): Task name to validate
+        
+    Returns:
+        Optional[str]: Error message, None if the name is valid
+    """
+    if not 1 <= len(text) <= NAME_MAX_LENGTH:
+        return NAME_ERROR
+    return None
+
+
+def content_error(text):
+    """
+    Check a task description without building a response object.
+    
+    Args:
+        text (str): Task content to validate
+        
+    Returns:
+        Optional[str]: Error message, None if the content is valid
+    """
+    if not 1 <= len(text) <= CONTENT_MAX_LENGTH:
+        return CONTENT_ERROR
+    return None
 
 
 def name_check(text):
@@ -26,8 +65,9 @@ def name_check(text):
     Returns:
         ValidationResponse: success=True if valid, False with error message otherwise
     """
-    if len(text) > 50 or len(text) < 1 or not text:
-        return ValidationResponse(success=False, message="Error: Task name must be between 1 and 50 characters.")
+    error = name_error(text)
+    if error:
+        return ValidationResponse(success=False, message=error)
     return ValidationResponse(success=True)
 
 
@@ -45,8 +85,9 @@ def content_check(text):
     Returns:
         ValidationResponse: success=True if valid, False with error message otherwise
     """
-    if len(text) > 500 or len(text) < 1 or not text:
-        return ValidationResponse(success=False, message="Error: Description must be between 1 and 500 characters.")
+    error = content_error(text)
+    if error:
+        return ValidationResponse(success=False, message=error)
     return ValidationResponse(success=True)
 
 